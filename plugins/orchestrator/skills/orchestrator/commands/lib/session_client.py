@@ -1,8 +1,11 @@
 """
 Session Client
 
-HTTP client for Agent Session Manager API.
-Replaces file-based session operations with API calls.
+HTTP client for Agent Session Manager API, used by the ao-* commands to
+inspect and delete sessions.
+
+Executor-side operations (bind, events, metadata) go through the Runner
+Gateway's own session client in servers/agent-runner/lib.
 
 Note: Uses session_id (coordinator-generated) per ADR-010.
 Sessions are created by the coordinator at run creation time.
@@ -28,6 +31,18 @@ class SessionClient:
     def __init__(self, base_url: str, timeout: float = 5.0):
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
+        # Reuse one connection for commands that loop over sessions
+        self._client = httpx.Client(base_url=self.base_url, timeout=self.timeout)
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        self._client.close()
+
+    def __enter__(self) -> "SessionClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def _request(
         self,
@@ -36,14 +51,8 @@ class SessionClient:
         json_data: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """Make HTTP request and handle errors."""
-        url = f"{self.base_url}{path}"
         try:
-            response = httpx.request(
-                method=method,
-                url=url,
-                json=json_data,
-                timeout=self.timeout
-            )
+            response = self._client.request(method, path, json=json_data)
             if response.status_code == 404:
                 raise SessionNotFoundError(f"Session not found: {path}")
             response.raise_for_status()
@@ -73,66 +82,6 @@ class SessionClient:
         result = self._request("GET", "/sessions")
         return result.get("sessions", [])
 
-    def add_event(self, session_id: str, event: Dict[str, Any]) -> None:
-        """Add event to session. Handles run_completed specially on server."""
-        # Ensure session_id is set in event
-        event_data = dict(event)
-        event_data["session_id"] = session_id
-        self._request("POST", f"/sessions/{session_id}/events", json_data=event_data)
-
-    def bind_session_executor(
-        self,
-        session_id: str,
-        executor_session_id: str,
-        hostname: str,
-        executor_type: str = "claude-code",
-    ) -> Dict[str, Any]:
-        """
-        Bind executor to session after Claude SDK starts (ADR-010).
-
-        Called by executor after getting the Claude SDK session ID.
-        Updates session with executor_session_id, hostname, executor_type
-        and sets status to 'running'.
-
-        Args:
-            session_id: Coordinator-generated session ID
-            executor_session_id: Claude SDK's session UUID
-            hostname: Machine hostname where executor runs
-            executor_type: Type of executor (default: "claude-code")
-
-        Returns:
-            Updated session data
-        """
-        data = {
-            "executor_session_id": executor_session_id,
-            "hostname": hostname,
-            "executor_type": executor_type,
-        }
-        result = self._request("POST", f"/sessions/{session_id}/bind", json_data=data)
-        return result.get("session", result)
-
-    def get_affinity(self, session_id: str) -> Dict[str, Any]:
-        """
-        Get session affinity data for resume routing.
-
-        Returns hostname, executor_type, project_dir for routing decisions.
-        """
-        result = self._request("GET", f"/sessions/{session_id}/affinity")
-        return result
-
-    def update_session(
-        self,
-        session_id: str,
-        last_resumed_at: Optional[str] = None
-    ) -> Dict[str, Any]:
-        """Update session metadata."""
-        data = {}
-        if last_resumed_at is not None:
-            data["last_resumed_at"] = last_resumed_at
-
-        result = self._request("PATCH", f"/sessions/{session_id}/metadata", json_data=data)
-        return result.get("session", result)
-
     def delete_session(self, session_id: str) -> bool:
         """Delete session and events. Returns True if deleted, False if not found."""
         try:
@@ -140,8 +89,3 @@ class SessionClient:
             return True
         except SessionNotFoundError:
             return False
-
-
-def get_client(base_url: str) -> SessionClient:
-    """Get a SessionClient instance."""
-    return SessionClient(base_url)
@@ -205,15 +205,15 @@ def update_session_metadata(
     conn.commit()
     conn.close()
 
-def insert_event(event):
-    """Insert event"""
-    conn = sqlite3.connect(DB_PATH)
-    conn.execute("PRAGMA foreign_keys = ON")
-    conn.execute("""
-        INSERT INTO events
-        (session_id, event_type, timestamp, tool_name, tool_input, tool_output, error, exit_code, reason, role, content, result_text, result_data)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """, (
+_INSERT_EVENT_SQL = """
+    INSERT INTO events
+    (session_id, event_type, timestamp, tool_name, tool_input, tool_output, error, exit_code, reason, role, content, result_text, result_data)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+def _event_row(event) -> tuple:
+    """Column values for inserting an event"""
+    return (
         event.session_id,
         event.event_type,
         event.timestamp,
@@ -227,7 +227,21 @@ def insert_event(event):
         json.dumps(event.content) if event.content else None,
         event.result_text,
         json.dumps(event.result_data) if event.result_data else None
-    ))
+    )
+
+def insert_event(event):
+    """Insert event"""
+    conn = sqlite3.connect(DB_PATH)
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.execute(_INSERT_EVENT_SQL, _event_row(event))
+    conn.commit()
+    conn.close()
+
+def insert_events(events):
+    """Insert several events in order, in a single transaction"""
+    conn = sqlite3.connect(DB_PATH)
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.executemany(_INSERT_EVENT_SQL, [_event_row(event) for event in events])
     conn.commit()
     conn.close()
 
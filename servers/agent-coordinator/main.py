@@ -16,7 +16,7 @@ from io import BytesIO
 from pathlib import Path
 
 from database import (
-    init_db, insert_event, get_sessions, get_events,
+    init_db, insert_event, insert_events, get_sessions, get_events,
     update_session_status, update_session_metadata, delete_session,
     create_session, get_session_by_id, get_session_result,
     update_session_parent, bind_session_executor, get_session_affinity,
@@ -26,7 +26,7 @@ from database import (
 )
 from auth import validate_startup_config, verify_api_key, AUTH_ENABLED, AuthConfigError
 from models import (
-    Event, SessionMetadataUpdate, SessionCreate, SessionBind,
+    Event, EventBatch, SessionMetadataUpdate, SessionCreate, SessionBind,
     Agent, AgentCreate, AgentUpdate, AgentStatusUpdate,
     ExecutionMode, StreamEventType, SessionEventType, SessionResult,
     Capability, CapabilityCreate, CapabilityUpdate, CapabilitySummary, CapabilityType,
@@ -717,6 +717,28 @@ async def add_session_event(session_id: str, event: Event):
     return {"ok": True}
 
 
+@app.post("/sessions/{session_id}/events/batch", tags=["Sessions"], response_model=OkResponse, status_code=201)
+async def add_session_events(session_id: str, batch: EventBatch):
+    """Add several events to a session in one request.
+
+    Events are stored in order in a single transaction and then broadcast to
+    SSE clients one by one, exactly as if posted individually.
+    """
+    session = get_session_by_id(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    if any(event.session_id != session_id for event in batch.events):
+        raise HTTPException(status_code=400, detail="Event session_id must match URL session_id")
+
+    insert_events(batch.events)
+
+    for event in batch.events:
+        await sse_manager.broadcast(StreamEventType.EVENT, {"data": event.model_dump()}, session_id=session_id)
+
+    return {"ok": True}
+
+
 @app.patch("/sessions/{session_id}/metadata", tags=["Sessions"])
 async def update_metadata(session_id: str, metadata: SessionMetadataUpdate):
     """Update session metadata (project_dir, agent_name, executor fields)."""
@@ -1296,15 +1318,21 @@ def delete_script(name: str):
 
 
 @app.get("/scripts/{name}/download", tags=["Scripts"])
-def download_script(name: str):
+def download_script(name: str, if_none_match: Optional[str] = Header(None)):
     """Download script folder as tar.gz for runner sync.
 
     Returns the entire script directory (script.json + script file) as a tarball.
+    The response carries a content ETag; runners send it back in If-None-Match
+    and get `304 Not Modified` (no tarball) when their copy is current.
     """
     script = script_storage.get_script(name)
     if not script:
         raise HTTPException(status_code=404, detail=f"Script not found: {name}")
 
+    etag = script_storage.compute_script_etag(name)
+    if etag and if_none_match == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+
     script_dir = script_storage.get_scripts_dir() / name
 
     # Create tar.gz in memory
@@ -1317,7 +1345,8 @@ def download_script(name: str):
         buffer,
         media_type="application/gzip",
         headers={
-            "Content-Disposition": f'attachment; filename="{name}.tar.gz"'
+            "Content-Disposition": f'attachment; filename="{name}.tar.gz"',
+            **({"ETag": etag} if etag else {}),
         }
     )
 
@@ -1533,15 +1562,25 @@ async def register_runner(request: RunnerRegisterRequest):
 
 
 @app.get("/runner/runs", tags=["Runners"])
-async def poll_for_runs(runner_id: str = Query(..., description="The registered runner ID")):
+async def poll_for_runs(
+    runner_id: str = Query(..., description="The registered runner ID"),
+    started: list[str] = Query(
+        [], description="Run IDs the runner started since its previous poll"
+    ),
+):
     """Long-poll for available runs or stop commands.
 
     Holds connection open for up to 30 seconds, returning immediately if
     a run or stop command is available.
 
+    Runs listed in `started` are marked started exactly as by
+    `POST /runner/runs/{run_id}/started`; the runner piggybacks these on
+    the poll it issues right after starting a run, saving a round trip.
+
     **Responses:**
     - `{"run": {...}}` - Run to execute
-    - `{"stop_sessions": [...]}` - Session IDs to stop
+    - `{"stop_sessions": [...], "sync_scripts": [...], "remove_scripts": [...]}` -
+      Pending commands, batched; each key is present only if it has commands
     - `{"deregistered": true}` - Runner was deregistered
     - `204 No Content` - Nothing available after timeout
 
@@ -1565,6 +1604,11 @@ async def poll_for_runs(runner_id: str = Query(..., description="The registered
     if not runner:
         raise HTTPException(status_code=401, detail="Runner not registered")
 
+    # Run-started reports piggybacked on this poll
+    for run_id in started:
+        if not await _mark_run_started(run_id, runner_id) and DEBUG:
+            print(f"[DEBUG] Runner {runner_id} reported unknown run {run_id} as started", flush=True)
+
     # Get the event for this runner (for immediate wake-up on stop commands)
     event = stop_command_queue.get_event(runner_id)
 
@@ -1573,14 +1617,16 @@ async def poll_for_runs(runner_id: str = Query(..., description="The registered
     elapsed = 0.0
 
     while elapsed < RUNNER_POLL_TIMEOUT:
-        # Check for stop commands FIRST (highest priority)
+        # Pending commands take priority over runs and are delivered together in
+        # one envelope (runner applies stops first, then script sync/remove)
+        commands: dict = {}
+
         stop_sessions = stop_command_queue.get_and_clear(runner_id)
         if stop_sessions:
             if DEBUG:
                 print(f"[DEBUG] Runner {runner_id} received stop commands for sessions: {stop_sessions}", flush=True)
-            return {"stop_sessions": stop_sessions}
+            commands["stop_sessions"] = stop_sessions
 
-        # Check for script sync commands (second priority)
         sync_scripts, remove_scripts = script_sync_queue.get_and_clear(runner_id)
         if sync_scripts or remove_scripts:
             if DEBUG:
@@ -1588,7 +1634,11 @@ async def poll_for_runs(runner_id: str = Query(..., description="The registered
                     print(f"[DEBUG] Runner {runner_id} received sync commands for scripts: {sync_scripts}", flush=True)
                 if remove_scripts:
                     print(f"[DEBUG] Runner {runner_id} received remove commands for scripts: {remove_scripts}", flush=True)
-            return {"sync_scripts": sync_scripts, "remove_scripts": remove_scripts}
+            commands["sync_scripts"] = sync_scripts
+            commands["remove_scripts"] = remove_scripts
+
+        if commands:
+            return commands
 
         # Check for deregistration during polling
         if runner_registry.is_deregistered(runner_id):
@@ -1661,15 +1711,33 @@ async def report_run_started(run_id: str, request: RunnerIdRequest):
     - Links parent session for hierarchy tracking
     - Inserts run_start event for audit trail
     - Broadcasts to SSE clients
+
+    Runners may instead piggyback started runs on their next poll
+    (`GET /runner/runs?started=...`), which has the same effect.
     """
     # Verify runner
     if not runner_registry.get_runner(request.runner_id):
         raise HTTPException(status_code=401, detail="Runner not registered")
 
+    if not await _mark_run_started(run_id, request.runner_id):
+        raise HTTPException(status_code=404, detail="Run not found")
+
+    return {"ok": True}
+
+
+async def _mark_run_started(run_id: str, runner_id: str) -> bool:
+    """Apply a runner's run-started report. Returns False if the run is unknown."""
     # Get run first to access parent_session_id
     run = run_queue.get_run(run_id)
     if not run:
-        raise HTTPException(status_code=404, detail="Run not found")
+        return False
+
+    # A start piggybacked on a later poll can arrive after the run already
+    # finished (or a stop was requested) - don't move it back to running
+    if run.status in (RunStatus.STOPPING, RunStatus.COMPLETED, RunStatus.FAILED, RunStatus.STOPPED):
+        if DEBUG:
+            print(f"[DEBUG] Ignoring late start report for run {run_id} ({run.status.value})", flush=True)
+        return True
 
     # Update run status to running
     run = run_queue.update_run_status(run_id, RunStatus.RUNNING)
@@ -1709,9 +1777,9 @@ async def report_run_started(run_id: str, request: RunnerIdRequest):
             print(f"[DEBUG] Inserted run_start event for session '{session_id}'", flush=True)
 
     if DEBUG:
-        print(f"[DEBUG] Run {run_id} started by runner {request.runner_id}", flush=True)
+        print(f"[DEBUG] Run {run_id} started by runner {runner_id}", flush=True)
 
-    return {"ok": True}
+    return True
 
 
 @app.post("/runner/runs/{run_id}/completed", tags=["Runners"], response_model=OkResponse)
@@ -420,6 +420,11 @@ class Event(BaseModel):
     result_data: Optional[dict] = None  # Validated JSON (procedural agents or autonomous with output_schema)
 
 
+class EventBatch(BaseModel):
+    """Ordered events for one session, inserted together."""
+    events: List[Event]
+
+
 class SessionResult(BaseModel):
     """Structured result from a session.
 
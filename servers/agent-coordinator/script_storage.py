@@ -7,6 +7,7 @@ Scripts are stored as directories with the following structure:
         {script_file}       # The actual script file (e.g., send-notification.py)
 """
 
+import hashlib
 import json
 import os
 from datetime import datetime
@@ -274,6 +275,28 @@ def update_script(name: str, updates: ScriptUpdate) -> Optional[Script]:
     return get_script(name)
 
 
+def compute_script_etag(name: str) -> Optional[str]:
+    """
+    Compute a content ETag for a script directory.
+
+    Hashes relative paths and contents of all files, so the value only changes
+    when the script itself changes (unlike the tar.gz, whose gzip header embeds
+    a timestamp). Returns None if the script does not exist.
+    """
+    script_dir = get_scripts_dir() / name
+    if not script_dir.is_dir():
+        return None
+
+    digest = hashlib.sha256()
+    for path in sorted(p for p in script_dir.rglob("*") if p.is_file()):
+        rel = path.relative_to(script_dir).as_posix().encode("utf-8")
+        data = path.read_bytes()
+        # Length-prefix each part so different layouts cannot collide
+        digest.update(len(rel).to_bytes(8, "big") + rel)
+        digest.update(len(data).to_bytes(8, "big") + data)
+    return f'"{digest.hexdigest()}"'
+
+
 def delete_script(name: str) -> bool:
     """Delete a script. Returns True if deleted, False if not found."""
     import shutil
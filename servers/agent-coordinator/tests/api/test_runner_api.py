@@ -93,6 +93,28 @@ class TestRunnerAPI:
         assert run_data["session_id"] == session_id
         assert run_data["status"] == "claimed"
 
+    def test_runner_poll_batches_commands(self, coordinator_client):
+        """Pending stop and script commands are returned together in one poll."""
+        import main as coordinator_main
+
+        # Script sync is only registered for procedural runners
+        reg_resp = _register_runner(coordinator_client, executor_type="procedural")
+        runner_id = reg_resp.json()["runner_id"]
+
+        coordinator_main.stop_command_queue.add_stop(runner_id, "ses_stop")
+        coordinator_main.script_sync_queue.add_sync(runner_id, "script-a")
+        coordinator_main.script_sync_queue.add_remove(runner_id, "script-b")
+
+        poll_resp = coordinator_client.get(
+            "/runner/runs", params={"runner_id": runner_id}
+        )
+        assert poll_resp.status_code == 200
+        data = poll_resp.json()
+        assert data["stop_sessions"] == ["ses_stop"]
+        assert data["sync_scripts"] == ["script-a"]
+        assert data["remove_scripts"] == ["script-b"]
+        assert "run" not in data
+
     def test_runner_report_started(self, coordinator_client):
         """POST /runner/runs/{id}/started → 200 ok."""
         _create_run(coordinator_client)
@@ -111,6 +133,55 @@ class TestRunnerAPI:
         assert started_resp.status_code == 200
         assert started_resp.json() == {"ok": True}
 
+    def test_runner_poll_piggybacks_started(self, coordinator_client):
+        """GET /runner/runs?started=... marks those runs running before polling."""
+        _create_run(coordinator_client)
+        reg_resp = _register_runner(coordinator_client)
+        runner_id = reg_resp.json()["runner_id"]
+
+        poll_resp = coordinator_client.get(
+            "/runner/runs", params={"runner_id": runner_id}
+        )
+        run_id = poll_resp.json()["run"]["run_id"]
+
+        # Next poll reports the start and claims the next run in one request
+        _create_run(coordinator_client, prompt="Second")
+        poll_resp = coordinator_client.get(
+            "/runner/runs", params={"runner_id": runner_id, "started": [run_id]}
+        )
+        assert poll_resp.json()["run"]["run_id"] != run_id
+
+        run_resp = coordinator_client.get(f"/runs/{run_id}")
+        assert run_resp.json()["status"] == "running"
+
+    def test_late_started_report_does_not_reopen_finished_run(self, coordinator_client):
+        """A start piggybacked after the completion report leaves the run finished."""
+        session_id, _ = _create_run(coordinator_client)
+        reg_resp = _register_runner(coordinator_client)
+        runner_id = reg_resp.json()["runner_id"]
+
+        poll_resp = coordinator_client.get(
+            "/runner/runs", params={"runner_id": runner_id}
+        )
+        run_id = poll_resp.json()["run"]["run_id"]
+
+        # Supervisor reports completion before the next poll carries the start
+        coordinator_client.post(
+            f"/runner/runs/{run_id}/completed",
+            json={"runner_id": runner_id},
+        )
+        events_before = coordinator_client.get(f"/sessions/{session_id}/events").json()["events"]
+
+        coordinator_client.get(
+            "/runner/runs", params={"runner_id": runner_id, "started": [run_id]}
+        )
+
+        assert coordinator_client.get(f"/runs/{run_id}").json()["status"] == "completed"
+        session = coordinator_client.get(f"/sessions/{session_id}").json()["session"]
+        assert session["status"] == "finished"
+        events_after = coordinator_client.get(f"/sessions/{session_id}/events").json()["events"]
+        assert len(events_after) == len(events_before)
+
     def test_runner_report_completed_finishes_session(self, coordinator_client):
         """Full lifecycle: create → poll → start → complete → session finished."""
         session_id, _ = _create_run(coordinator_client)
@@ -0,0 +1,77 @@
+"""API tests for script download used by runner sync.
+
+Tests the tarball download endpoint and its ETag / If-None-Match handling
+via GET /scripts/{name}/download.
+"""
+import io
+import sys
+import tarfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+def _create_script(client, name="my-script", content="echo hi"):
+    """Helper to create a script via the API."""
+    resp = client.post("/scripts", json={
+        "name": name,
+        "description": "Test script",
+        "script_file": "run.sh",
+        "script_content": content,
+    })
+    assert resp.status_code == 201
+    return resp.json()
+
+
+class TestScriptDownload:
+    """Tests for script tarball download."""
+
+    def test_download_returns_tarball_with_etag(self, coordinator_client):
+        """GET /scripts/{name}/download → tar.gz with name/ prefix and an ETag."""
+        _create_script(coordinator_client)
+
+        resp = coordinator_client.get("/scripts/my-script/download")
+        assert resp.status_code == 200
+        assert resp.headers["etag"]
+
+        with tarfile.open(fileobj=io.BytesIO(resp.content), mode="r:gz") as tar:
+            names = tar.getnames()
+        assert "my-script/run.sh" in names
+        assert "my-script/script.json" in names
+
+    def test_etag_is_stable_across_downloads(self, coordinator_client):
+        """The ETag depends on script content, not on when the tarball was built."""
+        _create_script(coordinator_client)
+
+        first = coordinator_client.get("/scripts/my-script/download")
+        second = coordinator_client.get("/scripts/my-script/download")
+        assert first.headers["etag"] == second.headers["etag"]
+
+    def test_matching_if_none_match_returns_304(self, coordinator_client):
+        """If-None-Match with the current ETag → 304 without a body."""
+        _create_script(coordinator_client)
+        etag = coordinator_client.get("/scripts/my-script/download").headers["etag"]
+
+        resp = coordinator_client.get(
+            "/scripts/my-script/download", headers={"If-None-Match": etag}
+        )
+        assert resp.status_code == 304
+        assert resp.content == b""
+
+    def test_changed_script_gets_new_etag(self, coordinator_client):
+        """Updating the script content changes the ETag."""
+        _create_script(coordinator_client)
+        etag = coordinator_client.get("/scripts/my-script/download").headers["etag"]
+
+        coordinator_client.patch("/scripts/my-script", json={"script_content": "echo v2"})
+
+        resp = coordinator_client.get(
+            "/scripts/my-script/download", headers={"If-None-Match": etag}
+        )
+        assert resp.status_code == 200
+        assert resp.headers["etag"] != etag
+
+    def test_download_missing_script_404(self, coordinator_client):
+        """Unknown script → 404."""
+        resp = coordinator_client.get("/scripts/missing/download")
+        assert resp.status_code == 404
@@ -1,4 +1,4 @@
-"""API tests for GET/DELETE /sessions endpoints."""
+"""API tests for GET/DELETE /sessions endpoints and session events."""
 
 
 class TestGetSessions:
@@ -118,3 +118,54 @@ class TestGetSessionResult:
         """GET /sessions/{id}/result on nonexistent session returns 404."""
         resp = coordinator_client.get("/sessions/ses_nonexistent/result")
         assert resp.status_code == 404
+
+
+class TestAddSessionEventsBatch:
+    """Tests for POST /sessions/{session_id}/events/batch."""
+
+    def _create_session(self, coordinator_client):
+        run_resp = coordinator_client.post("/runs", json={
+            "type": "start_session",
+            "parameters": {"prompt": "Hello"},
+        })
+        return run_resp.json()["session_id"]
+
+    def test_batch_stores_events_in_order(self, coordinator_client):
+        """All events in the batch are stored, preserving their order."""
+        session_id = self._create_session(coordinator_client)
+        events = [
+            {
+                "event_type": "message",
+                "session_id": session_id,
+                "timestamp": f"2026-01-01T00:00:0{i}Z",
+                "role": "assistant",
+                "content": [{"type": "text", "text": f"msg {i}"}],
+            }
+            for i in range(3)
+        ]
+
+        resp = coordinator_client.post(f"/sessions/{session_id}/events/batch", json={"events": events})
+        assert resp.status_code == 201
+        assert resp.json() == {"ok": True}
+
+        stored = coordinator_client.get(f"/sessions/{session_id}/events").json()["events"]
+        assert [e["content"][0]["text"] for e in stored] == ["msg 0", "msg 1", "msg 2"]
+
+    def test_batch_session_mismatch_rejected(self, coordinator_client):
+        """Events addressed to another session reject the whole batch."""
+        session_id = self._create_session(coordinator_client)
+        events = [
+            {"event_type": "message", "session_id": session_id, "timestamp": "2026-01-01T00:00:00Z"},
+            {"event_type": "message", "session_id": "ses_other", "timestamp": "2026-01-01T00:00:01Z"},
+        ]
+
+        resp = coordinator_client.post(f"/sessions/{session_id}/events/batch", json={"events": events})
+        assert resp.status_code == 400
+
+        stored = coordinator_client.get(f"/sessions/{session_id}/events").json()["events"]
+        assert stored == []
+
+    def test_batch_unknown_session(self, coordinator_client):
+        """POST to a nonexistent session returns 404."""
+        resp = coordinator_client.post("/sessions/ses_nonexistent/events/batch", json={"events": []})
+        assert resp.status_code == 404
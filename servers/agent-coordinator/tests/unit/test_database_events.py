@@ -94,6 +94,19 @@ class TestEventCRUD:
         events = database.get_events("ses_no_events")
         assert events == []
 
+    def test_insert_events_batch(self, db_path):
+        """insert_events stores every event of the batch."""
+        ts = datetime.now(timezone.utc).isoformat()
+        database.create_session(session_id="ses_batch", timestamp=ts)
+
+        database.insert_events([
+            _make_event("ses_batch", timestamp="2026-01-01T00:00:01Z", tool_name="Read"),
+            _make_event("ses_batch", timestamp="2026-01-01T00:00:02Z", tool_name="Write"),
+        ])
+
+        events = database.get_events("ses_batch")
+        assert [e["tool_name"] for e in events] == ["Read", "Write"]
+
 
 class TestCascadeDelete:
     def test_cascade_delete_session(self, db_path):
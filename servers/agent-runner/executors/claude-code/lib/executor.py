@@ -20,7 +20,7 @@ from executor_config import load_config, get_api_url
 from invocation import ExecutorInvocation
 from sdk_client import run_session_sync, run_multi_turn_session_sync
 from session_client import SessionClient, SessionClientError, SessionNotFoundError
-from utils import debug_log, format_autonomous_inputs
+from utils import ENABLE_DEBUG_LOGGING, debug_log, format_autonomous_inputs
 
 
 @dataclass
@@ -58,13 +58,14 @@ def _extract_blueprint(
     if not is_resume:
         data.system_prompt = blueprint.get("system_prompt")
 
-    debug_log("ao-claude-code-exec blueprint", {
-        "agent_name": data.agent_name or "unnamed",
-        "has_system_prompt": data.system_prompt is not None,
-        "has_mcp_servers": data.mcp_servers is not None,
-        "has_custom_schema": data.has_custom_schema,
-        "has_output_schema": data.output_schema is not None,
-    })
+    if ENABLE_DEBUG_LOGGING:
+        debug_log("ao-claude-code-exec blueprint", {
+            "agent_name": data.agent_name or "unnamed",
+            "has_system_prompt": data.system_prompt is not None,
+            "has_mcp_servers": data.mcp_servers is not None,
+            "has_custom_schema": data.has_custom_schema,
+            "has_output_schema": data.output_schema is not None,
+        })
 
     return data
 
@@ -94,17 +95,18 @@ def _execute_session(
     formatted_prompt = format_autonomous_inputs(inv.parameters, blueprint.has_custom_schema)
 
     mode = "run_resume" if is_resume else "run_start"
-    debug_log(f"ao-claude-code-exec {mode}", {
-        "session_id": inv.session_id,
-        "executor_session_id": resume_executor_session_id or "N/A",
-        "project_dir": str(project_dir),
-        "agent_name": blueprint.agent_name or "None",
-        "has_system_prompt": blueprint.system_prompt is not None,
-        "has_mcp_servers": blueprint.mcp_servers is not None,
-        "has_custom_schema": blueprint.has_custom_schema,
-        "prompt_length": len(formatted_prompt),
-        "schema_version": inv.schema_version,
-    })
+    if ENABLE_DEBUG_LOGGING:
+        debug_log(f"ao-claude-code-exec {mode}", {
+            "session_id": inv.session_id,
+            "executor_session_id": resume_executor_session_id or "N/A",
+            "project_dir": str(project_dir),
+            "agent_name": blueprint.agent_name or "None",
+            "has_system_prompt": blueprint.system_prompt is not None,
+            "has_mcp_servers": blueprint.mcp_servers is not None,
+            "has_custom_schema": blueprint.has_custom_schema,
+            "prompt_length": len(formatted_prompt),
+            "schema_version": inv.schema_version,
+        })
 
     _, result = run_session_sync(
         prompt=formatted_prompt,
@@ -148,8 +150,8 @@ def run_resume(inv: ExecutorInvocation):
     """
     api_url = get_api_url()
 
+    client = SessionClient(api_url)
     try:
-        client = SessionClient(api_url)
         session_data = client.get_session(inv.session_id)
     except SessionNotFoundError:
         raise ValueError(
@@ -161,6 +163,8 @@ def run_resume(inv: ExecutorInvocation):
             f"Resume failed: Cannot connect to session manager for '{inv.session_id}'. "
             f"API URL: {api_url}. Error: {e}"
         )
+    finally:
+        client.close()
 
     if not session_data:
         raise ValueError(
@@ -202,11 +206,12 @@ def run_multi_turn(inv: ExecutorInvocation):
     """
     config = load_config(cli_project_dir=inv.project_dir)
 
-    debug_log("ao-claude-code-exec run_multi_turn", {
-        "session_id": inv.session_id,
-        "project_dir": str(config.project_dir),
-        "has_agent_blueprint": inv.agent_blueprint is not None,
-    })
+    if ENABLE_DEBUG_LOGGING:
+        debug_log("ao-claude-code-exec run_multi_turn", {
+            "session_id": inv.session_id,
+            "project_dir": str(config.project_dir),
+            "has_agent_blueprint": inv.agent_blueprint is not None,
+        })
 
     run_multi_turn_session_sync(
         initial_invocation=inv,
@@ -224,6 +224,9 @@ async def run_claude_session(
     except Exception as e:
         # Propagate SDK errors with context
         raise Exception(f"Claude SDK error during session execution: {e}") from e
+    finally:
+        # Send any events still queued (tool events, messages)
+        emitter.close()
 
     # Validate we received required data
     print(f"[DIAG] Final state: executor_session_id={executor_session_id}, result={'set' if result else 'None'}", file=sys.stderr)
@@ -508,6 +511,9 @@ async def run_multi_turn_session(
 
     except Exception as e:
         raise Exception(f"Claude SDK error during multi-turn session: {e}") from e
+    finally:
+        # Send any events still queued (tool events, messages)
+        emitter.close()
 
     # Validate we received session binding
     if not executor_session_id:
@@ -4,8 +4,10 @@ Session Event Emission
 Encapsulates all communication with the Runner Gateway for session lifecycle
 events: binding, user/assistant messages, tool events, and results.
 
-All event emission is fire-and-forget (silent failure) to avoid blocking
-the agent execution loop.
+Event emission never blocks or fails the agent execution loop: events are
+queued and batched by SessionClient, and delivery failures are reported as
+warnings when the queue is flushed. Result events are flushed immediately so
+they are stored before the turn is reported done.
 """
 
 import sys
@@ -19,8 +21,8 @@ class SessionEventEmitter:
     """Emits session events to the Runner Gateway via SessionClient.
 
     All methods are safe to call even if session_id is not yet known -
-    they silently no-op. All SessionClientError exceptions are caught
-    to prevent blocking agent execution.
+    they silently no-op. SessionClientError is never raised to the caller;
+    failures are printed as warnings to prevent blocking agent execution.
     """
 
     def __init__(self, api_url: str, session_id: str):
@@ -37,6 +39,21 @@ class SessionEventEmitter:
     def session_id(self) -> str:
         return self._session_id
 
+    def close(self) -> None:
+        """Send any queued events and release the connection."""
+        try:
+            self._client.close()
+        except SessionClientError as e:
+            print(f"Warning: Session events not delivered: {e}", file=sys.stderr)
+
+    def _queue(self, event: dict) -> None:
+        """Queue an event; delivery failures surface on the next flush."""
+        try:
+            self._client.add_event(self._session_id, event)
+        except SessionClientError:
+            # Only raised once the client is closed (e.g. a late hook call)
+            pass
+
     def bind(self, executor_session_id: str, project_dir: str) -> bool:
         """Bind executor session to coordinator session (ADR-010). Returns True on success."""
         if self._bound:
@@ -65,57 +82,49 @@ class SessionEventEmitter:
 
     def emit_user_message(self, prompt: str) -> None:
         """Emit a user message event."""
-        try:
-            self._client.add_event(self._session_id, {
-                "event_type": "message",
-                "session_id": self._session_id,
-                "timestamp": datetime.now(UTC).isoformat(),
-                "role": "user",
-                "content": [{"type": "text", "text": prompt}]
-            })
-        except SessionClientError:
-            pass
+        self._queue({
+            "event_type": "message",
+            "session_id": self._session_id,
+            "timestamp": datetime.now(UTC).isoformat(),
+            "role": "user",
+            "content": [{"type": "text", "text": prompt}]
+        })
 
     def emit_assistant_message(self, text: str) -> None:
         """Emit an assistant message event (for conversation history)."""
-        try:
-            self._client.add_event(self._session_id, {
-                "event_type": "message",
-                "session_id": self._session_id,
-                "timestamp": datetime.now(UTC).isoformat(),
-                "role": "assistant",
-                "content": [{"type": "text", "text": text}]
-            })
-        except SessionClientError:
-            pass
+        self._queue({
+            "event_type": "message",
+            "session_id": self._session_id,
+            "timestamp": datetime.now(UTC).isoformat(),
+            "role": "assistant",
+            "content": [{"type": "text", "text": text}]
+        })
 
     def emit_post_tool(self, input_data: dict) -> None:
         """Emit a post_tool event (called from SDK hook)."""
-        try:
-            self._client.add_event(self._session_id, {
-                "event_type": "post_tool",
-                "session_id": self._session_id,
-                "timestamp": datetime.now(UTC).isoformat(),
-                "tool_name": input_data.get("tool_name", "unknown"),
-                "tool_input": input_data.get("tool_input", {}),
-                "tool_output": input_data.get("tool_response", ""),
-                "error": input_data.get("error"),
-            })
-        except SessionClientError:
-            pass
+        self._queue({
+            "event_type": "post_tool",
+            "session_id": self._session_id,
+            "timestamp": datetime.now(UTC).isoformat(),
+            "tool_name": input_data.get("tool_name", "unknown"),
+            "tool_input": input_data.get("tool_input", {}),
+            "tool_output": input_data.get("tool_response", ""),
+            "error": input_data.get("error"),
+        })
 
     def emit_result(self, result_text: Optional[str] = None, result_data=None) -> None:
         """Emit a result event (text or structured data)."""
+        self._queue({
+            "event_type": "result",
+            "session_id": self._session_id,
+            "timestamp": datetime.now(UTC).isoformat(),
+            "result_text": result_text,
+            "result_data": result_data,
+        })
         try:
-            self._client.add_event(self._session_id, {
-                "event_type": "result",
-                "session_id": self._session_id,
-                "timestamp": datetime.now(UTC).isoformat(),
-                "result_text": result_text,
-                "result_data": result_data,
-            })
-        except SessionClientError:
-            pass
+            self._client.flush()
+        except SessionClientError as e:
+            print(f"Warning: Session events not delivered: {e}", file=sys.stderr)
 
 
 # =============================================================================
@@ -7,9 +7,11 @@ Supports Auth0 M2M authentication when coordinator has AUTH_ENABLED=true.
 Note: Uses session_id (coordinator-generated) per ADR-010.
 """
 
+import io
 import httpx
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Optional, TYPE_CHECKING
+from typing import BinaryIO, Iterator, Optional, TYPE_CHECKING
 import logging
 
 if TYPE_CHECKING:
@@ -17,6 +19,16 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Connection pool for the shared client. Concurrent users are the poll
+# long-poll, heartbeat, supervisor reports, the process reaper and up to
+# SCRIPT_SYNC_WORKERS script downloads; keeping that many connections alive
+# lets each of them reuse a socket instead of reconnecting per request.
+HTTP_POOL_LIMITS = httpx.Limits(max_connections=16, max_keepalive_connections=8)
+
+# Retries for failed connection attempts only. The request was never sent,
+# so this is safe for the non-idempotent report POSTs too.
+HTTP_CONNECT_RETRIES = 2
+
 
 class AuthenticationError(Exception):
     """Raised when API key is missing or invalid."""
@@ -46,6 +58,40 @@ class AgentNameCollisionError(Exception):
         super().__init__(message)
 
 
+class _ResponseBodyStream(io.RawIOBase):
+    """Read-only raw file object over a streamed httpx response body.
+
+    Lets consumers such as tarfile's stream mode ("r|gz") read the body
+    incrementally while it is still being downloaded.
+    """
+
+    def __init__(self, response: httpx.Response):
+        self._chunks = response.iter_bytes()
+        self._pending = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0  # EOF
+            self._pending = memoryview(chunk)
+        n = min(len(buffer), len(self._pending))
+        buffer[:n] = self._pending[:n]
+        self._pending = self._pending[n:]
+        return n
+
+
+@dataclass
+class ScriptDownload:
+    """Streamed script tarball download (see download_script_stream)."""
+    stream: Optional[BinaryIO] = None  # tar.gz body; None when not_modified
+    etag: Optional[str] = None  # Content ETag of the script on the coordinator
+    not_modified: bool = False  # True if the caller's etag is still current
+
+
 @dataclass
 class RegistrationResponse:
     """Response from runner registration."""
@@ -89,6 +135,7 @@ class PollResult:
     stop_sessions: list[str] = None  # Session IDs to stop
     sync_scripts: list[str] = None  # Script names to sync
     remove_scripts: list[str] = None  # Script names to remove
+    started_reported: bool = True  # False if the poll may not have reached the coordinator
 
     def __post_init__(self):
         if self.stop_sessions is None:
@@ -122,14 +169,18 @@ class CoordinatorAPIClient:
         self.timeout = timeout
         self.auth0_client = auth0_client
 
-        self._client = httpx.Client(timeout=timeout)
+        # One pooled keep-alive client shared by all runner threads
+        self._client = httpx.Client(
+            timeout=timeout,
+            transport=httpx.HTTPTransport(limits=HTTP_POOL_LIMITS, retries=HTTP_CONNECT_RETRIES),
+        )
 
     def _get_auth_headers(self) -> dict:
         """Get authorization headers from Auth0 M2M client."""
         if self.auth0_client and self.auth0_client.is_configured:
-            token = self.auth0_client.get_access_token()
-            if token:
-                return {"Authorization": f"Bearer {token}"}
+            auth_header = self.auth0_client.get_authorization_header()
+            if auth_header:
+                return {"Authorization": auth_header}
             logger.warning("Auth0 configured but failed to get token")
 
         # No auth headers when Auth0 is not configured
@@ -226,18 +277,32 @@ class CoordinatorAPIClient:
             heartbeat_interval_seconds=data["heartbeat_interval_seconds"],
         )
 
-    def poll_run(self, runner_id: str) -> PollResult:
+    def poll_run(self, runner_id: str, started_runs: Optional[list[str]] = None) -> PollResult:
         """Long-poll for an agent run to execute or stop commands.
 
+        The poll is a batched command channel: one response may carry several
+        command categories, which the caller applies in a fixed order
+        (stop_sessions, then sync/remove_scripts, then run).
+
+        Args:
+            runner_id: This runner's ID
+            started_runs: Run IDs started since the previous poll; the
+                coordinator marks them started (same as report_started)
+
         Returns PollResult with:
         - run: Run if available
         - deregistered: True if runner has been deregistered externally
         - stop_sessions: List of session IDs to stop
+        - sync_scripts / remove_scripts: Script names to sync or remove
+        - started_reported: False if started_runs may not have been delivered
         """
         try:
+            params = {"runner_id": runner_id}
+            if started_runs:
+                params["started"] = started_runs
             response = self._client.get(
                 f"{self.base_url}/runner/runs",
-                params={"runner_id": runner_id},
+                params=params,
                 headers=self._get_auth_headers(),
             )
 
@@ -252,20 +317,19 @@ class CoordinatorAPIClient:
             if data.get("deregistered"):
                 return PollResult(deregistered=True)
 
-            # Check for stop commands
-            if "stop_sessions" in data:
-                return PollResult(stop_sessions=data["stop_sessions"])
+            # Commands are batched: a single response may carry stop and
+            # script sync/remove commands together (and, possibly, a run)
+            result = PollResult(
+                stop_sessions=data.get("stop_sessions"),
+                sync_scripts=data.get("sync_scripts"),
+                remove_scripts=data.get("remove_scripts"),
+            )
 
-            # Check for script sync commands
-            if "sync_scripts" in data or "remove_scripts" in data:
-                return PollResult(
-                    sync_scripts=data.get("sync_scripts", []),
-                    remove_scripts=data.get("remove_scripts", []),
-                )
+            run_data = data.get("run")
+            if not run_data:
+                return result
 
-            # Normal run response
-            run_data = data["run"]
-            run = Run(
+            result.run = Run(
                 run_id=run_data["run_id"],
                 type=run_data["type"],
                 session_id=run_data["session_id"],
@@ -277,11 +341,16 @@ class CoordinatorAPIClient:
                 scope=run_data.get("scope"),
                 resolved_agent_blueprint=run_data.get("resolved_agent_blueprint"),
             )
-            return PollResult(run=run)
-        except httpx.TimeoutException:
-            # Timeout is expected for long-polling
+            return result
+        except httpx.ReadTimeout:
+            # Timeout is expected for long-polling (the request was sent)
             logger.debug("Poll timeout (expected)")
             return PollResult()
+        except httpx.TimeoutException as e:
+            # Connect/write/pool timeout: the coordinator may never have seen
+            # the request, so started_runs must be sent again
+            logger.debug("Poll timeout before the request was sent: %s", e)
+            return PollResult(started_reported=False)
 
     def report_started(self, runner_id: str, run_id: str) -> None:
         """Report that agent run execution has started."""
@@ -452,21 +521,39 @@ class CoordinatorAPIClient:
             logger.error(f"Failed to create resume run for {session_id}: {e}")
             return None
 
-    def download_script(self, script_name: str) -> Optional[bytes]:
-        """Download a script tarball from the coordinator.
+    @contextmanager
+    def download_script_stream(
+        self, script_name: str, etag: Optional[str] = None
+    ) -> Iterator[Optional[ScriptDownload]]:
+        """Stream a script tarball from the coordinator.
 
-        Returns the tar.gz bytes if successful, None on error.
+        Args:
+            script_name: Script to download
+            etag: ETag of the locally installed version, sent as If-None-Match
+
+        Yields a ScriptDownload whose stream is a binary file object over the
+        tar.gz body while it downloads (not_modified=True and no stream if the
+        local version is current), or None if the script does not exist.
+        Transport and HTTP errors propagate to the caller.
         """
-        try:
-            response = self._client.get(
-                f"{self.base_url}/scripts/{script_name}/download",
-                headers=self._get_auth_headers(),
-            )
+        headers = self._get_auth_headers()
+        if etag:
+            headers["If-None-Match"] = etag
+
+        with self._client.stream(
+            "GET",
+            f"{self.base_url}/scripts/{script_name}/download",
+            headers=headers,
+        ) as response:
             if response.status_code == 404:
                 logger.warning(f"Script not found: {script_name}")
-                return None
+                yield None
+                return
+            if response.status_code == 304:
+                yield ScriptDownload(etag=etag, not_modified=True)
+                return
             response.raise_for_status()
-            return response.content
-        except Exception as e:
-            logger.error(f"Failed to download script {script_name}: {e}")
-            return None
+            yield ScriptDownload(
+                stream=io.BufferedReader(_ResponseBodyStream(response)),
+                etag=response.headers.get("etag"),
+            )
@@ -6,6 +6,7 @@ Tokens are cached and refreshed automatically before expiry.
 
 import time
 import logging
+import threading
 from dataclasses import dataclass
 from typing import Optional
 
@@ -18,7 +19,8 @@ logger = logging.getLogger(__name__)
 class TokenCache:
     """Cached access token with expiry."""
     access_token: str
-    expires_at: float  # Unix timestamp
+    authorization: str  # "Bearer <token>", built once per token
+    expires_at: float  # time.monotonic() deadline
 
 
 class Auth0M2MClient:
@@ -44,6 +46,7 @@ class Auth0M2MClient:
         self.client_secret = client_secret
         self.audience = audience
         self._token_cache: Optional[TokenCache] = None
+        self._refresh_lock = threading.Lock()
         self._http = httpx.Client(timeout=30.0)
 
     @property
@@ -62,14 +65,40 @@ class Auth0M2MClient:
         Returns:
             Access token string, or None if not configured or on error.
         """
+        cache = self._get_token_cache()
+        return cache.access_token if cache else None
+
+    def get_authorization_header(self) -> Optional[str]:
+        """Get the Authorization header value for the current token.
+
+        Returns:
+            "Bearer <token>" string, or None if not configured or on error.
+        """
+        cache = self._get_token_cache()
+        return cache.authorization if cache else None
+
+    def _get_token_cache(self) -> Optional[TokenCache]:
+        """Return a fresh token cache entry, refreshing 60s before expiry.
+
+        The fast path is lock-free. Refreshes are serialized so concurrent
+        callers (e.g. gateway request threads) share one token request.
+        """
         if not self.is_configured:
             return None
 
-        # Check cache (refresh 60 seconds before expiry)
-        if self._token_cache and time.time() < self._token_cache.expires_at - 60:
-            return self._token_cache.access_token
+        cache = self._token_cache
+        if cache and time.monotonic() < cache.expires_at - 60:
+            return cache
+
+        with self._refresh_lock:
+            # Another thread may have refreshed while we waited
+            cache = self._token_cache
+            if cache and time.monotonic() < cache.expires_at - 60:
+                return cache
+            return self._request_token()
 
-        # Request new token
+    def _request_token(self) -> Optional[TokenCache]:
+        """Request a new token from Auth0 and cache it."""
         try:
             response = self._http.post(
                 f"https://{self.domain}/oauth/token",
@@ -84,13 +113,16 @@ class Auth0M2MClient:
             data = response.json()
 
             # Cache token
+            access_token = data["access_token"]
+            expires_in = data.get("expires_in", 3600)
             self._token_cache = TokenCache(
-                access_token=data["access_token"],
-                expires_at=time.time() + data.get("expires_in", 3600),
+                access_token=access_token,
+                authorization=f"Bearer {access_token}",
+                expires_at=time.monotonic() + expires_in,
             )
 
-            logger.debug(f"Obtained new Auth0 access token (expires in {data.get('expires_in', 3600)}s)")
-            return self._token_cache.access_token
+            logger.debug(f"Obtained new Auth0 access token (expires in {expires_in}s)")
+            return self._token_cache
 
         except httpx.HTTPStatusError as e:
             logger.error(f"Auth0 token request failed: {e.response.status_code} - {e.response.text}")
@@ -8,41 +8,99 @@ Blueprints are resolved at Coordinator level. Runner only resolves
 ${runner.*} placeholders (e.g., ${runner.orchestrator_mcp_url}).
 """
 
+import functools
 import json
 import os
+import re
+import shutil
 import subprocess
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, TypedDict
 import logging
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+import json_codec
 from api_client import Run
 from invocation import SCHEMA_VERSION
 
 logger = logging.getLogger(__name__)
 
 
+# Default Linux pipe capacity; payloads above this would block the runner on
+# stdin write until the executor starts reading
+_DEFAULT_PIPE_SIZE = 64 * 1024
+_MAX_STDIN_PIPE_SIZE = 1 << 20
+
+_F_SETPIPE_SZ = getattr(fcntl, "F_SETPIPE_SZ", None)
+
+# ${runner.<identifier>} placeholder inside a serialized JSON string
+_RUNNER_PLACEHOLDER = re.compile(rb'\$\{runner\.([a-zA-Z_][a-zA-Z0-9_]*)\}')
+# A JSON string token; group 1 is ":" when the string is an object key
+# (compact serialization, no whitespace before the colon)
+_JSON_STRING = re.compile(rb'"(?:[^"\\]|\\.)*"(:?)')
+
+
 # Default executor path and type (used when no profile is specified)
 DEFAULT_EXECUTOR_PATH = "executors/claude-code/ao-claude-code-exec"
 DEFAULT_EXECUTOR_TYPE = "autonomous"
 
 
+@functools.cache
 def get_runner_dir() -> Path:
-    """Get the agent-runner directory."""
+    """Get the agent-runner directory (resolved once per process)."""
     return Path(__file__).parent.parent.resolve()
 
 
+def _widen_pipe(fd: int, size: int) -> bool:
+    """Grow a pipe's kernel buffer to hold size bytes (Linux only, best effort).
+
+    Returns:
+        True if size bytes can be written without blocking on an idle reader
+    """
+    if size <= _DEFAULT_PIPE_SIZE:
+        return True
+    if _F_SETPIPE_SZ is None:
+        return False
+    try:
+        return fcntl.fcntl(fd, _F_SETPIPE_SZ, min(size, _MAX_STDIN_PIPE_SIZE)) >= size
+    except OSError as e:
+        # EPERM above /proc/sys/fs/pipe-max-size for unprivileged users
+        logger.debug("Could not widen stdin pipe to %d bytes: %s", size, e)
+        return False
+
+
+def _write_stdin_and_close(process: subprocess.Popen, data: bytes) -> None:
+    """Write data to a process's stdin and close it (stdin writer thread body)."""
+    try:
+        process.stdin.buffer.write(data)
+    except OSError as e:
+        # Executor exited before consuming its payload - supervisor reports the exit
+        logger.warning("Failed to write payload to executor pid=%s: %s", process.pid, e)
+    finally:
+        try:
+            process.stdin.close()
+        except OSError:
+            pass
+
+
 # =============================================================================
 # Executor Profiles
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ExecutorProfile:
     """Loaded executor profile.
 
     A profile bundles an executor type with its configuration.
     Profiles are stored as JSON files in the profiles/ directory.
+    Profiles are immutable once loaded.
 
     Attributes:
         name: Profile name (e.g., "coding") - derived from filename
@@ -60,8 +118,9 @@ class ExecutorProfile:
     lifecycle: str = "one_shot"  # "one_shot" or "persistent"
 
 
+@functools.cache
 def get_profiles_dir() -> Path:
-    """Get the profiles directory."""
+    """Get the profiles directory (resolved once per process)."""
     return get_runner_dir() / "profiles"
 
 
@@ -73,10 +132,13 @@ def list_profiles() -> list[str]:
     Returns:
         List of profile names (without .json extension) sorted alphabetically
     """
-    profiles_dir = get_profiles_dir()
-    if not profiles_dir.exists():
+    try:
+        with os.scandir(get_profiles_dir()) as it:
+            return sorted(
+                e.name[:-5] for e in it if e.name.endswith(".json") and e.is_file()
+            )
+    except FileNotFoundError:
         return []
-    return sorted([p.stem for p in profiles_dir.glob("*.json")])
 
 
 def load_profile(name: str) -> ExecutorProfile:
@@ -145,15 +207,33 @@ def load_agents_from_profile(profile: ExecutorProfile) -> list[dict]:
         agents_dir = get_runner_dir() / agents_dir
 
     agents = []
-    if agents_dir.exists():
-        for path in agents_dir.glob("*.json"):
-            with open(path) as f:
-                agent = json.load(f)
-                agents.append(agent)
+    try:
+        with os.scandir(agents_dir) as it:
+            agent_files = [e.path for e in it if e.name.endswith(".json") and e.is_file()]
+    except FileNotFoundError:
+        return agents
+
+    for path in agent_files:
+        with open(path) as f:
+            agent = json.load(f)
+            agents.append(agent)
 
     return agents
 
 
+class ExecutorPayload(TypedDict, total=False):
+    """Shape of the JSON payload written to ao-*-exec stdin (see invocation.py)."""
+
+    schema_version: str
+    mode: str
+    session_id: str
+    parameters: dict[str, Any]
+    project_dir: str
+    agent_name: str
+    executor_config: dict[str, Any]
+    agent_blueprint: dict[str, Any]
+
+
 class RunExecutor:
     """Executes agent runs by spawning executor subprocess with JSON payload.
 
@@ -186,9 +266,33 @@ class RunExecutor:
             self.executor_path = get_runner_dir() / DEFAULT_EXECUTOR_PATH
             self.executor_config = {}
 
-        logger.debug(f"Executor path: {self.executor_path}")
+        # Resolve uv once so each spawn execs an absolute path instead of
+        # searching PATH in the child (falls back to PATH lookup if not found now)
+        self.uv_path = shutil.which("uv") or "uv"
+
+        # Environment snapshot for spawned executors (see refresh_env)
+        self._base_env = dict(os.environ)
+
+        # executor_config is fixed per profile: serialize it once and splice the
+        # fragment into every payload instead of re-encoding it per spawn
+        self._executor_config_fragment = (
+            b',"executor_config":' + json_codec.dumps(self.executor_config)
+            if self.executor_config else b""
+        )
+
+        logger.debug("Executor path: %s", self.executor_path)
+        logger.debug("uv path: %s", self.uv_path)
         if self.executor_config:
-            logger.debug(f"Executor config: {self.executor_config}")
+            logger.debug("Executor config: %s", self.executor_config)
+
+    def refresh_env(self) -> None:
+        """Re-snapshot os.environ as the base environment for spawned executors.
+
+        Must be called after the runner changes os.environ (e.g. after setting
+        AGENT_ORCHESTRATOR_API_URL to the gateway URL), otherwise executors are
+        spawned with the environment captured at construction time.
+        """
+        self._base_env = dict(os.environ)
 
     @property
     def is_persistent(self) -> bool:
@@ -221,76 +325,84 @@ class RunExecutor:
         Only ${runner.orchestrator_mcp_url} is resolved at Runner level.
         All other placeholders are resolved at Coordinator.
 
+        Blueprints without any runner placeholder (the common case) are
+        returned as-is, without a copy; the input is never modified.
+
         Args:
             blueprint: Agent blueprint with possible ${runner.*} placeholders
 
         Returns:
-            New blueprint with runner placeholders resolved
+            New blueprint with runner placeholders resolved, or blueprint
+            itself if it has none
         """
-        import copy
-        import re
-
-        RUNNER_PLACEHOLDER = re.compile(r'\$\{runner\.([^}]+)\}')
-
-        def resolve_string(s: str) -> str:
-            def replace_match(match: re.Match) -> str:
-                key = match.group(1)
-                if key == 'orchestrator_mcp_url':
-                    return self.mcp_server_url or match.group(0)
-                # Unknown runner.* placeholder - keep as-is
-                return match.group(0)
-            return RUNNER_PLACEHOLDER.sub(replace_match, s)
-
-        def resolve_value(value):
-            if isinstance(value, dict):
-                return {k: resolve_value(v) for k, v in value.items()}
-            elif isinstance(value, list):
-                return [resolve_value(item) for item in value]
-            elif isinstance(value, str):
-                return resolve_string(value)
-            else:
-                return value
+        raw = json_codec.dumps(blueprint)
+        if b"${runner." not in raw:
+            return blueprint
+        return json_codec.loads(self._resolve_runner_placeholders_json(raw))
 
-        return resolve_value(copy.deepcopy(blueprint))
+    def _resolve_runner_placeholders_json(self, raw: bytes) -> bytes:
+        """Resolve ${runner.*} placeholders in a serialized blueprint.
 
-    def _build_payload(self, run: Run, mode: str) -> dict:
+        One regex pass over the JSON text instead of a recursive walk. Like
+        the walk, only string values are resolved; object keys are kept as-is.
+        """
+        if b"${runner." not in raw:
+            return raw
+
+        def replace_placeholder(match: re.Match) -> bytes:
+            if match.group(1) == b"orchestrator_mcp_url" and self.mcp_server_url:
+                # Escape for the JSON string the placeholder sits in
+                return json_codec.dumps(self.mcp_server_url)[1:-1]
+            # Unknown runner.* placeholder (or no MCP URL) - keep as-is
+            return match.group(0)
+
+        def replace_string(match: re.Match) -> bytes:
+            token = match.group(0)
+            if match.group(1) or b"${runner." not in token:
+                return token
+            return _RUNNER_PLACEHOLDER.sub(replace_placeholder, token)
+
+        return _JSON_STRING.sub(replace_string, raw)
+
+    def _build_payload(
+        self, run: Run, mode: str, include_spliced_fields: bool = True
+    ) -> ExecutorPayload:
         """Build JSON payload for ao-*-exec.
 
         Args:
             run: The agent run to execute
             mode: Execution mode ('start' or 'resume')
+            include_spliced_fields: Whether to include executor_config and
+                agent_blueprint (False when the caller splices in their JSON)
 
         Returns:
             Dictionary payload for JSON serialization
         """
-        payload = {
+        # Blueprint is resolved at Coordinator; Runner only resolves ${runner.*} placeholders
+        if run.resolved_agent_blueprint:
+            logger.debug("Using resolved blueprint from run for session %s", run.session_id)
+
+        # Built in one literal; optional fields are only present when set
+        payload: ExecutorPayload = {
             "schema_version": SCHEMA_VERSION,
             "mode": mode,
             "session_id": run.session_id,
             "parameters": run.parameters,
+            # project_dir for start mode only
+            **({"project_dir": run.project_dir or self.default_project_dir} if mode == "start" else {}),
+            # agent_name for procedural executors
+            **({"agent_name": run.agent_name} if run.agent_name else {}),
+            # executor_config from profile
+            **(
+                {"executor_config": self.executor_config}
+                if include_spliced_fields and self.executor_config else {}
+            ),
+            **(
+                {"agent_blueprint": self._resolve_runner_placeholders(run.resolved_agent_blueprint)}
+                if include_spliced_fields and run.resolved_agent_blueprint else {}
+            ),
         }
 
-        # Add project_dir for start mode
-        if mode == "start":
-            project_dir = run.project_dir or self.default_project_dir
-            payload["project_dir"] = project_dir
-
-        # Add agent_name if present (for procedural executors)
-        if run.agent_name:
-            payload["agent_name"] = run.agent_name
-
-        # Add executor_config from profile if present
-        if self.executor_config:
-            payload["executor_config"] = self.executor_config
-
-        # Blueprint is resolved at Coordinator; Runner only resolves ${runner.*} placeholders
-        if run.resolved_agent_blueprint:
-            agent_blueprint = self._resolve_runner_placeholders(run.resolved_agent_blueprint)
-            payload["agent_blueprint"] = agent_blueprint
-            logger.debug(
-                f"Using resolved blueprint from run for session {run.session_id}"
-            )
-
         return payload
 
     def _execute_with_payload(self, run: Run, mode: str) -> subprocess.Popen:
@@ -303,47 +415,66 @@ class RunExecutor:
         Returns:
             The spawned subprocess.Popen object
         """
-        # Build JSON payload
-        payload = self._build_payload(run, mode)
-        payload_json = json.dumps(payload)
+        # Build JSON payload; the blueprint (placeholders resolved on its JSON)
+        # and the cached executor_config fragment are spliced in before the
+        # closing brace (payload always has required keys, so ends in '}')
+        payload = self._build_payload(run, mode, include_spliced_fields=False)
+        payload_bytes = json_codec.dumps(payload)
+        blueprint = run.resolved_agent_blueprint
+        if blueprint or self._executor_config_fragment:
+            payload_bytes = b"".join((
+                payload_bytes[:-1],
+                b',"agent_blueprint":' + self._resolve_runner_placeholders_json(json_codec.dumps(blueprint))
+                if blueprint else b"",
+                self._executor_config_fragment,
+                b"}",
+            ))
 
         # Build command - use 'uv run --script' for cross-platform compatibility
         # (Windows doesn't support shebangs, so we need explicit uv invocation)
-        cmd = ["uv", "run", "--script", str(self.executor_path)]
-
-        # Build environment
-        env = os.environ.copy()
+        cmd = [self.uv_path, "run", "--script", str(self.executor_path)]
 
+        # Build environment from the base snapshot.
         # Set AGENT_SESSION_ID so the session knows its own identity.
         # This allows MCP servers to include the session ID in HTTP headers
         # for callback support (X-Agent-Session-Id header).
         # Flow: Coordinator resolves ${runtime.session_id} in MCP config
         #       -> Claude sends X-Agent-Session-Id header -> MCP server reads it
-        env["AGENT_SESSION_ID"] = run.session_id
+        env = {**self._base_env, "AGENT_SESSION_ID": run.session_id}
 
         # Log action (don't log full payload - prompt may be large/sensitive)
+        # %-style args: formatting is deferred until a handler actually emits
         if mode == "start":
-            logger.info(
-                f"Starting session: {run.session_id}"
-                + (f" (agent={run.agent_name})" if run.agent_name else "")
-            )
-        else:
-            logger.info(f"Resuming session: {run.session_id}")
-
-        if run.prompt:
-            logger.debug(
-                f"Executing ao-*-exec: mode={mode} session={run.session_id} "
-                f"prompt_len={len(run.prompt)}"
-            )
+            if run.agent_name:
+                logger.info("Starting session: %s (agent=%s)", run.session_id, run.agent_name)
+            else:
+                logger.info("Starting session: %s", run.session_id)
         else:
-            logger.debug(
-                f"Executing ao-*-exec: mode={mode} session={run.session_id} "
-                f"parameters={list(run.parameters.keys()) if run.parameters else []}"
-            )
+            logger.info("Resuming session: %s", run.session_id)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            prompt = run.prompt
+            if prompt:
+                logger.debug(
+                    "Executing ao-*-exec: mode=%s session=%s prompt_len=%d",
+                    mode, run.session_id, len(prompt),
+                )
+            else:
+                logger.debug(
+                    "Executing ao-*-exec: mode=%s session=%s parameters=%s",
+                    mode, run.session_id, list(run.parameters) if run.parameters else [],
+                )
 
         # Spawn subprocess with stdin pipe
         # encoding='utf-8' required for Windows (defaults to CP1252 which can't handle emojis)
         # cwd is set for start mode so the executor runs in the correct project directory
+        #
+        # Spawn latency: with close_fds=True and a cwd, CPython never takes its
+        # posix_spawn path; the child is started by _posixsubprocess with vfork()
+        # instead of a full fork of the runner's address space. Do NOT add
+        # preexec_fn, user, group or extra_groups here - any of them disables vfork
+        # and forces fork+exec, regressing per-run startup time. (pass_fds and
+        # start_new_session do not affect vfork.)
         process = subprocess.Popen(
             cmd,
             stdin=subprocess.PIPE,
@@ -351,28 +482,44 @@ class RunExecutor:
             stderr=subprocess.PIPE,
             env=env,
             cwd=payload.get("project_dir") or self.default_project_dir,
+            close_fds=True,
             text=True,
             encoding='utf-8',
             errors='replace',
         )
 
-        # Write payload to stdin
+        # Large prompts: widen the pipe so the write does not block until the
+        # executor gets around to reading stdin
+        fits_in_pipe = _widen_pipe(process.stdin.fileno(), len(payload_bytes) + 1)
+
+        # Write payload to stdin as already-encoded UTF-8 bytes via the underlying
+        # binary buffer (skips the text wrapper's re-encode; stdout/stderr stay text)
         if self.is_persistent:
-            process.stdin.write(payload_json + "\n")
-            process.stdin.flush()
-        else:
-            process.stdin.write(payload_json)
+            # Synchronous: later turns are written to the same stdin (send_turn)
+            process.stdin.buffer.write(payload_bytes + b"\n")
+            process.stdin.buffer.flush()
+        elif fits_in_pipe:
+            process.stdin.buffer.write(payload_bytes)
             process.stdin.close()
+        else:
+            # Payload exceeds the pipe capacity: hand the write to a short-lived
+            # thread so the poller is not blocked until the executor reads stdin
+            threading.Thread(
+                target=_write_stdin_and_close,
+                args=(process, payload_bytes),
+                name=f"stdin-writer-{run.session_id}",
+                daemon=True,
+            ).start()
 
         return process
 
     def send_turn(self, process: subprocess.Popen, run: Run) -> None:
         """Write NDJSON turn message to an existing persistent process."""
-        msg = json.dumps({"type": "turn", "parameters": run.parameters})
-        process.stdin.write(msg + "\n")
-        process.stdin.flush()
+        # Same binary-buffer path as the initial payload (no text re-encode)
+        process.stdin.buffer.write(json_codec.dumps({"type": "turn", "parameters": run.parameters}) + b"\n")
+        process.stdin.buffer.flush()
 
     def send_shutdown(self, process: subprocess.Popen) -> None:
         """Send shutdown signal to a persistent process."""
-        process.stdin.write('{"type": "shutdown"}\n')
-        process.stdin.flush()
+        process.stdin.buffer.write(b'{"type":"shutdown"}\n')
+        process.stdin.buffer.flush()
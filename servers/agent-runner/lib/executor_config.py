@@ -9,10 +9,11 @@ services. The only directory configuration needed is project_dir for the working
 """
 
 import os
+import stat
 from pathlib import Path
 from typing import Optional
 from dataclasses import dataclass
-from utils import debug_log
+from utils import ENABLE_DEBUG_LOGGING, debug_log
 
 
 # Environment variable names
@@ -48,22 +49,18 @@ def resolve_absolute_path(path_str: str) -> Path:
     Returns:
         Absolute Path object with normalized path
     """
-    path = Path(path_str)
-    is_absolute = path.is_absolute()
-    cwd = Path.cwd()
-
-    if not is_absolute:
-        path = cwd / path
-
-    resolved_path = path.resolve()
+    # resolve() anchors relative paths at the cwd itself; symlinks are
+    # canonicalized as before
+    resolved_path = Path(path_str).resolve()
 
     # DEBUG LOGGING - Track path resolution
-    debug_log("resolve_absolute_path", {
-        "input_path": path_str,
-        "is_absolute": is_absolute,
-        "cwd": str(cwd),
-        "resolved_path": str(resolved_path),
-    })
+    if ENABLE_DEBUG_LOGGING:
+        debug_log("resolve_absolute_path", {
+            "input_path": path_str,
+            "is_absolute": Path(path_str).is_absolute(),
+            "cwd": str(Path.cwd()),
+            "resolved_path": str(resolved_path),
+        })
 
     return resolved_path
 
@@ -84,20 +81,22 @@ def load_config(
         ValueError: If project_dir doesn't exist
     """
     # DEBUG LOGGING - Entry point
-    debug_log("load_config - ENTRY", {
-        "cwd": str(Path.cwd()),
-        "cli_project_dir": cli_project_dir or "None",
-    })
+    if ENABLE_DEBUG_LOGGING:
+        debug_log("load_config - ENTRY", {
+            "cwd": str(Path.cwd()),
+            "cli_project_dir": cli_project_dir or "None",
+        })
 
     # Read environment variables
     env_project_dir = os.environ.get(ENV_PROJECT_DIR)
     env_logging = os.environ.get(ENV_ENABLE_LOGGING, "").lower()
 
     # DEBUG LOGGING - Environment variables
-    debug_log("load_config - ENV VARS", {
-        "AGENT_ORCHESTRATOR_PROJECT_DIR": env_project_dir or "not set",
-        "AGENT_ORCHESTRATOR_ENABLE_LOGGING": env_logging or "not set",
-    })
+    if ENABLE_DEBUG_LOGGING:
+        debug_log("load_config - ENV VARS", {
+            "AGENT_ORCHESTRATOR_PROJECT_DIR": env_project_dir or "not set",
+            "AGENT_ORCHESTRATOR_ENABLE_LOGGING": env_logging or "not set",
+        })
 
     # Apply precedence for PROJECT_DIR: CLI > ENV > DEFAULT
     if cli_project_dir:
@@ -114,16 +113,19 @@ def load_config(
     project_dir = resolve_absolute_path(project_dir_str)
 
     # DEBUG LOGGING - PROJECT_DIR resolution
-    debug_log("load_config - PROJECT_DIR", {
-        "source": project_dir_source,
-        "raw_value": project_dir_str,
-        "resolved_path": str(project_dir),
-    })
-
-    # Validate PROJECT_DIR: must exist and be readable
-    if not project_dir.exists():
+    if ENABLE_DEBUG_LOGGING:
+        debug_log("load_config - PROJECT_DIR", {
+            "source": project_dir_source,
+            "raw_value": project_dir_str,
+            "resolved_path": str(project_dir),
+        })
+
+    # Validate PROJECT_DIR: must exist and be readable (single stat for both checks)
+    try:
+        st = os.stat(project_dir)
+    except (FileNotFoundError, NotADirectoryError):
         raise ValueError(f"Project directory does not exist: {project_dir}")
-    if not project_dir.is_dir():
+    if not stat.S_ISDIR(st.st_mode):
         raise ValueError(f"Project directory is not a directory: {project_dir}")
     if not os.access(project_dir, os.R_OK):
         raise ValueError(f"Project directory is not readable: {project_dir}")
@@ -135,9 +137,10 @@ def load_config(
     api_url = get_api_url()
 
     # DEBUG LOGGING - API configuration
-    debug_log("load_config - API_URL", {
-        "url": api_url,
-    })
+    if ENABLE_DEBUG_LOGGING:
+        debug_log("load_config - API_URL", {
+            "url": api_url,
+        })
 
     # Return Config object
     config = Config(
@@ -147,10 +150,11 @@ def load_config(
     )
 
     # DEBUG LOGGING - Final config
-    debug_log("load_config - FINAL CONFIG", {
-        "project_dir": str(config.project_dir),
-        "enable_logging": config.enable_logging,
-        "api_url": config.api_url,
-    })
+    if ENABLE_DEBUG_LOGGING:
+        debug_log("load_config - FINAL CONFIG", {
+            "project_dir": str(config.project_dir),
+            "enable_logging": config.enable_logging,
+            "api_url": config.api_url,
+        })
 
     return config
@@ -23,13 +23,15 @@ import json
 import sys
 import logging
 
+import json_codec
+
 logger = logging.getLogger(__name__)
 
 # Current schema version - used by both runner (to build) and executor (to validate)
 SCHEMA_VERSION = "2.2"
 
 # Supported schema versions (no backward compat - all clients in monorepo)
-SUPPORTED_VERSIONS = {SCHEMA_VERSION}
+SUPPORTED_VERSIONS = frozenset({SCHEMA_VERSION})
 
 # JSON Schema for documentation and --schema flag
 INVOCATION_SCHEMA = {
@@ -94,14 +96,36 @@ INVOCATION_SCHEMA = {
     },
 }
 
-
-@dataclass
+# Validation constants derived once from INVOCATION_SCHEMA so from_json and the
+# published schema cannot drift apart (no jsonschema dependency for executors)
+_REQUIRED_FIELDS: tuple[str, ...] = tuple(INVOCATION_SCHEMA["required"])
+_REQUIRED_FIELD_SET = frozenset(_REQUIRED_FIELDS)
+_VALID_MODES: tuple[str, ...] = tuple(INVOCATION_SCHEMA["properties"]["mode"]["enum"])
+_SUPPORTED_VERSIONS_MSG = ", ".join(sorted(SUPPORTED_VERSIONS))
+_VALID_MODES_MSG = " or ".join(f"'{m}'" for m in _VALID_MODES)
+
+# Top-level fields understood by this parser (others are warned about and ignored)
+_KNOWN_FIELDS = frozenset({
+    "schema_version",
+    "mode",
+    "session_id",
+    "parameters",
+    "project_dir",
+    "agent_name",
+    "agent_blueprint",
+    "executor_config",
+    "metadata",
+})
+
+
+@dataclass(slots=True, frozen=True)
 class ExecutorInvocation:
     """
     Structured payload for ao-*-exec unified executor.
 
     The agent_blueprint contains the fully resolved blueprint
     (with placeholders like ${runner.orchestrator_mcp_url} resolved).
+    Invocations are immutable once parsed.
 
     Attributes:
         schema_version: Schema version for forward compatibility
@@ -144,16 +168,18 @@ class ExecutorInvocation:
         Raises:
             ValueError: If stdin is empty, JSON is invalid, or validation fails
         """
-        raw = sys.stdin.read()
+        # Read raw bytes: the JSON parser decodes UTF-8 itself, so going through
+        # the text wrapper would decode the (possibly large) payload twice
+        raw = sys.stdin.buffer.read()
         return cls.from_json(raw)
 
     @classmethod
-    def from_json(cls, raw: str) -> "ExecutorInvocation":
+    def from_json(cls, raw: str | bytes) -> "ExecutorInvocation":
         """
         Parse invocation from JSON string.
 
         Args:
-            raw: JSON string to parse
+            raw: JSON string or UTF-8 encoded bytes to parse
 
         Returns:
             ExecutorInvocation instance
@@ -165,28 +191,31 @@ class ExecutorInvocation:
             raise ValueError("No input received on stdin")
 
         try:
-            data = json.loads(raw)
-        except json.JSONDecodeError as e:
+            data = json_codec.loads(raw)
+        except (json_codec.JSONDecodeError, UnicodeDecodeError) as e:
             raise ValueError(f"Invalid JSON: {e}")
 
-        # Validate required fields
-        required_fields = ("schema_version", "mode", "session_id", "parameters")
-        for f in required_fields:
-            if f not in data:
-                raise ValueError(f"Missing required field: {f}")
+        if not isinstance(data, dict):
+            raise ValueError("Invalid JSON: expected an object")
+
+        # Validate required fields: one subset check in the common case; the
+        # loop only runs to name the first missing field in schema order
+        if not _REQUIRED_FIELD_SET <= data.keys():
+            for f in _REQUIRED_FIELDS:
+                if f not in data:
+                    raise ValueError(f"Missing required field: {f}")
 
         # Validate schema version
         if data["schema_version"] not in SUPPORTED_VERSIONS:
-            supported = ", ".join(sorted(SUPPORTED_VERSIONS))
             raise ValueError(
                 f"Unsupported schema version: {data['schema_version']}. "
-                f"Supported: {supported}"
+                f"Supported: {_SUPPORTED_VERSIONS_MSG}"
             )
 
         # Validate mode
-        if data["mode"] not in ("start", "resume"):
+        if data["mode"] not in _VALID_MODES:
             raise ValueError(
-                f"Invalid mode: {data['mode']}. Must be 'start' or 'resume'"
+                f"Invalid mode: {data['mode']}. Must be {_VALID_MODES_MSG}"
             )
 
         # Warn about ignored fields in resume mode
@@ -194,21 +223,12 @@ class ExecutorInvocation:
             if data.get("project_dir"):
                 logger.warning("Field 'project_dir' ignored in resume mode")
 
-        # Warn about unknown fields (forward compatibility)
-        known_fields = {
-            "schema_version",
-            "mode",
-            "session_id",
-            "parameters",
-            "project_dir",
-            "agent_name",
-            "agent_blueprint",
-            "executor_config",
-            "metadata",
-        }
-        for key in data.keys():
-            if key not in known_fields:
-                logger.warning(f"Unknown field '{key}' ignored")
+        # Warn about unknown fields (forward compatibility). The subset check
+        # covers the common all-known case; the loop keeps payload order.
+        if not data.keys() <= _KNOWN_FIELDS:
+            for key in data.keys():
+                if key not in _KNOWN_FIELDS:
+                    logger.warning("Unknown field '%s' ignored", key)
 
         return cls(
             schema_version=data["schema_version"],
@@ -246,6 +266,10 @@ class ExecutorInvocation:
         """Convert to JSON string."""
         return json.dumps(self.to_dict())
 
+    def to_json_bytes(self) -> bytes:
+        """Convert to compact UTF-8 encoded JSON bytes (for writing to a pipe)."""
+        return json_codec.dumps(self.to_dict())
+
     def log_summary(self) -> None:
         """
         Log invocation summary without sensitive data.
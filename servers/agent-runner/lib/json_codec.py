@@ -0,0 +1,46 @@
+"""
+JSON Codec
+
+Thin JSON shim shared by the runner and the ao-*-exec executors.
+
+Uses orjson when it is installed (serializes straight to UTF-8 bytes in C)
+and falls back to the stdlib json module otherwise, so orjson stays an
+optional speedup rather than a hard dependency of every executor script.
+
+orjson is stricter than the stdlib: it rejects lone surrogates ("\\ud800"
+escapes), non-str dict keys and NaN literals. Those inputs are retried with
+the stdlib so both backends accept the same data. One difference remains:
+orjson writes NaN/Infinity as null where the stdlib writes NaN/Infinity.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+# catch this single type regardless of the backend in use.
+JSONDecodeError = json.JSONDecodeError
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize obj to compact UTF-8 encoded JSON bytes."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            pass  # Lone surrogate or non-str key: let the stdlib handle it
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """Deserialize JSON from bytes or str."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # Lone surrogate escape or NaN: the stdlib decides
+    return json.loads(data)
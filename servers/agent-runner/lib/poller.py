@@ -5,20 +5,19 @@ Runs in a background thread, spawning subprocesses for each agent run.
 """
 
 import os
-import json
-import stat
 import threading
-import time
 import tarfile
+import tempfile
 import shutil
 import logging
-from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Callable, Optional
 
+import json_codec
 from api_client import CoordinatorAPIClient, Run, PollResult
 from executor import RunExecutor
-from registry import ProcessRegistry
+from registry import ProcessRegistry, ProcessReaper
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +35,19 @@ def get_scripts_dir() -> Path:
 # Number of consecutive connection failures before giving up
 MAX_CONNECTION_RETRIES = 3
 
+# Seconds a stopping executor gets to exit (after shutdown, then SIGTERM)
+# before escalating
+STOP_GRACE_SECONDS = 5.0
+
+# Max concurrent script downloads when a poll delivers several sync commands
+SCRIPT_SYNC_WORKERS = 4
+
+# File inside each synced script dir holding the coordinator's content ETag
+SCRIPT_ETAG_FILE = ".etag"
+
+# Max seconds a duplicate sync request waits for the in-flight sync it joins
+SCRIPT_SYNC_COALESCE_TIMEOUT = 60.0
+
 
 class RunPoller:
     """Background thread that polls for and executes agent runs."""
@@ -68,13 +80,31 @@ class RunPoller:
         self._backoff_seconds = 1.0
         self._max_backoff = 30.0
 
+        # Runs started since the last poll; reported on the next poll request
+        # (issued right after handling the run) instead of a separate POST.
+        # Only touched by the poll thread.
+        self._started_runs: list[str] = []
+
         # Callback for supervisor's stdout reader (set by agent-runner after creation)
         self._start_stdout_reader: Optional[Callable] = None
 
-        # Scripts directory for synced scripts
+        # Waits for stopped executors to exit without blocking the poll loop
+        self._reaper = ProcessReaper()
+        self._pending_stops = 0
+        self._stops_cond = threading.Condition()
+
+        # Scripts directory for synced scripts (created once here, not per sync)
         self._scripts_dir = get_scripts_dir()
         self._scripts_dir.mkdir(parents=True, exist_ok=True)
 
+        # Persistent pool for overlapping script downloads (threads start lazily)
+        self._sync_pool = ThreadPoolExecutor(
+            max_workers=SCRIPT_SYNC_WORKERS, thread_name_prefix="script-sync"
+        )
+        # In-flight syncs by script name; duplicates wait on the event
+        self._inflight_syncs: dict[str, threading.Event] = {}
+        self._inflight_lock = threading.Lock()
+
     def start(self) -> None:
         """Start the polling thread."""
         if self._thread is not None and self._thread.is_alive():
@@ -92,6 +122,7 @@ class RunPoller:
         if self._thread:
             self._thread.join(timeout=5.0)
             self._thread = None
+        self._sync_pool.shutdown(wait=False, cancel_futures=True)
         logger.info("Poller stopped")
 
     def _poll_loop(self) -> None:
@@ -100,7 +131,9 @@ class RunPoller:
 
         while not self._stop_event.is_set():
             try:
-                result = self.api_client.poll_run(self.runner_id)
+                result = self.api_client.poll_run(self.runner_id, started_runs=self._started_runs)
+                if result.started_reported:
+                    self._started_runs = []
 
                 # Successful connection - reset failure counter
                 consecutive_failures = 0
@@ -113,40 +146,50 @@ class RunPoller:
                         self.on_deregistered()
                     return  # Exit poll loop
 
-                # Handle stop commands
-                if result.stop_sessions:
-                    for session_id in result.stop_sessions:
-                        self._handle_stop(session_id)
-                    continue  # Check for more commands
+                # Commands arrive batched - apply all of them in one pass:
+                # stops first, then script sync/remove, then the run
+                for session_id in result.stop_sessions:
+                    self._handle_stop(session_id)
 
-                # Handle script sync commands
-                if result.sync_scripts or result.remove_scripts:
-                    for script_name in result.sync_scripts:
-                        self._handle_script_sync(script_name)
-                    for script_name in result.remove_scripts:
-                        self._handle_script_remove(script_name)
-                    continue  # Check for more commands
+                # Downloads overlap in the sync pool; wait for all of them so a
+                # run in the same batch sees its scripts
+                list(self._sync_pool.map(self._handle_script_sync, result.sync_scripts))
+                for script_name in result.remove_scripts:
+                    self._handle_script_remove(script_name)
 
                 if result.run:
                     self._handle_run(result.run)
 
             except Exception as e:
                 consecutive_failures += 1
-                logger.error(f"Poll error ({consecutive_failures}/{MAX_CONNECTION_RETRIES}): {e}")
+                logger.error("Poll error (%s/%s): %s", consecutive_failures, MAX_CONNECTION_RETRIES, e)
 
                 if consecutive_failures >= MAX_CONNECTION_RETRIES:
-                    logger.error(f"Agent Coordinator unreachable after {MAX_CONNECTION_RETRIES} attempts - shutting down")
+                    logger.error("Agent Coordinator unreachable after %s attempts - shutting down", MAX_CONNECTION_RETRIES)
                     if self.on_deregistered:
                         self.on_deregistered()
                     return  # Exit poll loop
 
-                # Backoff before retry
-                time.sleep(self._backoff_seconds)
+                # Backoff before retry (returns early if stop() is called)
+                if self._stop_event.wait(self._backoff_seconds):
+                    break
                 self._backoff_seconds = min(self._backoff_seconds * 2, self._max_backoff)
 
+        # Stopped: starts queued for the next poll would otherwise be lost
+        self._report_started_runs()
+
+    def _report_started_runs(self) -> None:
+        """Report runs still queued for the next poll, one request each."""
+        started_runs, self._started_runs = self._started_runs, []
+        for run_id in started_runs:
+            try:
+                self.api_client.report_started(self.runner_id, run_id)
+            except Exception as e:
+                logger.error("Failed to report run %s as started: %s", run_id, e)
+
     def _handle_run(self, run: Run) -> None:
         """Handle a received agent run by spawning subprocess or routing to existing process."""
-        logger.debug(f"Received agent run {run.run_id}: type={run.type}, session={run.session_id}")
+        logger.debug("Received agent run %s: type=%s, session=%s", run.run_id, run.type, run.session_id)
 
         try:
             # Resume routing for persistent sessions
@@ -177,15 +220,15 @@ class RunPoller:
             if self.executor.is_persistent and self._start_stdout_reader:
                 self._start_stdout_reader(run.session_id, process)
 
-            self.api_client.report_started(self.runner_id, run.run_id)
-            logger.debug(f"Agent run {run.run_id} started (pid={process.pid})")
+            self._started_runs.append(run.run_id)
+            logger.debug("Agent run %s started (pid=%s)", run.run_id, process.pid)
 
         except Exception as e:
-            logger.error(f"Failed to start agent run {run.run_id}: {e}")
+            logger.error("Failed to start agent run %s: %s", run.run_id, e)
             try:
                 self.api_client.report_failed(self.runner_id, run.run_id, str(e))
             except Exception:
-                logger.error(f"Failed to report agent run failure for {run.run_id}")
+                logger.error("Failed to report agent run failure for %s", run.run_id)
 
     def _route_resume(self, run: Run, entry) -> None:
         """Route a resume turn to an existing persistent process."""
@@ -202,8 +245,8 @@ class RunPoller:
         try:
             self.registry.swap_run(run.session_id, run.run_id)
             self.executor.send_turn(entry.process, run)
-            self.api_client.report_started(self.runner_id, run.run_id)
-            logger.info(f"Resumed session {run.session_id} with run {run.run_id}")
+            self._started_runs.append(run.run_id)
+            logger.info("Resumed session %s with run %s", run.session_id, run.run_id)
         except BrokenPipeError:
             self.registry.remove_session(run.session_id)
             self.api_client.report_failed(
@@ -212,131 +255,227 @@ class RunPoller:
             )
 
     def _handle_stop(self, session_id: str) -> None:
-        """Stop a session by terminating its executor process."""
+        """Stop a session by terminating its executor process.
+
+        Only sends the shutdown/SIGTERM here; the process reaper waits for
+        the exit, escalates to SIGKILL after STOP_GRACE_SECONDS and reports,
+        so several stops in one poll batch proceed concurrently.
+        """
         entry = self.registry.get_session(session_id)
 
         if not entry:
-            logger.debug(f"Stop command for session {session_id} ignored - no live process")
+            logger.debug("Stop command for session %s ignored - no live process", session_id)
             return
 
         run_id = entry.current_run_id  # May be None if between turns
-        logger.info(f"Stopping session {session_id} (run={run_id}, pid={entry.process.pid})")
+        logger.info("Stopping session %s (run=%s, pid=%s)", session_id, run_id, entry.process.pid)
 
         # Mark as stopping so supervisor skips reporting for this session
         self.registry.mark_stopping(session_id)
-
-        signal_used = "SIGTERM"
+        with self._stops_cond:
+            self._pending_stops += 1
 
         try:
             # For persistent processes: try graceful shutdown first
             if entry.persistent:
                 try:
                     self.executor.send_shutdown(entry.process)
-                    entry.process.wait(timeout=5)
-                    signal_used = "shutdown"
                 except Exception:
                     pass  # Fall through to SIGTERM
+                else:
+                    self._reaper.watch(
+                        entry.process,
+                        lambda exited: self._after_shutdown(session_id, run_id, entry, exited),
+                        STOP_GRACE_SECONDS,
+                    )
+                    return
 
-            # SIGTERM path (or first attempt for one-shot)
-            if entry.process.poll() is None:
-                entry.process.terminate()
-                try:
-                    entry.process.wait(timeout=5)
-                except Exception:
-                    entry.process.kill()
-                    signal_used = "SIGKILL"
-                    logger.warning(f"Session {session_id} did not respond to SIGTERM, sent SIGKILL")
+            self._terminate(session_id, run_id, entry)
+        except Exception as e:
+            logger.error("Error stopping session %s: %s", session_id, e)
+            self._stop_done()
 
-            # Remove from registry
-            self.registry.remove_session(session_id)
+    def wait_for_stops(self, timeout: float) -> bool:
+        """Block until all stops started by _handle_stop have been reported.
 
-            # Report back using run_id if there was an active run
-            if run_id:
-                try:
-                    self.api_client.report_stopped(self.runner_id, run_id, signal=signal_used)
-                    logger.info(f"Session {session_id} stopped (run={run_id}, signal={signal_used})")
-                except Exception as e:
-                    logger.error(f"Failed to report stopped for run {run_id}: {e}")
-            else:
-                # Session was idle between turns — report based on how it exited
-                end_status = "finished" if signal_used == "shutdown" else "stopped"
-                try:
-                    self.api_client.report_session_status(self.runner_id, session_id, end_status)
-                    logger.info(f"Idle session {session_id} {end_status} (signal={signal_used})")
-                except Exception as e:
-                    logger.error(f"Failed to report {end_status} for idle session {session_id}: {e}")
+        Returns:
+            True if all stops finished, False on timeout
+        """
+        with self._stops_cond:
+            return self._stops_cond.wait_for(lambda: self._pending_stops == 0, timeout)
+
+    def _stop_done(self) -> None:
+        """Count one stop as finished and wake wait_for_stops."""
+        with self._stops_cond:
+            self._pending_stops -= 1
+            self._stops_cond.notify_all()
+
+    def _after_shutdown(self, session_id: str, run_id: Optional[str], entry, exited: bool) -> None:
+        """Graceful shutdown wait finished: done, or fall through to SIGTERM."""
+        if exited:
+            self._finish_stop(session_id, run_id, "shutdown")
+        else:
+            self._terminate(session_id, run_id, entry)
+
+    def _terminate(self, session_id: str, run_id: Optional[str], entry) -> None:
+        """SIGTERM the executor (if still running) and wait for it on the reaper."""
+        if entry.process.poll() is not None:
+            self._finish_stop(session_id, run_id, "SIGTERM")
+            return
 
-        except Exception as e:
-            logger.error(f"Error stopping session {session_id}: {e}")
+        entry.process.terminate()
+        self._reaper.watch(
+            entry.process,
+            lambda exited: self._after_terminate(session_id, run_id, entry, exited),
+            STOP_GRACE_SECONDS,
+        )
+
+    def _after_terminate(self, session_id: str, run_id: Optional[str], entry, exited: bool) -> None:
+        """SIGTERM wait finished: escalate to SIGKILL if still running, then report."""
+        signal_used = "SIGTERM"
+        if not exited:
+            entry.process.kill()
+            signal_used = "SIGKILL"
+            logger.warning("Session %s did not respond to SIGTERM, sent SIGKILL", session_id)
+        self._finish_stop(session_id, run_id, signal_used)
+
+    def _finish_stop(self, session_id: str, run_id: Optional[str], signal_used: str) -> None:
+        """Report a stopped session and mark the stop finished."""
+        try:
+            self._report_stopped(session_id, run_id, signal_used)
+        finally:
+            self._stop_done()
+
+    def _report_stopped(self, session_id: str, run_id: Optional[str], signal_used: str) -> None:
+        """Remove a stopped session from the registry and report how it ended."""
+        self.registry.remove_session(session_id)
+
+        # Report back using run_id if there was an active run
+        if run_id:
+            try:
+                self.api_client.report_stopped(self.runner_id, run_id, signal=signal_used)
+                logger.info("Session %s stopped (run=%s, signal=%s)", session_id, run_id, signal_used)
+            except Exception as e:
+                logger.error("Failed to report stopped for run %s: %s", run_id, e)
+        else:
+            # Session was idle between turns — report based on how it exited
+            end_status = "finished" if signal_used == "shutdown" else "stopped"
+            try:
+                self.api_client.report_session_status(self.runner_id, session_id, end_status)
+                logger.info("Idle session %s %s (signal=%s)", session_id, end_status, signal_used)
+            except Exception as e:
+                logger.error("Failed to report %s for idle session %s: %s", end_status, session_id, e)
 
     def _handle_script_sync(self, script_name: str) -> None:
-        """Download and extract a script from the coordinator."""
-        logger.info(f"Syncing script: {script_name}")
+        """Sync a script, coalescing with a sync of the same script already in flight.
+
+        A duplicate request waits (bounded) for the running sync instead of
+        downloading and extracting the same script again.
+        """
+        with self._inflight_lock:
+            inflight = self._inflight_syncs.get(script_name)
+            if inflight is None:
+                self._inflight_syncs[script_name] = done = threading.Event()
+
+        if inflight is not None:
+            logger.debug("Sync already in flight, waiting for it: %s", script_name)
+            if not inflight.wait(SCRIPT_SYNC_COALESCE_TIMEOUT):
+                logger.warning("Timed out waiting for in-flight sync of %s", script_name)
+            return
 
         try:
-            # Download the script tarball
-            tarball = self.api_client.download_script(script_name)
-            if not tarball:
-                logger.error(f"Failed to download script {script_name}")
-                return
+            self._sync_script(script_name)
+        finally:
+            with self._inflight_lock:
+                del self._inflight_syncs[script_name]
+            done.set()
 
-            logger.debug(f"Downloaded tarball for {script_name}: {len(tarball)} bytes")
+    def _sync_script(self, script_name: str) -> None:
+        """Download and extract a script from the coordinator."""
+        logger.info("Syncing script: %s", script_name)
 
-            # Ensure scripts directory exists
-            self._scripts_dir.mkdir(parents=True, exist_ok=True)
+        script_dir = self._scripts_dir / script_name
+        etag_path = script_dir / SCRIPT_ETAG_FILE
+        staging_dir = None
 
-            # Extract to scripts directory
-            script_dir = self._scripts_dir / script_name
+        try:
+            # ETag of the installed version lets the coordinator answer 304
+            try:
+                local_etag = etag_path.read_text().strip() or None
+            except FileNotFoundError:
+                local_etag = None
 
-            # Remove existing script directory if it exists
+            with self.api_client.download_script_stream(script_name, etag=local_etag) as download:
+                if download is None:
+                    logger.error("Failed to download script %s", script_name)
+                    return
+                if download.not_modified:
+                    logger.info("Script up to date: %s", script_name)
+                    return
+                stream = download.stream
+
+                # Extract while downloading (stream mode "r|gz": one pass, no full
+                # in-memory copy). Extract into a staging dir next to the target
+                # so a failed download leaves the current version untouched.
+                staging_dir = Path(tempfile.mkdtemp(prefix=f".{script_name}-", dir=self._scripts_dir))
+                with tarfile.open(fileobj=stream, mode="r|gz") as tar:
+                    # filter='tar' for security: blocks dangerous paths but allows directory creation
+                    tar.extractall(path=staging_dir, filter='tar')
+                    # Log tarball contents for debugging (member list only built when enabled)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Tarball contains: %s", tar.getnames())
+
+            # Swap in the new version (tarball contains script_name/ prefix).
+            # The ETag is written before the swap so it lands atomically with it.
+            extracted_dir = staging_dir / script_name
+            if not extracted_dir.is_dir():
+                logger.error("Extraction failed: %s/ not found in tarball", script_name)
+                return
+            if download.etag:
+                (extracted_dir / SCRIPT_ETAG_FILE).write_text(download.etag)
             if script_dir.exists():
                 shutil.rmtree(script_dir)
+            os.replace(extracted_dir, script_dir)
 
-            # Extract tarball (contains script_name/ prefix, extracts to scripts/script_name/)
-            with tarfile.open(fileobj=BytesIO(tarball), mode="r:gz") as tar:
-                # Log tarball contents for debugging
-                members = tar.getnames()
-                logger.debug(f"Tarball contains: {members}")
-                # filter='tar' for security: blocks dangerous paths but allows directory creation
-                tar.extractall(path=self._scripts_dir, filter='tar')
-
-            # Verify extraction succeeded
+            # Read script.json to get script_file and make it executable
+            # (opened directly: a missing file means extraction failed)
             script_json_path = script_dir / "script.json"
-            if not script_json_path.exists():
-                logger.error(f"Extraction failed: {script_json_path} not found after extraction")
+            try:
+                script_meta = json_codec.loads(script_json_path.read_bytes())
+            except FileNotFoundError:
+                logger.error("Extraction failed: %s not found after extraction", script_json_path)
                 return
 
-            # Read script.json to get script_file and make it executable
-            with open(script_json_path, "r") as f:
-                script_meta = json.load(f)
-
             script_file = script_meta.get("script_file")
             if script_file:
                 script_file_path = script_dir / script_file
-                if script_file_path.exists():
-                    # Add executable permission (owner, group, others)
-                    current_mode = script_file_path.stat().st_mode
-                    script_file_path.chmod(current_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
-                    logger.debug(f"Made script executable: {script_file_path}")
-                else:
-                    logger.warning(f"Script file not found: {script_file_path}")
+                try:
+                    # Freshly extracted file: set rwxr-xr-x directly (one syscall,
+                    # no stat/exists round trip)
+                    os.chmod(script_file_path, 0o755)
+                    logger.debug("Made script executable: %s", script_file_path)
+                except FileNotFoundError:
+                    logger.warning("Script file not found: %s", script_file_path)
 
-            logger.info(f"Script synced: {script_name} -> {script_dir}")
+            logger.info("Script synced: %s -> %s", script_name, script_dir)
 
         except Exception as e:
-            logger.error(f"Error syncing script {script_name}: {e}", exc_info=True)
+            logger.error("Error syncing script %s: %s", script_name, e, exc_info=True)
+        finally:
+            if staging_dir is not None:
+                shutil.rmtree(staging_dir, ignore_errors=True)
 
     def _handle_script_remove(self, script_name: str) -> None:
         """Remove a script from the local scripts directory."""
-        logger.info(f"Removing script: {script_name}")
+        logger.info("Removing script: %s", script_name)
 
         try:
             script_dir = self._scripts_dir / script_name
             if script_dir.exists():
                 shutil.rmtree(script_dir)
-                logger.info(f"Script removed: {script_name}")
+                logger.info("Script removed: %s", script_name)
             else:
-                logger.debug(f"Script not found locally, nothing to remove: {script_name}")
+                logger.debug("Script not found locally, nothing to remove: %s", script_name)
 
         except Exception as e:
-            logger.error(f"Error removing script {script_name}: {e}")
+            logger.error("Error removing script %s: %s", script_name, e)
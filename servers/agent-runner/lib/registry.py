@@ -4,13 +4,148 @@ Process Registry - tracks live executor processes by session.
 Thread-safe storage with dual indexing:
   - Primary: session_id -> SessionProcess
   - Secondary: run_id -> session_id (reverse lookup)
+
+Also provides ProcessReaper, which waits for executor exits on a single
+background thread (used when stopping sessions).
 """
 
+import logging
+import os
+import select
 import subprocess
 import threading
+import time
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Optional
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _open_child_pidfd(process: subprocess.Popen) -> Optional[int]:
+    """Open a pidfd for process, or None if one cannot be waited on here.
+
+    None covers platforms without pidfd_open/epoll, processes that are
+    already reaped or are not our children, and pre-5.4 kernels that
+    reject waitid(P_PIDFD).
+    """
+    if not hasattr(select, "epoll"):
+        return None
+    try:
+        pidfd = os.pidfd_open(process.pid)
+    except (AttributeError, OSError):
+        return None
+    try:
+        # Only children can be reaped by Popen.wait; WNOWAIT leaves the status alone
+        os.waitid(os.P_PIDFD, pidfd, os.WEXITED | os.WNOHANG | os.WNOWAIT)
+    except OSError:
+        os.close(pidfd)
+        return None
+    return pidfd
+
+
+@dataclass
+class _ExitWatch:
+    """A process the reaper is waiting on."""
+    process: subprocess.Popen
+    on_exit: Callable[[bool], None]
+    deadline: float
+
+
+class ProcessReaper:
+    """Waits for process exits on a single background thread.
+
+    Each watched process is a pidfd registered with one epoll instance, so
+    any number of pending stops costs one sleeping thread and no polling.
+    The thread starts on the first watch. Where pidfds are unavailable
+    (non-Linux, processes that are not our children) watch() falls back to
+    a blocking Popen.wait on the caller's thread.
+    """
+
+    def __init__(self):
+        self._watches: dict[int, _ExitWatch] = {}  # pidfd -> watch
+        self._lock = threading.Lock()
+        self._epoll: Optional["select.epoll"] = None
+        self._wake_r = -1
+        self._wake_w = -1
+
+    def watch(
+        self,
+        process: subprocess.Popen,
+        on_exit: Callable[[bool], None],
+        timeout: float,
+    ) -> None:
+        """Call on_exit once process exits or timeout seconds pass.
+
+        on_exit(True) means the process exited and has been reaped
+        (returncode is set); on_exit(False) means it is still running.
+        The callback runs on the reaper thread (or inline on fallback).
+        """
+        pidfd = _open_child_pidfd(process)
+        if pidfd is None:
+            try:
+                process.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                on_exit(False)
+            else:
+                on_exit(True)
+            return
+
+        with self._lock:
+            if self._epoll is None:
+                self._start()
+            self._watches[pidfd] = _ExitWatch(process, on_exit, time.monotonic() + timeout)
+            self._epoll.register(pidfd, select.EPOLLIN)
+        self._wake()
+
+    def _start(self) -> None:
+        """Create the epoll instance and wake pipe, start the thread (lock held)."""
+        self._epoll = select.epoll()
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_w, False)
+        self._epoll.register(self._wake_r, select.EPOLLIN)
+        threading.Thread(target=self._reap_loop, name="process-reaper", daemon=True).start()
+
+    def _wake(self) -> None:
+        """Interrupt epoll.poll so the loop picks up a new deadline."""
+        try:
+            os.write(self._wake_w, b"\0")
+        except BlockingIOError:
+            pass  # A wakeup is already pending
+
+    def _reap_loop(self) -> None:
+        """Block until a watched process exits or the nearest deadline passes."""
+        while True:
+            with self._lock:
+                deadline = min((w.deadline for w in self._watches.values()), default=None)
+            timeout = -1 if deadline is None else max(0.0, deadline - time.monotonic())
+
+            events = self._epoll.poll(timeout)
+
+            fired: list[tuple[_ExitWatch, bool]] = []
+            with self._lock:
+                for fd, _ in events:
+                    if fd == self._wake_r:
+                        os.read(self._wake_r, 4096)
+                    elif fd in self._watches:
+                        fired.append((self._unwatch(fd), True))
+                now = time.monotonic()
+                for fd in [fd for fd, w in self._watches.items() if w.deadline <= now]:
+                    fired.append((self._unwatch(fd), False))
+
+            for watch, exited in fired:
+                try:
+                    if exited:
+                        watch.process.wait()  # Already exited: reaps immediately
+                    watch.on_exit(exited)
+                except Exception as e:
+                    logger.error(f"Process exit callback failed (pid={watch.process.pid}): {e}")
+
+    def _unwatch(self, pidfd: int) -> _ExitWatch:
+        """Drop a watch and close its pidfd (lock held)."""
+        watch = self._watches.pop(pidfd)
+        self._epoll.unregister(pidfd)
+        os.close(pidfd)
+        return watch
 
 
 @dataclass
@@ -18,7 +153,7 @@ class SessionProcess:
     """A live executor process serving a session."""
     process: subprocess.Popen
     session_id: str
-    started_at: datetime
+    started_at_ns: int  # time.monotonic_ns() at registration, for age calculations
     persistent: bool = False
     current_run_id: Optional[str] = None
 
@@ -28,6 +163,10 @@ class ProcessRegistry:
 
     Primary index is session_id (one process per session).
     Secondary index maps run_id -> session_id for lookups by run.
+
+    Writes and reads spanning both indexes (or iterating) take the lock.
+    Single-key reads (get_session, is_stopping, count) are one dict/set
+    operation, atomic under the GIL, and skip it.
     """
 
     def __init__(self):
@@ -35,6 +174,8 @@ class ProcessRegistry:
         self._run_index: dict[str, str] = {}
         self._stopping: set[str] = set()  # sessions being stopped by poller
         self._lock = threading.Lock()
+        # Called with the session_id after each registration (set by RunSupervisor)
+        self.on_register: Optional[Callable[[str], None]] = None
 
     def register_session(
         self,
@@ -47,18 +188,19 @@ class ProcessRegistry:
         entry = SessionProcess(
             process=process,
             session_id=session_id,
-            started_at=datetime.now(),
+            started_at_ns=time.monotonic_ns(),
             persistent=persistent,
             current_run_id=run_id,
         )
         with self._lock:
             self._sessions[session_id] = entry
             self._run_index[run_id] = session_id
+        if self.on_register is not None:
+            self.on_register(session_id)
 
     def get_session(self, session_id: str) -> Optional[SessionProcess]:
-        """Look up a session by session_id."""
-        with self._lock:
-            return self._sessions.get(session_id)
+        """Look up a session by session_id (lock-free single-key read)."""
+        return self._sessions.get(session_id)
 
     def get_session_by_run(self, run_id: str) -> Optional[SessionProcess]:
         """Look up a session via the run index."""
@@ -106,9 +248,8 @@ class ProcessRegistry:
             self._stopping.add(session_id)
 
     def is_stopping(self, session_id: str) -> bool:
-        """Check if a session is being stopped by the poller."""
-        with self._lock:
-            return session_id in self._stopping
+        """Check if a session is being stopped by the poller (lock-free read)."""
+        return session_id in self._stopping
 
     def remove_session(self, session_id: str) -> Optional[SessionProcess]:
         """Remove a session from both indexes.
@@ -128,6 +269,5 @@ class ProcessRegistry:
             return dict(self._sessions)
 
     def count(self) -> int:
-        """Get the number of active sessions."""
-        with self._lock:
-            return len(self._sessions)
+        """Get the number of active sessions (lock-free read)."""
+        return len(self._sessions)
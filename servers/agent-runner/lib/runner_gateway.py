@@ -20,6 +20,7 @@ directories), so it's provided by the executor, not the runner.
 Routes:
 - POST /bind         - Bind executor to session (runner enriches with hostname, executor_profile)
 - POST /events       - Add event to session (forwarded to coordinator)
+- POST /events/batch - Add several events to one session in a single request
 - PATCH /metadata    - Update session metadata (runner enriches if needed)
 - /* (other)         - Forward to coordinator as-is (health checks, etc.)
 
@@ -30,102 +31,181 @@ Usage:
 """
 
 import http.server
-import json
 import logging
-import socketserver
+import os
+import queue
+import socket
 import threading
-import urllib.request
-import urllib.error
-from typing import Optional, TYPE_CHECKING
+from typing import Iterator, Optional, TYPE_CHECKING
+
+import httpx
+
+import json_codec
 
 if TYPE_CHECKING:
     from auth0_client import Auth0M2MClient
 
 logger = logging.getLogger(__name__)
 
+# Connections kept open to the coordinator for concurrent executor requests
+GATEWAY_POOL_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+
+# Chunk size when streaming forwarded bodies (both directions); request
+# bodies up to this size are buffered instead
+FORWARD_CHUNK_SIZE = 64 * 1024
+
+# Request worker threads (reused across requests instead of one thread each)
+ENV_GATEWAY_WORKERS = "AGENT_GATEWAY_WORKERS"
+DEFAULT_GATEWAY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def _gateway_workers() -> int:
+    """Resolve the worker pool size from the environment."""
+    value = os.environ.get(ENV_GATEWAY_WORKERS)
+    if not value:
+        return DEFAULT_GATEWAY_WORKERS
+    try:
+        return max(1, int(value))
+    except ValueError:
+        logger.warning(f"Invalid {ENV_GATEWAY_WORKERS}={value!r}, using {DEFAULT_GATEWAY_WORKERS}")
+        return DEFAULT_GATEWAY_WORKERS
+
+
+# Marks per-request cached values that have not been computed yet
+_UNSET = object()
+
 
 class RunnerGatewayHandler(http.server.BaseHTTPRequestHandler):
     """HTTP request handler for the Runner Gateway."""
 
-    # Class-level configuration (set by RunnerGateway before starting)
+    # Class-level configuration (set by RunnerGateway before starting).
+    # Requests use coordinator_url + path: httpx parses an absolute URL
+    # noticeably faster than it joins a relative one onto base_url.
     coordinator_url: str = ""
     auth0_client: Optional["Auth0M2MClient"] = None
+    # Pooled keep-alive client to the coordinator, shared by all request threads
+    http_client: Optional[httpx.Client] = None
+
+    # Socket timeout for reading the executor's request and writing the
+    # reply, so a stalled executor cannot hold a worker indefinitely
+    timeout = 30.0
+
+    # Buffer responses so the status line, headers and a small body go out
+    # in one send(); BaseHTTPRequestHandler flushes after each request
+    wbufsize = 16 * 1024
 
     # Runner-owned data (injected into executor requests)
     hostname: str = ""
     executor_profile: str = ""
+    # hostname/executor_profile pre-encoded as JSON members (no braces),
+    # spliced into every bind body
+    bind_runner_fields: bytes = b""
 
     def log_message(self, format: str, *args) -> None:
         """Override to use our logger instead of stderr."""
         logger.debug(f"Gateway: {format % args}")
 
+    def handle_one_request(self) -> None:
+        """Handle one request, resetting per-request cached state first."""
+        self._auth_header = _UNSET
+        super().handle_one_request()
+
     def _get_auth_header(self) -> Optional[str]:
+        """Get authorization header value, resolved at most once per request."""
+        if self._auth_header is _UNSET:
+            self._auth_header = self._resolve_auth_header()
+        return self._auth_header
+
+    def _resolve_auth_header(self) -> Optional[str]:
         """Get authorization header value from Auth0 M2M client."""
         if self.auth0_client and self.auth0_client.is_configured:
-            token = self.auth0_client.get_access_token()
-            if token:
-                return f"Bearer {token}"
+            auth_header = self.auth0_client.get_authorization_header()
+            if auth_header:
+                return auth_header
             logger.warning("Auth0 configured but failed to get token")
         return None
 
+    def _content_length(self) -> int:
+        """Return the request's Content-Length (0 when absent)."""
+        content_length = self.headers.get("Content-Length")
+        return int(content_length) if content_length else 0
+
     def _read_body(self) -> Optional[bytes]:
         """Read request body if present."""
-        content_length = self.headers.get("Content-Length")
-        if content_length:
-            return self.rfile.read(int(content_length))
-        return None
+        length = self._content_length()
+        return self.rfile.read(length) if length > 0 else None
+
+    def _iter_body(self, length: int) -> Iterator[bytes]:
+        """Yield exactly length bytes of the request body in chunks."""
+        remaining = length
+        while remaining > 0:
+            chunk = self.rfile.read(min(remaining, FORWARD_CHUNK_SIZE))
+            if not chunk:
+                return
+            remaining -= len(chunk)
+            yield chunk
 
     def _send_json_response(self, status: int, data: dict) -> None:
         """Send a JSON response."""
-        body = json.dumps(data).encode("utf-8")
+        body = json_codec.dumps(data)
         self.send_response(status)
         self.send_header("Content-Type", "application/json")
         self.send_header("Content-Length", str(len(body)))
         self.end_headers()
         self.wfile.write(body)
 
+    def _send_raw_response(self, status: int, body: bytes, content_type: str) -> None:
+        """Send an already-encoded response body."""
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
     def _call_coordinator(
         self,
         method: str,
         path: str,
-        body: Optional[dict] = None,
-    ) -> tuple[int, dict]:
+        body: Optional[dict | bytes] = None,
+    ) -> tuple[int, bytes, str]:
         """
         Call the Agent Coordinator API.
 
+        The coordinator's response body is returned undecoded so it can be
+        relayed to the executor without a parse/re-encode round-trip.
+
+        Args:
+            body: JSON payload as a dict, or as already-encoded bytes
+
         Returns:
-            Tuple of (status_code, response_dict)
+            Tuple of (status_code, body_bytes, content_type)
         """
-        target_url = f"{self.coordinator_url}{path}"
-
+        headers = {}
         data = None
         if body is not None:
-            data = json.dumps(body).encode("utf-8")
-
-        request = urllib.request.Request(target_url, method=method, data=data)
+            data = body if isinstance(body, bytes) else json_codec.dumps(body)
+            headers["Content-Type"] = "application/json"
 
         # Add auth header
         auth_header = self._get_auth_header()
         if auth_header:
-            request.add_header("Authorization", auth_header)
-
-        # Add content-type for JSON
-        if data:
-            request.add_header("Content-Type", "application/json")
+            headers["Authorization"] = auth_header
 
         try:
-            with urllib.request.urlopen(request, timeout=30) as response:
-                response_body = response.read()
-                return response.status, json.loads(response_body) if response_body else {}
-        except urllib.error.HTTPError as e:
-            error_body = e.read()
-            try:
-                return e.code, json.loads(error_body)
-            except json.JSONDecodeError:
-                return e.code, {"detail": error_body.decode("utf-8", errors="replace")}
-        except urllib.error.URLError as e:
+            response = self.http_client.request(
+                method, self.coordinator_url + path, content=data, headers=headers
+            )
+        except httpx.RequestError as e:
             logger.error(f"Failed to connect to coordinator: {e}")
-            return 502, {"detail": f"Failed to connect to Agent Coordinator: {e.reason}"}
+            error = {"detail": f"Failed to connect to Agent Coordinator: {e}"}
+            return 502, json_codec.dumps(error), "application/json"
+
+        # Executors always expect a JSON object, so an empty body becomes {}
+        return (
+            response.status_code,
+            response.content or b"{}",
+            response.headers.get("Content-Type", "application/json"),
+        )
 
     # =========================================================================
     # Runner-handled routes
@@ -145,8 +225,8 @@ class RunnerGatewayHandler(http.server.BaseHTTPRequestHandler):
             return
 
         try:
-            data = json.loads(body)
-        except json.JSONDecodeError as e:
+            data = json_codec.loads(body)
+        except json_codec.JSONDecodeError as e:
             self._send_json_response(400, {"detail": f"Invalid JSON: {e}"})
             return
 
@@ -161,17 +241,19 @@ class RunnerGatewayHandler(http.server.BaseHTTPRequestHandler):
             self._send_json_response(400, {"detail": "executor_session_id required"})
             return
 
-        # Build enriched payload with runner-owned data
-        enriched_payload = {
-            "executor_session_id": executor_session_id,
-            "hostname": self.hostname,
-            "executor_profile": self.executor_profile,
-        }
+        # Executor-owned fields
+        executor_payload = {"executor_session_id": executor_session_id}
 
         # Add project_dir if provided by executor (per-invocation, not runner-owned)
         project_dir = data.get("project_dir")
         if project_dir:
-            enriched_payload["project_dir"] = project_dir
+            executor_payload["project_dir"] = project_dir
+
+        # Enrich with runner-owned data: splice the pre-encoded fields into
+        # the object instead of re-encoding them on every bind
+        enriched_payload = (
+            json_codec.dumps(executor_payload)[:-1] + b"," + self.bind_runner_fields + b"}"
+        )
 
         logger.debug(
             f"Bind session {session_id}: executor_session_id={executor_session_id}, "
@@ -179,13 +261,13 @@ class RunnerGatewayHandler(http.server.BaseHTTPRequestHandler):
         )
 
         # Forward to coordinator
-        status, response = self._call_coordinator(
+        status, response, content_type = self._call_coordinator(
             "POST",
             f"/sessions/{session_id}/bind",
             enriched_payload,
         )
 
-        self._send_json_response(status, response)
+        self._send_raw_response(status, response, content_type)
 
     def _handle_events(self) -> None:
         """
@@ -193,8 +275,6 @@ class RunnerGatewayHandler(http.server.BaseHTTPRequestHandler):
 
         Executor sends: {session_id, event_type, ...event_data}
         Forwards to: POST /sessions/{session_id}/events
-
-        Future: Could batch events, add runner context, etc.
         """
         body = self._read_body()
         if not body:
@@ -202,8 +282,8 @@ class RunnerGatewayHandler(http.server.BaseHTTPRequestHandler):
             return
 
         try:
-            data = json.loads(body)
-        except json.JSONDecodeError as e:
+            data = json_codec.loads(body)
+        except json_codec.JSONDecodeError as e:
             self._send_json_response(400, {"detail": f"Invalid JSON: {e}"})
             return
 
@@ -212,14 +292,49 @@ class RunnerGatewayHandler(http.server.BaseHTTPRequestHandler):
             self._send_json_response(400, {"detail": "session_id required"})
             return
 
-        # Forward event to coordinator (session_id is in both path and body)
-        status, response = self._call_coordinator(
+        # Forward the event bytes unchanged (session_id is in both path and
+        # body); only session_id was needed from the parsed copy
+        status, response, content_type = self._call_coordinator(
             "POST",
             f"/sessions/{session_id}/events",
-            data,
+            body,
         )
 
-        self._send_json_response(status, response)
+        self._send_raw_response(status, response, content_type)
+
+    def _handle_events_batch(self) -> None:
+        """
+        Handle POST /events/batch - Add several events to one session.
+
+        Executor sends: {session_id, events: [...]}
+        Forwards to: POST /sessions/{session_id}/events/batch
+
+        The body is forwarded unchanged; the coordinator ignores the extra
+        top-level session_id.
+        """
+        body = self._read_body()
+        if not body:
+            self._send_json_response(400, {"detail": "Request body required"})
+            return
+
+        try:
+            data = json_codec.loads(body)
+        except json_codec.JSONDecodeError as e:
+            self._send_json_response(400, {"detail": f"Invalid JSON: {e}"})
+            return
+
+        session_id = data.get("session_id")
+        if not session_id:
+            self._send_json_response(400, {"detail": "session_id required"})
+            return
+
+        status, response, content_type = self._call_coordinator(
+            "POST",
+            f"/sessions/{session_id}/events/batch",
+            body,
+        )
+
+        self._send_raw_response(status, response, content_type)
 
     def _handle_metadata(self) -> None:
         """
@@ -235,27 +350,35 @@ class RunnerGatewayHandler(http.server.BaseHTTPRequestHandler):
             return
 
         try:
-            data = json.loads(body)
-        except json.JSONDecodeError as e:
+            data = json_codec.loads(body)
+        except json_codec.JSONDecodeError as e:
             self._send_json_response(400, {"detail": f"Invalid JSON: {e}"})
             return
 
-        session_id = data.get("session_id")
+        # Remove session_id from the payload, as it's in the path
+        session_id = data.pop("session_id", None)
         if not session_id:
             self._send_json_response(400, {"detail": "session_id required"})
             return
 
-        # Build payload (remove session_id as it's in the path)
-        payload = {k: v for k, v in data.items() if k != "session_id"}
-
         # Forward to coordinator
-        status, response = self._call_coordinator(
+        status, response, content_type = self._call_coordinator(
             "PATCH",
             f"/sessions/{session_id}/metadata",
-            payload,
+            data,
         )
 
-        self._send_json_response(status, response)
+        self._send_raw_response(status, response, content_type)
+
+    # Runner-handled routes by method; anything else is forwarded as-is
+    _POST_ROUTES = {
+        "/bind": _handle_bind,
+        "/events": _handle_events,
+        "/events/batch": _handle_events_batch,
+    }
+    _PATCH_ROUTES = {
+        "/metadata": _handle_metadata,
+    }
 
     # =========================================================================
     # HTTP method handlers
@@ -267,19 +390,18 @@ class RunnerGatewayHandler(http.server.BaseHTTPRequestHandler):
 
     def do_POST(self) -> None:
         """Handle POST requests - route or forward."""
-        # Runner-handled routes
-        if self.path == "/bind":
-            return self._handle_bind()
-        if self.path == "/events":
-            return self._handle_events()
+        handler = self._POST_ROUTES.get(self.path)
+        if handler:
+            return handler(self)
 
         # Forward everything else to coordinator
         self._forward_to_coordinator("POST")
 
     def do_PATCH(self) -> None:
         """Handle PATCH requests - route or forward."""
-        if self.path == "/metadata":
-            return self._handle_metadata()
+        handler = self._PATCH_ROUTES.get(self.path)
+        if handler:
+            return handler(self)
 
         self._forward_to_coordinator("PATCH")
 
@@ -292,82 +414,161 @@ class RunnerGatewayHandler(http.server.BaseHTTPRequestHandler):
         self._forward_to_coordinator("PUT")
 
     def _forward_to_coordinator(self, method: str) -> None:
-        """Forward the request to the coordinator as-is."""
-        try:
-            # Build target URL
-            target_url = f"{self.coordinator_url}{self.path}"
-
-            # Read request body if present
-            body = self._read_body()
+        """Forward the request to the coordinator as-is.
 
-            # Create request
-            request = urllib.request.Request(target_url, method=method, data=body)
+        Success bodies are streamed through in FORWARD_CHUNK_SIZE pieces so
+        large responses are never held in memory in full.
+        """
+        headers_sent = False
+        try:
+            headers = {}
+
+            # Small bodies are read up front; large ones are streamed from
+            # the executor socket straight to the coordinator. A streamed
+            # body cannot be replayed, so a 307/308 redirect on one fails.
+            length = self._content_length()
+            if length > FORWARD_CHUNK_SIZE:
+                body = self._iter_body(length)
+                headers["Content-Length"] = str(length)
+            else:
+                body = self.rfile.read(length) if length else None
 
             # Add authorization header
             auth_header = self._get_auth_header()
             if auth_header:
-                request.add_header("Authorization", auth_header)
+                headers["Authorization"] = auth_header
 
-            # Forward content-type if present
+            # Forward content-type only alongside a body
             content_type = self.headers.get("Content-Type")
-            if content_type:
-                request.add_header("Content-Type", content_type)
+            if content_type and body is not None:
+                headers["Content-Type"] = content_type
 
             # Make request to coordinator
-            try:
-                with urllib.request.urlopen(request, timeout=30) as response:
-                    response_body = response.read()
-
-                    # Send success response
-                    self.send_response(response.status)
-                    for header, value in response.getheaders():
-                        # Skip hop-by-hop headers
-                        if header.lower() not in (
-                            "transfer-encoding",
-                            "connection",
-                            "keep-alive",
-                        ):
-                            self.send_header(header, value)
+            url = self.coordinator_url + self.path
+            with self.http_client.stream(method, url, content=body, headers=headers) as response:
+                if response.is_error:
+                    # Forward error response from coordinator
+                    error_body = response.read()
+                    self.send_response(response.status_code)
+                    self.send_header("Content-Type", "application/json")
                     self.end_headers()
-                    self.wfile.write(response_body)
-
-            except urllib.error.HTTPError as e:
-                # Forward error response from coordinator
-                error_body = e.read()
-                self.send_response(e.code)
-                self.send_header("Content-Type", "application/json")
+                    self.wfile.write(error_body)
+                    return
+
+                # Send success response
+                self.send_response(response.status_code)
+                for header, value in response.headers.items():
+                    # Skip hop-by-hop headers
+                    if header.lower() not in (
+                        "transfer-encoding",
+                        "connection",
+                        "keep-alive",
+                    ):
+                        self.send_header(header, value)
                 self.end_headers()
-                self.wfile.write(error_body)
-
-        except urllib.error.URLError as e:
+                headers_sent = True
+                for chunk in response.iter_raw(FORWARD_CHUNK_SIZE):
+                    self.wfile.write(chunk)
+
+        except httpx.RequestError as e:
+            if headers_sent:
+                # Status line already went out; all we can do is drop the connection
+                logger.error(f"Gateway lost coordinator response mid-stream: {e}")
+                self.close_connection = True
+                return
             # Connection error to coordinator
             logger.error(f"Gateway failed to connect to coordinator: {e}")
             self.send_response(502)
             self.send_header("Content-Type", "application/json")
             self.end_headers()
-            error_response = json.dumps({
-                "detail": f"Failed to connect to Agent Coordinator: {e.reason}"
+            error_response = json_codec.dumps({
+                "detail": f"Failed to connect to Agent Coordinator: {e}"
             })
-            self.wfile.write(error_response.encode("utf-8"))
+            self.wfile.write(error_response)
 
         except Exception as e:
             # Unexpected error
             logger.error(f"Gateway error: {e}")
+            if headers_sent:
+                self.close_connection = True
+                return
             self.send_response(500)
             self.send_header("Content-Type", "application/json")
             self.end_headers()
-            error_response = json.dumps({"detail": str(e)})
-            self.wfile.write(error_response.encode("utf-8"))
+            error_response = json_codec.dumps({"detail": str(e)})
+            self.wfile.write(error_response)
 
 
-class ThreadedHTTPServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
-    """HTTP server that handles each request in a new thread."""
+class PooledHTTPServer(http.server.HTTPServer):
+    """HTTP server that handles requests on a bounded pool of worker threads.
+
+    Bursts from many executors queue for the workers instead of spawning a
+    new thread per request. Workers are started on demand, up to max_workers,
+    and are daemon threads (like ThreadingMixIn's daemon_threads) so a request
+    stuck on a slow coordinator or executor never blocks runner exit.
+    Accepted connections have Nagle's algorithm disabled so small JSON
+    replies are not held back waiting for an ACK.
+    """
 
     # Allow rapid server restarts
     allow_reuse_address = True
 
-    # Set daemon threads so server doesn't block shutdown
-    daemon_threads = True
+    def __init__(self, server_address, handler_class, max_workers: int):
+        super().__init__(server_address, handler_class)
+        self._max_workers = max_workers
+        self._requests: queue.SimpleQueue = queue.SimpleQueue()
+        self._workers: list[threading.Thread] = []
+        self._idle_workers = 0  # Waiting for a request and not yet handed one
+        self._workers_lock = threading.Lock()
+
+    def get_request(self):
+        """Accept a connection and disable Nagle's algorithm on it."""
+        request, client_address = super().get_request()
+        request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return request, client_address
+
+    def process_request(self, request, client_address) -> None:
+        """Queue the accepted connection, starting a worker if all are busy."""
+        with self._workers_lock:
+            if self._idle_workers:
+                self._idle_workers -= 1
+            elif len(self._workers) < self._max_workers:
+                worker = threading.Thread(
+                    target=self._worker_loop,
+                    daemon=True,
+                    name=f"gateway-worker-{len(self._workers)}",
+                )
+                self._workers.append(worker)
+                worker.start()
+        self._requests.put((request, client_address))
+
+    def _worker_loop(self) -> None:
+        """Handle queued connections until server_close() sends None."""
+        while True:
+            item = self._requests.get()
+            if item is None:
+                return
+            request, client_address = item
+            # Same as ThreadingMixIn.process_request_thread
+            try:
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+            finally:
+                self.shutdown_request(request)
+            with self._workers_lock:
+                self._idle_workers += 1
+
+    def server_close(self) -> None:
+        """Close the listening socket and tell the workers to exit.
+
+        Workers busy with a request finish it (or are abandoned at exit);
+        nothing here waits for them.
+        """
+        super().server_close()
+        with self._workers_lock:
+            for _ in self._workers:
+                self._requests.put(None)
 
 
 class RunnerGateway:
@@ -388,6 +589,7 @@ class RunnerGateway:
         auth0_client: Optional["Auth0M2MClient"] = None,
         hostname: str = "",
         executor_profile: str = "",
+        max_workers: Optional[int] = None,
     ):
         """
         Initialize the gateway.
@@ -397,14 +599,18 @@ class RunnerGateway:
             auth0_client: Auth0 M2M client for OIDC authentication
             hostname: Machine hostname (runner-owned)
             executor_profile: Executor profile name (runner-owned)
+            max_workers: Request worker threads (default: AGENT_GATEWAY_WORKERS
+                or min(32, 4 * CPU count))
         """
         self.coordinator_url = coordinator_url.rstrip("/")
         self.auth0_client = auth0_client
         self.hostname = hostname
         self.executor_profile = executor_profile
-        self._server: Optional[ThreadedHTTPServer] = None
+        self.max_workers = max_workers or _gateway_workers()
+        self._server: Optional[PooledHTTPServer] = None
         self._thread: Optional[threading.Thread] = None
         self._port: int = 0
+        self._http: Optional[httpx.Client] = None
 
     @property
     def port(self) -> int:
@@ -428,9 +634,27 @@ class RunnerGateway:
         RunnerGatewayHandler.auth0_client = self.auth0_client
         RunnerGatewayHandler.hostname = self.hostname
         RunnerGatewayHandler.executor_profile = self.executor_profile
+        RunnerGatewayHandler.bind_runner_fields = json_codec.dumps({
+            "hostname": self.hostname,
+            "executor_profile": self.executor_profile,
+        })[1:-1]
+
+        # One pooled client for all forwarded requests: executor calls reuse
+        # keep-alive connections instead of reconnecting per request. Mirrors
+        # the previous urllib behaviour: redirects are followed and responses
+        # are requested uncompressed so headers and body can be relayed as-is.
+        self._http = httpx.Client(
+            timeout=30.0,
+            follow_redirects=True,
+            headers={"Accept-Encoding": "identity"},
+            limits=GATEWAY_POOL_LIMITS,
+        )
+        RunnerGatewayHandler.http_client = self._http
 
         # Bind to port 0 to get a dynamic port assignment
-        self._server = ThreadedHTTPServer(("127.0.0.1", 0), RunnerGatewayHandler)
+        self._server = PooledHTTPServer(
+            ("127.0.0.1", 0), RunnerGatewayHandler, max_workers=self.max_workers
+        )
         self._port = self._server.server_address[1]
 
         # Start server in background thread
@@ -442,7 +666,7 @@ class RunnerGateway:
         self._thread.start()
 
         logger.info(f"Runner Gateway started on port {self._port}")
-        logger.debug(f"  Forwarding to: {self.coordinator_url}")
+        logger.debug(f"  Forwarding to: {self.coordinator_url} ({self.max_workers} workers)")
         logger.debug(f"  Runner data: hostname={self.hostname}, profile={self.executor_profile}")
 
         return self._port
@@ -451,12 +675,17 @@ class RunnerGateway:
         """Stop the gateway server."""
         if self._server:
             self._server.shutdown()
+            self._server.server_close()
             self._server = None
 
         if self._thread:
             self._thread.join(timeout=5.0)
             self._thread = None
 
+        if self._http:
+            self._http.close()
+            self._http = None
+
         if self._port:
             logger.info("Runner Gateway stopped")
             self._port = 0
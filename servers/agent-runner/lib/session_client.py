@@ -10,16 +10,35 @@ the Runner Gateway. The gateway:
 - Routes requests to the appropriate Coordinator endpoints
 
 Gateway endpoints:
-- POST /bind      - Bind executor to session (gateway adds runner data)
-- POST /events    - Add event to session
-- PATCH /metadata - Update session metadata
+- POST /bind         - Bind executor to session (gateway adds runner data)
+- POST /events/batch - Add queued events to session
+- PATCH /metadata    - Update session metadata
+
+Events are queued by add_event() and sent in batches from a background
+thread. Call flush() where ordering against other signals matters (e.g.
+before reporting a turn complete) and close() before exiting (or use the
+client as a context manager). A batch the
+background thread fails to deliver is logged and reported by the next
+flush() or close().
 
 Note: Uses session_id (coordinator-generated) per ADR-010.
 """
 
+import logging
+import threading
 import httpx
 from typing import Optional, List, Dict, Any
 
+import json_codec
+
+logger = logging.getLogger(__name__)
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Event batching: send once this many events are queued, or after this delay
+EVENT_BATCH_MAX = 64
+EVENT_BATCH_DELAY = 0.05  # seconds
+
 
 class SessionClientError(Exception):
     """Base exception for session client errors."""
@@ -38,6 +57,43 @@ class SessionClient:
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
         self._headers = {}
+        # Keep-alive connection to the gateway, reused across requests
+        self._client = httpx.Client(
+            base_url=self.base_url, timeout=self.timeout, headers=self._headers
+        )
+        # Queued (session_id, event) pairs awaiting the flush thread
+        self._events: List[tuple[str, Dict[str, Any]]] = []
+        self._events_cond = threading.Condition()
+        # Held while a batch is taken from the queue and sent, so batches
+        # reach the gateway in the order their events were added
+        self._send_lock = threading.Lock()
+        self._flush_thread: Optional[threading.Thread] = None
+        self._closed = False
+        # Background delivery failure not yet reported by flush()
+        self._undelivered = 0
+        self._delivery_error: Optional[Exception] = None
+
+    def close(self) -> None:
+        """Send any queued events, then close the HTTP connection pool.
+
+        Raises:
+            SessionClientError: If queued events could not be delivered.
+        """
+        with self._events_cond:
+            self._closed = True
+            self._events_cond.notify()
+        if self._flush_thread:
+            self._flush_thread.join(timeout=self.timeout)
+        try:
+            self.flush()
+        finally:
+            self._client.close()
+
+    def __enter__(self) -> "SessionClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def _request(
         self,
@@ -46,19 +102,19 @@ class SessionClient:
         json_data: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """Make HTTP request and handle errors."""
-        url = f"{self.base_url}{path}"
+        content = None
+        headers = None
+        if json_data is not None:
+            content = json_codec.dumps(json_data)
+            headers = _JSON_HEADERS
         try:
-            response = httpx.request(
-                method=method,
-                url=url,
-                json=json_data,
-                headers=self._headers,
-                timeout=self.timeout
+            response = self._client.request(
+                method, path, content=content, headers=headers
             )
             if response.status_code == 404:
                 raise SessionNotFoundError(f"Session not found: {path}")
             response.raise_for_status()
-            return response.json()
+            return json_codec.loads(response.content)
         except httpx.HTTPStatusError as e:
             raise SessionClientError(f"HTTP error {e.response.status_code}: {e.response.text}")
         except httpx.RequestError as e:
@@ -125,16 +181,92 @@ class SessionClient:
         return result.get("sessions", [])
 
     def add_event(self, session_id: str, event: Dict[str, Any]) -> None:
-        """Add event to session via the Runner Gateway.
+        """Queue an event for the session.
 
-        The gateway extracts session_id from the body to route to the
-        correct coordinator endpoint: POST /sessions/{session_id}/events
+        Events are sent in order, in batches, by a background thread via the
+        Runner Gateway's /events/batch endpoint. Delivery errors on that
+        thread are logged and raised by the next flush() or close().
+
+        The event dict may be queued without copying, so callers should not
+        modify it afterwards.
+        """
+        # Ensure session_id is set in event (copy only if it must change)
+        event_data = event
+        if event.get("session_id") != session_id:
+            event_data = dict(event)
+            event_data["session_id"] = session_id
+        with self._events_cond:
+            if self._closed:
+                raise SessionClientError("Session client is closed")
+            self._events.append((session_id, event_data))
+            if self._flush_thread is None:
+                self._flush_thread = threading.Thread(
+                    target=self._flush_loop, daemon=True, name="session-events"
+                )
+                self._flush_thread.start()
+            if len(self._events) >= EVENT_BATCH_MAX:
+                self._events_cond.notify()
+
+    def flush(self) -> None:
+        """Send all queued events now.
+
+        Raises:
+            SessionClientError: If a batch could not be delivered, now or
+                earlier by the background thread.
         """
-        # Ensure session_id is set in event
-        event_data = dict(event)
-        event_data["session_id"] = session_id
-        # Calls the Runner Gateway's /events endpoint
-        self._request("POST", "/events", json_data=event_data)
+        with self._send_lock:
+            with self._events_cond:
+                pending, self._events = self._events, []
+                undelivered, self._undelivered = self._undelivered, 0
+                error, self._delivery_error = self._delivery_error, None
+            self._send_events(pending)
+        if error:
+            raise SessionClientError(
+                f"{undelivered} queued event(s) were not delivered: {error}"
+            )
+
+    def _flush_loop(self) -> None:
+        """Send queued events every EVENT_BATCH_DELAY or EVENT_BATCH_MAX events."""
+        while True:
+            with self._events_cond:
+                self._events_cond.wait_for(lambda: self._events or self._closed)
+                if self._closed:
+                    return
+                # Give a burst a moment to accumulate into one batch
+                self._events_cond.wait_for(
+                    lambda: len(self._events) >= EVENT_BATCH_MAX or self._closed,
+                    timeout=EVENT_BATCH_DELAY,
+                )
+            with self._send_lock:
+                with self._events_cond:
+                    pending, self._events = self._events, []
+                try:
+                    self._send_events(pending)
+                except Exception as e:
+                    # Any error, not just SessionClientError: this thread must
+                    # keep running or later events would never be sent
+                    session_ids = ", ".join(dict.fromkeys(sid for sid, _ in pending))
+                    logger.warning(
+                        "Failed to send %d queued event(s) for session %s: %s",
+                        len(pending), session_ids, e,
+                    )
+                    with self._events_cond:
+                        self._undelivered += len(pending)
+                        self._delivery_error = e
+
+    def _send_events(self, pending: List[tuple[str, Dict[str, Any]]]) -> None:
+        """POST queued events, one request per run of the same session."""
+        start = 0
+        while start < len(pending):
+            session_id = pending[start][0]
+            end = start
+            while end < len(pending) and pending[end][0] == session_id:
+                end += 1
+            self._request("POST", "/events/batch", json_data={
+                "session_id": session_id,
+                "events": [event for _, event in pending[start:end]],
+            })
+            start = end
 
     def update_session(
         self,
@@ -167,5 +299,8 @@ class SessionClient:
 
 
 def get_client(base_url: str) -> SessionClient:
-    """Get a SessionClient instance."""
+    """Get a SessionClient instance.
+
+    The caller owns it: close() it, or use it in a with block.
+    """
     return SessionClient(base_url)
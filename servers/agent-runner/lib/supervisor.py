@@ -1,7 +1,13 @@
 """
 Supervisor Thread - monitors running agent run subprocesses for completion.
 
-Checks subprocess status periodically and reports completion/failure.
+Waits for executor exits and reports completion/failure. On Linux each
+process is a pidfd registered with one epoll instance, so the thread sleeps
+until a process exits or a new one is registered. The same loop drains the
+process's output pipes while it runs, so a chatty executor never blocks on
+a full pipe and its output is in memory when it exits. Processes without a
+pidfd (other platforms) are polled every check_interval and their pipes
+are read after exit.
 
 NOTE: Callback processing has been moved to agent-coordinator (callback_processor.py).
 The agent-coordinator now handles callbacks when it receives run_completed events,
@@ -11,16 +17,59 @@ which allows proper queuing when the parent is busy. See:
 """
 
 import json
+import os
+import select
 import subprocess
 import threading
-import time
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Optional
 
 from api_client import CoordinatorAPIClient
-from registry import ProcessRegistry
+from registry import ProcessRegistry, _open_child_pidfd
 
 logger = logging.getLogger(__name__)
 
+PIPE_READ_SIZE = 64 * 1024
+OUTPUT_CAPTURE_LIMIT = 1024 * 1024  # Bytes kept per pipe; older output is dropped and marked
+
+
+def _read_pipe_nowait(pipe) -> str:
+    """Read what an exited process left in a pipe, without blocking.
+
+    A grandchild that inherited the pipe can hold it open after the process
+    exits, so a blocking read could hang the supervisor indefinitely.
+    """
+    if pipe is None or pipe.closed:
+        return ""
+    fd = pipe.fileno()
+    os.set_blocking(fd, False)
+    chunks = []
+    while True:
+        try:
+            chunk = os.read(fd, PIPE_READ_SIZE)
+        except BlockingIOError:
+            break
+        if not chunk:
+            break
+        chunks.append(chunk)
+    return b"".join(chunks).decode(errors="replace")
+
+
+def _make_reporter() -> ThreadPoolExecutor:
+    """Create the pool that sends exit reports to the coordinator."""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="run-reporter")
+
+
+@dataclass
+class _Watch:
+    """A session process the supervision loop is watching."""
+    process: subprocess.Popen
+    pidfd: Optional[int]
+    output: dict[str, bytearray] = field(default_factory=dict)  # "stdout"/"stderr" -> captured bytes
+    dropped: dict[str, int] = field(default_factory=dict)  # pipe name -> bytes dropped over the limit
+
 
 class RunSupervisor:
     """Background thread that monitors running agent runs for completion."""
@@ -38,7 +87,7 @@ class RunSupervisor:
             api_client: HTTP client for Agent Coordinator
             registry: Registry of running agent runs
             runner_id: This runner's ID
-            check_interval: How often to check subprocess status (seconds)
+            check_interval: How often to poll processes that have no pidfd (seconds)
         """
         self.api_client = api_client
         self.registry = registry
@@ -48,11 +97,24 @@ class RunSupervisor:
         self._thread: threading.Thread | None = None
         self._stop_event = threading.Event()
 
+        # pidfd and pipe watches, touched only by the supervision thread
+        self._epoll: Optional["select.epoll"] = None
+        self._wake_r = -1
+        self._wake_w = -1
+        self._watched: dict[str, _Watch] = {}  # session_id -> watch
+        self._fds: dict[int, tuple[str, Optional[str]]] = {}  # fd -> (session_id, pipe name, None for the pidfd)
+
         # Dedup set for reported runs (prevents double-reporting between stdout reader and poll loop)
         self._reported_runs: set[str] = set()
         self._reported_runs_lock = threading.Lock()
         self._stdout_threads: list[threading.Thread] = []
 
+        # Exit reports go to the coordinator from here, so a slow coordinator
+        # never delays noticing other exits. Shut down by stop(), recreated
+        # by the next start().
+        self._reporter = _make_reporter()
+        self._reporter_shut_down = False
+
     def start(self) -> None:
         """Start the supervisor thread."""
         if self._thread is not None and self._thread.is_alive():
@@ -60,117 +122,320 @@ class RunSupervisor:
             return
 
         self._stop_event.clear()
-        self._thread = threading.Thread(target=self._supervision_loop, daemon=True)
+        if self._reporter_shut_down:
+            self._reporter = _make_reporter()
+            self._reporter_shut_down = False
+        if hasattr(select, "epoll"):
+            self._epoll = select.epoll()
+            self._wake_r, self._wake_w = os.pipe()
+            os.set_blocking(self._wake_w, False)
+            self._epoll.register(self._wake_r, select.EPOLLIN)
+            self.registry.on_register = self._on_register
+            target = self._supervision_loop
+        else:
+            target = self._polling_loop
+        self._thread = threading.Thread(target=target, daemon=True)
         self._thread.start()
         logger.info("Supervisor started")
 
     def stop(self) -> None:
         """Stop the supervisor thread."""
         self._stop_event.set()
+        self._wake()
         if self._thread:
             self._thread.join(timeout=5.0)
             self._thread = None
+        self._reporter.shutdown(wait=True)  # Let in-flight reports finish
+        self._reporter_shut_down = True
+        if self._epoll is not None:
+            self.registry.on_register = None
+            for watch in self._watched.values():
+                if watch.pidfd is not None:
+                    os.close(watch.pidfd)
+            self._fds.clear()
+            self._watched.clear()
+            self._epoll.close()
+            os.close(self._wake_r)
+            os.close(self._wake_w)
+            self._epoll = None
+            self._wake_r = self._wake_w = -1
         logger.info("Supervisor stopped")
 
-    def _supervision_loop(self) -> None:
-        """Main supervision loop."""
+    def _on_register(self, session_id: str) -> None:
+        """Registry hook: wake the loop so it starts watching the new process."""
+        self._wake()
+
+    def _wake(self) -> None:
+        """Interrupt epoll.poll in the supervision loop."""
+        if self._wake_w < 0:
+            return
+        try:
+            os.write(self._wake_w, b"\0")
+        except (BlockingIOError, OSError):
+            pass  # A wakeup is already pending, or the pipe is closed
+
+    def _submit_report(self, what: str, report: Callable, *args, **kwargs) -> None:
+        """Send a report to the coordinator on the reporter pool, logging failures."""
+        def log_failure(future: Future) -> None:
+            e = future.exception()
+            if e is not None:
+                logger.error(f"Failed to report {what}: {e}")
+
+        self._reporter.submit(report, *args, **kwargs).add_done_callback(log_failure)
+
+    def _polling_loop(self) -> None:
+        """Supervision loop for platforms without pidfd/epoll."""
         while not self._stop_event.is_set():
             try:
                 self._check_runs()
             except Exception as e:
                 logger.error(f"Supervision error: {e}")
 
-            time.sleep(self.check_interval)
+            if self._stop_event.wait(self.check_interval):
+                break
+
+    def _supervision_loop(self) -> None:
+        """Main supervision loop: block until a watched process exits."""
+        while not self._stop_event.is_set():
+            try:
+                self._wait_for_exits()
+            except Exception as e:
+                logger.error(f"Supervision error: {e}")
+                self._stop_event.wait(self.check_interval)
+
+    def _wait_for_exits(self) -> None:
+        """Watch new sessions, wait for exits, and handle them."""
+        polled = self._sync_watches(self.registry.get_all_sessions())
+
+        # Only processes without a pidfd need a periodic wakeup
+        events = self._epoll.poll(self.check_interval if polled else -1)
+
+        exited: list[tuple[str, _Watch]] = []
+        for fd, _ in events:
+            if fd == self._wake_r:
+                os.read(self._wake_r, 4096)
+            elif fd in self._fds:
+                session_id, pipe_name = self._fds[fd]
+                if pipe_name is None:
+                    exited.append((session_id, self._unwatch(session_id)))
+                else:
+                    self._drain_pipe(fd, session_id, pipe_name, to_eof=False)
+
+        for session_id, watch in exited:
+            entry = self.registry.get_session(session_id)
+            if entry is not None and entry.process is watch.process:
+                self._check_session(session_id, entry, self._captured_output(session_id, watch))
+        for session_id in polled:
+            entry = self.registry.get_session(session_id)
+            if entry is not None:
+                self._check_session(session_id, entry)
+
+    def _sync_watches(self, sessions: dict) -> list[str]:
+        """Open pidfds for new sessions and drop watches for removed ones.
+
+        Returns the session_ids that have no pidfd and must be polled.
+        Sessions the poller is stopping are left to its ProcessReaper.
+        """
+        for session_id in [sid for sid in self._watched if sid not in sessions]:
+            self._unwatch(session_id)
+
+        polled = []
+        for session_id, entry in sessions.items():
+            if self.registry.is_stopping(session_id):
+                continue
+            watch = self._watched.get(session_id)
+            if watch is not None and watch.process is not entry.process:
+                self._unwatch(session_id)  # Session was re-registered with a new process
+                watch = None
+            if watch is None:
+                watch = self._watch(session_id, entry)
+            if watch.pidfd is None:
+                polled.append(session_id)
+        return polled
+
+    def _watch(self, session_id: str, entry) -> _Watch:
+        """Register a session's pidfd and output pipes with epoll.
+
+        A persistent process's stdout belongs to its stdout reader thread,
+        so only its stderr is drained here.
+        """
+        watch = _Watch(entry.process, _open_child_pidfd(entry.process))
+        self._watched[session_id] = watch
+        if watch.pidfd is None:
+            return watch
+
+        self._fds[watch.pidfd] = (session_id, None)
+        self._epoll.register(watch.pidfd, select.EPOLLIN)
+        for pipe_name in ("stderr",) if entry.persistent else ("stdout", "stderr"):
+            pipe = getattr(entry.process, pipe_name)
+            if pipe is None or pipe.closed:
+                continue
+            fd = pipe.fileno()
+            os.set_blocking(fd, False)
+            watch.output[pipe_name] = bytearray()
+            self._fds[fd] = (session_id, pipe_name)
+            self._epoll.register(fd, select.EPOLLIN)
+        return watch
+
+    def _drain_pipe(self, fd: int, session_id: str, pipe_name: str, to_eof: bool) -> None:
+        """Read available output from a pipe into the session's buffer.
+
+        Reads once per readiness event, or everything buffered if to_eof.
+        Stops watching the pipe at EOF.
+        """
+        buf = self._watched[session_id].output[pipe_name]
+        while True:
+            try:
+                chunk = os.read(fd, PIPE_READ_SIZE)
+            except BlockingIOError:
+                return  # Pipe still held open (e.g. by a grandchild) but empty
+            except OSError as e:
+                logger.debug(f"Failed to read {pipe_name} for session {session_id}: {e}")
+                chunk = b""
+            if not chunk:
+                self._forget_pipe(fd)
+                return
+            buf += chunk
+            if len(buf) > OUTPUT_CAPTURE_LIMIT:
+                watch = self._watched[session_id]
+                watch.dropped[pipe_name] = watch.dropped.get(pipe_name, 0) + len(buf) - OUTPUT_CAPTURE_LIMIT
+                del buf[:-OUTPUT_CAPTURE_LIMIT]
+            if not to_eof:
+                return
+
+    def _captured_output(self, session_id: str, watch: _Watch) -> dict[str, str]:
+        """Decode a watch's captured output, marking where the start was dropped."""
+        output = {}
+        for name, buf in watch.output.items():
+            text = bytes(buf).decode(errors="replace")
+            dropped = watch.dropped.get(name)
+            if dropped:
+                text = f"[... {dropped} bytes of earlier {name} truncated ...]\n" + text
+            output[name] = text
+        if watch.dropped:
+            summary = ", ".join(f"{name}: {n} bytes" for name, n in watch.dropped.items())
+            logger.warning(
+                f"Output of session {session_id} exceeded {OUTPUT_CAPTURE_LIMIT} bytes per pipe; "
+                f"dropped the start of it ({summary})"
+            )
+        return output
+
+    def _forget_pipe(self, fd: int) -> None:
+        """Stop watching a pipe fd (Popen may already have closed it)."""
+        del self._fds[fd]
+        try:
+            self._epoll.unregister(fd)
+        except OSError:
+            pass
+
+    def _unwatch(self, session_id: str) -> _Watch:
+        """Stop watching a session: drain its pipes and close its pidfd."""
+        watch = self._watched[session_id]
+        for fd, (sid, pipe_name) in list(self._fds.items()):
+            if sid == session_id and pipe_name is not None:
+                self._drain_pipe(fd, session_id, pipe_name, to_eof=True)
+                if fd in self._fds:
+                    self._forget_pipe(fd)
+        if watch.pidfd is not None:
+            del self._fds[watch.pidfd]
+            self._epoll.unregister(watch.pidfd)
+            os.close(watch.pidfd)
+        del self._watched[session_id]
+        return watch
 
     def _check_runs(self) -> None:
         """Check all sessions for process exit."""
         sessions = self.registry.get_all_sessions()
 
         for session_id, entry in sessions.items():
-            return_code = entry.process.poll()
-            if return_code is not None:
-                if entry.persistent:
-                    self._handle_persistent_exit(session_id, entry, return_code)
-                else:
-                    self._handle_oneshot_exit(session_id, entry, return_code)
+            self._check_session(session_id, entry)
 
-    def _handle_oneshot_exit(self, session_id: str, entry, return_code: int) -> None:
+    def _check_session(self, session_id: str, entry, output: Optional[dict[str, str]] = None) -> None:
+        """Handle a session's process exit, if it has exited.
+
+        output holds the pipe contents the supervision loop captured, keyed
+        by pipe name; without it the handlers read the pipes themselves.
+        """
+        return_code = entry.process.poll()
+        if return_code is not None:
+            if entry.persistent:
+                self._handle_persistent_exit(session_id, entry, return_code, output)
+            else:
+                self._handle_oneshot_exit(session_id, entry, return_code, output)
+
+    def _handle_oneshot_exit(
+        self, session_id: str, entry, return_code: int, output: Optional[dict[str, str]] = None
+    ) -> None:
         """Handle one-shot agent run completion (success or failure).
 
         Reports completion status to agent-coordinator. Callback processing
         is handled by agent-coordinator when it receives the run_completed event.
         """
+        # Poller is stopping this session; it reports once the process is reaped
+        if self.registry.is_stopping(session_id):
+            logger.debug(f"Skipping exit handling for session {session_id} — poller is stopping it")
+            return
+
         run_id = entry.current_run_id
 
         # Remove from registry first
         self.registry.remove_session(session_id)
 
-        # Get any output from the process
-        # Read directly from pipes instead of using communicate() to avoid
-        # "I/O operation on closed file" errors when process exits quickly
-        stdout, stderr = "", ""
-        try:
-            # Check pipe status for diagnostics
-            stdout_status = "closed" if (not entry.process.stdout or entry.process.stdout.closed) else "open"
-            stderr_status = "closed" if (not entry.process.stderr or entry.process.stderr.closed) else "open"
-
-            # Try reading directly from pipes
-            if entry.process.stdout and not entry.process.stdout.closed:
-                stdout = entry.process.stdout.read() or ""
-            if entry.process.stderr and not entry.process.stderr.closed:
-                stderr = entry.process.stderr.read() or ""
-
-            # Log if pipes were already closed (helps diagnose fast-exit issues)
-            if stdout_status == "closed" or stderr_status == "closed":
-                logger.debug(
-                    f"Process for session {session_id} pipes status: stdout={stdout_status}, stderr={stderr_status}"
-                )
-        except Exception as e:
-            # Fall back to communicate() if direct read fails
+        if output is not None:
+            stdout, stderr = output.get("stdout", ""), output.get("stderr", "")
+        else:
+            stdout, stderr = "", ""
             try:
-                stdout, stderr = entry.process.communicate(timeout=5.0)
-            except Exception as e2:
-                logger.warning(
-                    f"Failed to get output from process for session {session_id}: "
-                    f"direct read: {e}, communicate: {e2}"
-                )
+                # Log if pipes were already closed (helps diagnose fast-exit issues)
+                if logger.isEnabledFor(logging.DEBUG):
+                    stdout_status = "closed" if (not entry.process.stdout or entry.process.stdout.closed) else "open"
+                    stderr_status = "closed" if (not entry.process.stderr or entry.process.stderr.closed) else "open"
+                    if stdout_status == "closed" or stderr_status == "closed":
+                        logger.debug(
+                            f"Process for session {session_id} pipes status: "
+                            f"stdout={stdout_status}, stderr={stderr_status}"
+                        )
+
+                stdout = _read_pipe_nowait(entry.process.stdout)
+                stderr = _read_pipe_nowait(entry.process.stderr)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Failed to get output from process for session {session_id}: {e}")
 
         if return_code == 0:
             logger.info(f"Agent run {run_id} completed successfully (session={session_id})")
-            try:
-                self.api_client.report_completed(self.runner_id, run_id, session_status="finished")
-            except Exception as e:
-                logger.error(f"Failed to report completion for {run_id}: {e}")
+            self._submit_report(
+                f"completion for {run_id}",
+                self.api_client.report_completed, self.runner_id, run_id, session_status="finished",
+            )
         else:
+            stdout = stdout.strip() if stdout else ""
+            stderr = stderr.strip() if stderr else ""
+
             # Build error message: prefer stderr, fall back to stdout, then generic message
-            if stderr and stderr.strip():
-                error_msg = stderr.strip()
-            elif stdout and stdout.strip():
-                error_msg = f"(stdout) {stdout.strip()}"
+            if stderr:
+                error_msg = stderr
+            elif stdout:
+                error_msg = f"(stdout) {stdout}"
             else:
                 error_msg = f"Process exited with code {return_code}"
 
             # Log detailed failure info for debugging
             logger.error(f"Agent run {run_id} failed (exit_code={return_code}, session={session_id})")
             logger.error(f"  Error: {error_msg}")
-            if stdout and stdout.strip():
-                # Truncate long output for logging
-                stdout_preview = stdout.strip()[:1000]
-                if len(stdout.strip()) > 1000:
-                    stdout_preview += "... (truncated)"
-                logger.debug(f"  stdout: {stdout_preview}")
-            if stderr and stderr.strip():
-                stderr_preview = stderr.strip()[:1000]
-                if len(stderr.strip()) > 1000:
-                    stderr_preview += "... (truncated)"
-                logger.debug(f"  stderr: {stderr_preview}")
-
-            try:
-                self.api_client.report_failed(self.runner_id, run_id, error_msg)
-            except Exception as e:
-                logger.error(f"Failed to report failure for {run_id}: {e}")
-
-    def _handle_persistent_exit(self, session_id: str, entry, return_code: int) -> None:
+            if logger.isEnabledFor(logging.DEBUG):
+                for name, output in (("stdout", stdout), ("stderr", stderr)):
+                    if output:
+                        # Truncate long output for logging
+                        preview = output[:1000] + ("... (truncated)" if len(output) > 1000 else "")
+                        logger.debug(f"  {name}: {preview}")
+
+            self._submit_report(
+                f"failure for {run_id}", self.api_client.report_failed, self.runner_id, run_id, error_msg
+            )
+
+    def _handle_persistent_exit(
+        self, session_id: str, entry, return_code: int, output: Optional[dict[str, str]] = None
+    ) -> None:
         """Handle unexpected exit of a persistent process."""
         # Dedup guard: if poller is handling the stop, skip reporting
         if self.registry.is_stopping(session_id):
@@ -187,30 +452,27 @@ class RunSupervisor:
                     return
                 self._reported_runs.add(run_id)
 
-            stderr = self._read_stderr(entry)
+            stderr = output.get("stderr", "") if output is not None else self._read_stderr(entry)
             error_msg = stderr or f"Persistent process exited with code {return_code}"
             logger.error(f"Persistent process crashed for session {session_id} (run={run_id}, exit_code={return_code})")
-            try:
-                self.api_client.report_failed(self.runner_id, run_id, error_msg)
-            except Exception as e:
-                logger.error(f"Failed to report crash for {run_id}: {e}")
+            self._submit_report(
+                f"crash for {run_id}", self.api_client.report_failed, self.runner_id, run_id, error_msg
+            )
         else:
             # Process was idle (between turns) and exited
             status = "finished" if return_code == 0 else "failed"
             logger.info(f"Idle persistent process exited for session {session_id} (exit_code={return_code}, status={status})")
-            try:
-                self.api_client.report_session_status(self.runner_id, session_id, status)
-            except Exception as e:
-                logger.error(f"Failed to report session status for {session_id}: {e}")
+            self._submit_report(
+                f"session status for {session_id}",
+                self.api_client.report_session_status, self.runner_id, session_id, status,
+            )
 
     def _read_stderr(self, entry) -> str:
         """Read stderr from a process for error reporting."""
         try:
-            if entry.process.stderr and not entry.process.stderr.closed:
-                return entry.process.stderr.read() or ""
-        except Exception:
-            pass
-        return ""
+            return _read_pipe_nowait(entry.process.stderr)
+        except (OSError, ValueError):
+            return ""
 
     def start_stdout_reader(self, session_id: str, process: subprocess.Popen) -> None:
         """Start a stdout reader thread for a persistent process."""
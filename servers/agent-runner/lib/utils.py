@@ -4,12 +4,15 @@ Common Utilities
 Shared utility functions for error handling, I/O, and formatting.
 """
 
+import atexit
+import io
+import json
 import os
 import sys
-import traceback
+import threading
+import time
 from pathlib import Path
 from typing import Optional, Any
-from datetime import datetime
 
 
 # ============================================================================
@@ -26,6 +29,10 @@ ENABLE_DEBUG_LOGGING = False
 _PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
 DEBUG_LOG_PATH = _PROJECT_ROOT / "debug-session-path.log"
 
+# Opened on first use and kept open (line-buffered) for the process lifetime
+_debug_file = None
+_debug_lock = threading.Lock()
+
 
 def debug_log(context: str, data: dict[str, Any]) -> None:
     """
@@ -44,7 +51,8 @@ def debug_log(context: str, data: dict[str, Any]) -> None:
         return
 
     try:
-        timestamp = datetime.utcnow().isoformat() + "Z"
+        secs, ns = divmod(time.time_ns(), 1_000_000_000)
+        timestamp = f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(secs))}.{ns // 1000:06d}Z"
 
         # Determine calling command by inspecting call stack
         caller = _get_calling_command()
@@ -65,8 +73,8 @@ def debug_log(context: str, data: dict[str, Any]) -> None:
         log_entry = "\n".join(lines)
 
         # Append to log file (create if doesn't exist)
-        with open(DEBUG_LOG_PATH, 'a') as f:
-            f.write(log_entry)
+        with _debug_lock:
+            _open_debug_log().write(log_entry)
 
     except Exception as e:
         # Don't break the command if logging fails
@@ -74,6 +82,19 @@ def debug_log(context: str, data: dict[str, Any]) -> None:
         print(f"Debug logging failed: {e}", file=sys.stderr)
 
 
+def _open_debug_log():
+    """
+    Return the shared debug log file, opening it on first use.
+
+    Must be called with _debug_lock held.
+    """
+    global _debug_file
+    if _debug_file is None:
+        _debug_file = open(DEBUG_LOG_PATH, 'a', buffering=1)
+        atexit.register(_debug_file.close)
+    return _debug_file
+
+
 def _get_calling_command() -> str:
     """
     Determine which command is running by inspecting the call stack.
@@ -82,16 +103,19 @@ def _get_calling_command() -> str:
         Command name (e.g., "ao-start") or "unknown"
     """
     try:
-        # Get call stack
-        stack = traceback.extract_stack()
-
-        # Look for command file in stack (files without .py extension)
-        for frame in stack:
-            filename = Path(frame.filename).name
+        # Walk the frames directly; extract_stack() would build a FrameSummary
+        # (and read source lines) for every frame
+        command = "unknown"
+        frame = sys._getframe(1)
+        while frame is not None:
+            # Look for command file in stack (files without .py extension);
+            # the outermost match wins, as it did with extract_stack()
+            filename = frame.f_code.co_filename.rpartition(os.sep)[2]
             if filename.startswith("ao-") and not filename.endswith(".py"):
-                return filename
+                command = filename
+            frame = frame.f_back
 
-        return "unknown"
+        return command
     except Exception:
         return "unknown"
 
@@ -101,6 +125,23 @@ def _get_calling_command() -> str:
 # ============================================================================
 
 
+_STDIN_UNREAD = object()
+_stdin_content: Any = _STDIN_UNREAD
+
+
+def _read_piped_stdin() -> str:
+    """
+    Read piped stdin once per process and cache it.
+
+    stdin can only be consumed once, so later calls return the cached
+    content. Returns "" when stdin is a terminal.
+    """
+    global _stdin_content
+    if _stdin_content is _STDIN_UNREAD:
+        _stdin_content = "" if sys.stdin.isatty() else sys.stdin.read()
+    return _stdin_content
+
+
 def get_prompt_from_args_and_stdin(prompt_arg: Optional[str]) -> str:
     """
     Get prompt from -p flag and/or stdin.
@@ -108,10 +149,11 @@ def get_prompt_from_args_and_stdin(prompt_arg: Optional[str]) -> str:
     Implementation (from bash get_prompt):
     1. Initialize: final_prompt = ""
     2. If prompt_arg provided: final_prompt = prompt_arg
+       (returned right away when stdin is a terminal - nothing to combine)
     3. Check if stdin has data:
        - Use sys.stdin.isatty() - False means stdin is piped
        - If not isatty():
-           stdin_content = sys.stdin.read()
+           stdin_content = sys.stdin.read()  (read once, cached for later calls)
            if stdin_content:
                if final_prompt:
                    final_prompt = final_prompt + "\n" + stdin_content
@@ -129,21 +171,24 @@ def get_prompt_from_args_and_stdin(prompt_arg: Optional[str]) -> str:
     Raises:
         ValueError: If no prompt provided from either source
     """
+    # -p with an interactive stdin: there is nothing to read or combine
+    if prompt_arg and sys.stdin.isatty():
+        return prompt_arg
+
     final_prompt = ""
 
     # Add prompt from -p flag if provided
     if prompt_arg:
         final_prompt = prompt_arg
 
-    # Check if stdin has data (not a terminal)
-    if not sys.stdin.isatty():
-        stdin_content = sys.stdin.read()
-        if stdin_content:
-            # Combine with -p flag if both present
-            if final_prompt:
-                final_prompt = final_prompt + "\n" + stdin_content
-            else:
-                final_prompt = stdin_content
+    # Add stdin content if it was piped (not a terminal)
+    stdin_content = _read_piped_stdin()
+    if stdin_content:
+        # Combine with -p flag if both present
+        if final_prompt:
+            final_prompt = final_prompt + "\n" + stdin_content
+        else:
+            final_prompt = stdin_content
 
     # Validate we got something
     if not final_prompt:
@@ -238,27 +283,26 @@ def format_autonomous_inputs(parameters: dict, has_custom_schema: bool) -> str:
         # Edge case: empty parameters with custom schema
         return "<inputs>\n</inputs>"
 
-    lines = ["<inputs>"]
+    buf = io.StringIO()
+    write = buf.write
+    write("<inputs>\n")
     for key, value in parameters.items():
         # Handle different value types
         if isinstance(value, str):
             # Multi-line strings get special formatting
             if "\n" in value:
-                lines.append(f"{key}:")
-                for line in value.split("\n"):
-                    lines.append(f"  {line}")
+                write(f"{key}:\n  ")
+                write(value.replace("\n", "\n  "))
+                write("\n")
             else:
-                lines.append(f"{key}: {value}")
+                write(f"{key}: {value}\n")
         elif isinstance(value, (list, dict)):
             # JSON-like structures
-            import json
-            lines.append(f"{key}: {json.dumps(value)}")
+            write(f"{key}: {json.dumps(value)}\n")
         elif value is None:
-            lines.append(f"{key}: null")
+            write(f"{key}: null\n")
         else:
-            lines.append(f"{key}: {value}")
-    lines.append("</inputs>")
-
-    return "\n".join(lines)
-
+            write(f"{key}: {value}\n")
+    write("</inputs>")
 
+    return buf.getvalue()
@@ -7,7 +7,7 @@ without a real coordinator.
 
 Endpoints:
 - POST /runner/register         - Register runner
-- GET  /runner/runs             - Long-poll for next run
+- GET  /runner/runs             - Long-poll for next run (?started= marks runs started)
 - POST /runner/runs/{id}/started    - Mark run started
 - POST /runner/runs/{id}/completed  - Mark run completed
 - POST /runner/runs/{id}/failed     - Mark run failed
@@ -15,13 +15,16 @@ Endpoints:
 - POST /runner/heartbeat            - Heartbeat
 - DELETE /runners/{id}              - Deregister
 - POST /runner/sessions/{id}/status - Report session status
+- GET  /scripts/{name}/download     - Download script tarball
 - GET  /sessions/{id}               - Get session
 - GET  /sessions/{id}/bind          - Bind (forwarded from gateway)
 - POST /sessions/{id}/bind          - Bind session
 - POST /sessions/{id}/events        - Record events
+- POST /sessions/{id}/events/batch  - Record several events
 - PATCH /sessions/{id}/metadata     - Update metadata
 """
 
+import hashlib
 import json
 import queue
 import re
@@ -113,6 +116,9 @@ class FakeCoordinator:
         # Configurable error responses
         self._register_error: tuple[int, dict] | None = None
 
+        # Script tarballs served by GET /scripts/{name}/download
+        self._script_tarballs: dict[str, bytes] = {}
+
         # Events and bind tracking (for gateway forwarding tests)
         self._bind_calls: list[dict] = []
         self._event_calls: list[dict] = []
@@ -158,6 +164,15 @@ class FakeCoordinator:
             data["remove_scripts"] = remove
         self._poll_queue.put(("scripts", data))
 
+    def set_script_tarball(self, script_name: str, tarball: bytes):
+        """Serve tarball bytes for GET /scripts/{script_name}/download."""
+        with self._lock:
+            self._script_tarballs[script_name] = tarball
+
+    def enqueue_commands(self, data: dict):
+        """Queue a batched command envelope (stop/sync/remove) for the next poll."""
+        self._poll_queue.put(("commands", data))
+
     def get_calls(self) -> list[FakeCall]:
         """Get all recorded calls."""
         with self._lock:
@@ -220,6 +235,7 @@ class FakeCoordinator:
             self._bind_calls.clear()
             self._event_calls.clear()
             self._metadata_calls.clear()
+            self._script_tarballs.clear()
         # Drain poll queue
         while not self._poll_queue.empty():
             try:
@@ -297,12 +313,19 @@ class FakeCoordinator:
                 # GET /runner/runs - long-poll
                 if path == "/runner/runs":
                     runner_id = query.get("runner_id", [None])[0]
+                    started = query.get("started", [])
                     coordinator._record_call(FakeCall(
                         timestamp=datetime.now(UTC).isoformat(),
                         method="GET",
                         path=path,
-                        query={"runner_id": runner_id},
+                        query={"runner_id": runner_id, "started": started},
                     ))
+                    for run_id in started:
+                        coordinator._record_run_report(RunReport(
+                            type="started",
+                            runner_id=runner_id or "",
+                            run_id=run_id,
+                        ))
 
                     try:
                         msg_type, data = coordinator._poll_queue.get(
@@ -313,6 +336,33 @@ class FakeCoordinator:
                         self._send_empty(204)
                     return
 
+                # GET /scripts/{name}/download
+                m = re.match(r"^/scripts/([^/]+)/download$", path)
+                if m:
+                    coordinator._record_call(FakeCall(
+                        timestamp=datetime.now(UTC).isoformat(),
+                        method="GET",
+                        path=path,
+                    ))
+                    with coordinator._lock:
+                        tarball = coordinator._script_tarballs.get(m.group(1))
+                    if tarball is None:
+                        self._send_json({"detail": "Script not found"}, 404)
+                        return
+                    etag = f'"{hashlib.sha256(tarball).hexdigest()}"'
+                    if self.headers.get("If-None-Match") == etag:
+                        self.send_response(304)
+                        self.send_header("ETag", etag)
+                        self.end_headers()
+                        return
+                    self.send_response(200)
+                    self.send_header("Content-Type", "application/gzip")
+                    self.send_header("Content-Length", str(len(tarball)))
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    self.wfile.write(tarball)
+                    return
+
                 # GET /sessions/{id}
                 m = re.match(r"^/sessions/([^/]+)$", path)
                 if m:
@@ -515,6 +565,22 @@ class FakeCoordinator:
                     self._send_json({"status": "ok"})
                     return
 
+                # POST /sessions/{id}/events/batch (from gateway forwarding)
+                m = re.match(r"^/sessions/([^/]+)/events/batch$", path)
+                if m:
+                    session_id = m.group(1)
+                    with coordinator._lock:
+                        for event in (body or {}).get("events", []):
+                            coordinator._event_calls.append({"session_id": session_id, **event})
+                    coordinator._record_call(FakeCall(
+                        timestamp=datetime.now(UTC).isoformat(),
+                        method="POST",
+                        path=path,
+                        body=body,
+                    ))
+                    self._send_json({"ok": True}, 201)
+                    return
+
                 self._send_json({"error": "Not found"}, 404)
 
             def do_PATCH(self):
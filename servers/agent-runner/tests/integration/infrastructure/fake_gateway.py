@@ -7,6 +7,7 @@ Records all calls for assertions and returns configurable responses.
 Endpoints:
 - POST /bind          - Bind executor to session
 - POST /events        - Add event to session
+- POST /events/batch  - Add several events to session
 - PATCH /metadata     - Update session metadata
 - GET /sessions/{id}  - Get session (for resume)
 """
@@ -129,7 +130,10 @@ class FakeRunnerGateway:
         events = []
         for call in self.get_event_calls():
             if call.body and call.body.get("session_id") == session_id:
-                events.append(call.body)
+                if call.path == "/events/batch":
+                    events.extend(call.body.get("events", []))
+                else:
+                    events.append(call.body)
         return events
 
     def get_session(self, session_id: str) -> SessionState | None:
@@ -265,8 +269,8 @@ class FakeRunnerGateway:
                     ))
                     self._send_json(response)
 
-                # POST /events
-                elif path == "/events":
+                # POST /events, POST /events/batch
+                elif path in ("/events", "/events/batch"):
                     session_id = body.get("session_id")
                     gateway._record_call(GatewayCall(
                         timestamp=datetime.now(UTC).isoformat(),
@@ -8,8 +8,14 @@ Tests use FakeCoordinator to verify:
 - Heartbeat
 - Deregistration
 - Session status reporting
+- Script tarball streaming
 """
 
+import io
+import tarfile
+from unittest.mock import patch
+
+import httpx
 import pytest
 from api_client import (
     CoordinatorAPIClient,
@@ -213,6 +219,43 @@ class TestPollRun:
         assert result.remove_scripts == ["old-script"]
         assert result.run is None
 
+    def test_poll_reports_started_runs(self, coordinator, client):
+        client.poll_run("lnch_test", started_runs=["run_001", "run_002"])
+
+        for run_id in ("run_001", "run_002"):
+            reports = coordinator.get_run_reports(run_id)
+            assert [r.type for r in reports] == ["started"]
+            assert reports[0].runner_id == "lnch_test"
+
+    def test_poll_read_timeout_counts_as_reported(self, client):
+        """A long-poll read timeout happens after the request (and its starts) was sent."""
+        with patch.object(client._client, "get", side_effect=httpx.ReadTimeout("timed out")):
+            result = client.poll_run("lnch_test", started_runs=["run_001"])
+
+        assert result.run is None
+        assert result.started_reported is True
+
+    @pytest.mark.parametrize("error", [httpx.ConnectTimeout, httpx.PoolTimeout, httpx.WriteTimeout])
+    def test_poll_timeout_before_send_keeps_started_unreported(self, client, error):
+        with patch.object(client._client, "get", side_effect=error("timed out")):
+            result = client.poll_run("lnch_test", started_runs=["run_001"])
+
+        assert result.run is None
+        assert result.started_reported is False
+
+    def test_poll_batched_commands(self, coordinator, client):
+        coordinator.enqueue_commands({
+            "stop_sessions": ["ses_001"],
+            "sync_scripts": ["script-a"],
+            "remove_scripts": ["old-script"],
+        })
+
+        result = client.poll_run("lnch_test")
+        assert result.stop_sessions == ["ses_001"]
+        assert result.sync_scripts == ["script-a"]
+        assert result.remove_scripts == ["old-script"]
+        assert result.run is None
+
 
 class TestStatusReports:
     """Test run status reporting."""
@@ -324,3 +367,51 @@ class TestDeregister:
         assert len(delete_calls) == 1
         assert delete_calls[0].method == "DELETE"
         assert delete_calls[0].query["self"] == "true"
+
+
+class TestDownloadScriptStream:
+    """Test streaming script tarball downloads."""
+
+    def _tarball(self, files: dict[str, bytes]) -> bytes:
+        buf = io.BytesIO()
+        with tarfile.open(fileobj=buf, mode="w:gz") as tar:
+            for name, data in files.items():
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                tar.addfile(info, io.BytesIO(data))
+        return buf.getvalue()
+
+    def test_stream_yields_tarball_body(self, coordinator, client):
+        tarball = self._tarball({"my-script/script.json": b"{}"})
+        coordinator.set_script_tarball("my-script", tarball)
+
+        with client.download_script_stream("my-script") as download:
+            assert download.stream.read() == tarball
+            assert download.etag
+            assert download.not_modified is False
+
+    def test_stream_readable_by_tarfile_stream_mode(self, coordinator, client):
+        coordinator.set_script_tarball(
+            "my-script", self._tarball({"my-script/run.sh": b"echo hi"})
+        )
+
+        with client.download_script_stream("my-script") as download:
+            with tarfile.open(fileobj=download.stream, mode="r|gz") as tar:
+                member = tar.next()
+                assert member.name == "my-script/run.sh"
+                assert tar.extractfile(member).read() == b"echo hi"
+
+    def test_matching_etag_yields_not_modified(self, coordinator, client):
+        coordinator.set_script_tarball(
+            "my-script", self._tarball({"my-script/script.json": b"{}"})
+        )
+        with client.download_script_stream("my-script") as download:
+            etag = download.etag
+
+        with client.download_script_stream("my-script", etag=etag) as download:
+            assert download.not_modified is True
+            assert download.stream is None
+
+    def test_missing_script_yields_none(self, coordinator, client):
+        with client.download_script_stream("missing") as download:
+            assert download is None
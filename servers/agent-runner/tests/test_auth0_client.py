@@ -0,0 +1,77 @@
+"""
+Tests for Auth0M2MClient - client credentials token caching.
+
+Tests cover:
+- Token reuse until shortly before expiry
+- Precomputed Authorization header
+- Single refresh under concurrent callers
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+from auth0_client import Auth0M2MClient
+
+
+def _make_client(expires_in=3600):
+    """Create a configured client whose token endpoint is mocked."""
+    client = Auth0M2MClient("tenant.auth0.com", "cid", "secret", "api")
+    client._http = MagicMock()
+    tokens = iter(f"tok_{i}" for i in range(100))
+
+    def post(*args, **kwargs):
+        response = MagicMock()
+        response.json.return_value = {"access_token": next(tokens), "expires_in": expires_in}
+        return response
+
+    client._http.post.side_effect = post
+    return client
+
+
+class TestTokenCache:
+    """Test token caching and refresh."""
+
+    def test_unconfigured_returns_none(self):
+        client = Auth0M2MClient("", "", "", "")
+        assert client.get_access_token() is None
+        assert client.get_authorization_header() is None
+
+    def test_token_reused_until_near_expiry(self):
+        client = _make_client(expires_in=3600)
+
+        assert client.get_access_token() == "tok_0"
+        assert client.get_authorization_header() == "Bearer tok_0"
+        assert client._http.post.call_count == 1
+
+    def test_refresh_within_buffer(self):
+        client = _make_client(expires_in=3600)
+        client.get_access_token()
+
+        with patch("auth0_client.time.monotonic", return_value=time.monotonic() + 3550):
+            assert client.get_access_token() == "tok_1"
+        assert client._http.post.call_count == 2
+
+    def test_failed_request_returns_none(self):
+        client = _make_client()
+        client._http.post.side_effect = RuntimeError("boom")
+
+        assert client.get_authorization_header() is None
+
+    def test_concurrent_callers_share_one_refresh(self):
+        client = _make_client()
+        barrier = threading.Barrier(8)
+        results = []
+
+        def call():
+            barrier.wait()
+            results.append(client.get_authorization_header())
+
+        threads = [threading.Thread(target=call) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert results == ["Bearer tok_0"] * 8
+        assert client._http.post.call_count == 1
@@ -0,0 +1,480 @@
+"""
+Tests for RunExecutor - builds executor payloads and spawns ao-*-exec subprocesses.
+
+Tests cover:
+- ${runner.*} placeholder resolution in resolved blueprints
+- Profile and agent discovery from JSON files
+- Payload construction for start and resume modes
+- Writing the JSON payload to the spawned executor's stdin
+"""
+
+import json
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from api_client import Run
+from executor import (
+    ExecutorProfile,
+    RunExecutor,
+    _widen_pipe,
+    _write_stdin_and_close,
+    list_profiles,
+    load_agents_from_profile,
+)
+from invocation import SCHEMA_VERSION
+
+
+MCP_URL = "http://127.0.0.1:9001/mcp"
+
+
+def _make_executor(mcp_server_url=MCP_URL, profile=None):
+    """Create a RunExecutor with defaults (no profile)."""
+    return RunExecutor(
+        default_project_dir="/tmp", mcp_server_url=mcp_server_url, profile=profile
+    )
+
+
+def _make_persistent_profile():
+    """Create a persistent-lifecycle ExecutorProfile."""
+    return ExecutorProfile(
+        name="echo",
+        type="autonomous",
+        command="executors/echo-executor/ao-echo-exec",
+        config={},
+        lifecycle="persistent",
+    )
+
+
+def _make_run(**overrides):
+    """Create a Run with sensible defaults."""
+    defaults = dict(
+        run_id="run_001",
+        type="start_session",
+        session_id="ses_abc",
+        agent_name=None,
+        parameters={"prompt": "hello"},
+        project_dir=None,
+    )
+    defaults.update(overrides)
+    return Run(**defaults)
+
+
+# ===========================================================================
+# TestResolveRunnerPlaceholders
+# ===========================================================================
+
+class TestResolveRunnerPlaceholders:
+    """Tests for _resolve_runner_placeholders."""
+
+    def test_resolves_orchestrator_mcp_url(self):
+        """${runner.orchestrator_mcp_url} is replaced with the MCP server URL."""
+        executor = _make_executor()
+        blueprint = {
+            "name": "worker",
+            "mcp_servers": {
+                "orchestrator": {"type": "http", "url": "${runner.orchestrator_mcp_url}"},
+            },
+        }
+
+        resolved = executor._resolve_runner_placeholders(blueprint)
+
+        assert resolved["mcp_servers"]["orchestrator"]["url"] == MCP_URL
+
+    def test_resolves_in_nested_structures(self):
+        """Placeholders inside nested dicts and lists are resolved."""
+        executor = _make_executor()
+        blueprint = {
+            "args": ["--url", "${runner.orchestrator_mcp_url}/sub"],
+            "nested": {"deep": [{"value": "x ${runner.orchestrator_mcp_url} y"}]},
+        }
+
+        resolved = executor._resolve_runner_placeholders(blueprint)
+
+        assert resolved["args"] == ["--url", f"{MCP_URL}/sub"]
+        assert resolved["nested"]["deep"][0]["value"] == f"x {MCP_URL} y"
+
+    def test_keeps_unknown_runner_placeholders(self):
+        """Unknown ${runner.*} placeholders are left untouched."""
+        executor = _make_executor()
+        blueprint = {"value": "${runner.unknown_key}"}
+
+        resolved = executor._resolve_runner_placeholders(blueprint)
+
+        assert resolved["value"] == "${runner.unknown_key}"
+
+    def test_keeps_placeholder_when_mcp_url_not_set(self):
+        """Without an MCP server URL the placeholder is kept as-is."""
+        executor = _make_executor(mcp_server_url=None)
+        blueprint = {"url": "${runner.orchestrator_mcp_url}"}
+
+        resolved = executor._resolve_runner_placeholders(blueprint)
+
+        assert resolved["url"] == "${runner.orchestrator_mcp_url}"
+
+    def test_leaves_strings_without_placeholders_unchanged(self):
+        """Plain strings, other placeholders and non-string values pass through."""
+        executor = _make_executor()
+        blueprint = {
+            "system_prompt": "You are a helpful agent.",
+            "other": "${scope.context_id}",
+            "count": 3,
+            "enabled": True,
+            "missing": None,
+        }
+
+        resolved = executor._resolve_runner_placeholders(blueprint)
+
+        assert resolved == blueprint
+
+    def test_keys_are_not_resolved(self):
+        """Placeholders in object keys are left untouched; only values resolve."""
+        executor = _make_executor()
+        blueprint = {
+            "env": {"${runner.orchestrator_mcp_url}": "${runner.orchestrator_mcp_url}"},
+        }
+
+        resolved = executor._resolve_runner_placeholders(blueprint)
+
+        assert resolved["env"] == {"${runner.orchestrator_mcp_url}": MCP_URL}
+
+    def test_only_identifier_placeholders_are_resolved(self):
+        """${runner.<key>} must name an identifier to be a placeholder."""
+        executor = _make_executor()
+        blueprint = {"value": "${runner.orchestrator-mcp-url} ${runner.orchestrator_mcp_url}"}
+
+        resolved = executor._resolve_runner_placeholders(blueprint)
+
+        assert resolved["value"] == f"${{runner.orchestrator-mcp-url}} {MCP_URL}"
+
+    def test_blueprint_without_runner_placeholders_not_copied(self):
+        executor = _make_executor()
+        blueprint = {"name": "worker", "mcp_servers": {"o": {"url": "http://fixed"}}}
+
+        assert executor._resolve_runner_placeholders(blueprint) is blueprint
+
+    def test_url_is_json_escaped(self):
+        """Characters that need escaping in JSON survive substitution."""
+        url = 'http://host/mcp?q="a\\b"'
+        executor = _make_executor(mcp_server_url=url)
+        blueprint = {"url": "${runner.orchestrator_mcp_url}"}
+
+        resolved = executor._resolve_runner_placeholders(blueprint)
+
+        assert resolved["url"] == url
+
+    def test_does_not_mutate_original_blueprint(self):
+        """The input blueprint is not modified."""
+        executor = _make_executor()
+        blueprint = {"mcp_servers": {"o": {"url": "${runner.orchestrator_mcp_url}"}}}
+
+        executor._resolve_runner_placeholders(blueprint)
+
+        assert blueprint["mcp_servers"]["o"]["url"] == "${runner.orchestrator_mcp_url}"
+
+
+# ===========================================================================
+# TestBuildPayload
+# ===========================================================================
+
+class TestBuildPayload:
+    """Tests for _build_payload."""
+
+    def test_start_payload_has_required_fields(self):
+        """Start payload carries schema version, mode, session and parameters."""
+        executor = _make_executor()
+
+        payload = executor._build_payload(_make_run(), "start")
+
+        assert payload == {
+            "schema_version": SCHEMA_VERSION,
+            "mode": "start",
+            "session_id": "ses_abc",
+            "parameters": {"prompt": "hello"},
+            "project_dir": "/tmp",
+        }
+
+    def test_start_payload_prefers_run_project_dir(self):
+        """The run's project_dir overrides the executor default."""
+        executor = _make_executor()
+
+        payload = executor._build_payload(_make_run(project_dir="/work"), "start")
+
+        assert payload["project_dir"] == "/work"
+
+    def test_resume_payload_omits_project_dir(self):
+        """project_dir is only sent in start mode."""
+        executor = _make_executor()
+
+        payload = executor._build_payload(_make_run(project_dir="/work"), "resume")
+
+        assert payload["mode"] == "resume"
+        assert "project_dir" not in payload
+
+    def test_optional_fields_omitted_when_unset(self):
+        """agent_name, executor_config and agent_blueprint are absent when empty."""
+        executor = _make_executor()
+
+        payload = executor._build_payload(_make_run(), "resume")
+
+        assert "agent_name" not in payload
+        assert "executor_config" not in payload
+        assert "agent_blueprint" not in payload
+
+    def test_includes_agent_name_and_executor_config(self):
+        """agent_name and profile executor_config are passed through."""
+        executor = _make_executor()
+        executor.executor_config = {"model": "sonnet"}
+
+        payload = executor._build_payload(_make_run(agent_name="worker"), "start")
+
+        assert payload["agent_name"] == "worker"
+        assert payload["executor_config"] == {"model": "sonnet"}
+
+    def test_uses_resolved_blueprint_from_run(self):
+        """The run's resolved blueprint is sent with runner placeholders resolved."""
+        executor = _make_executor()
+        blueprint = {"name": "worker", "url": "${runner.orchestrator_mcp_url}"}
+
+        payload = executor._build_payload(
+            _make_run(resolved_agent_blueprint=blueprint), "start"
+        )
+
+        assert payload["agent_blueprint"] == {"name": "worker", "url": MCP_URL}
+
+
+# ===========================================================================
+# TestExecuteWithPayload
+# ===========================================================================
+
+def _spawn(executor, run, mode="start"):
+    """Run _execute_with_payload against a mocked Popen, return (popen_mock, proc)."""
+    proc = MagicMock()
+    with patch("executor.subprocess.Popen", return_value=proc) as popen:
+        executor._execute_with_payload(run, mode)
+    return popen, proc
+
+
+def _written_bytes(proc):
+    """Concatenate all bytes written to the process stdin buffer."""
+    return b"".join(c.args[0] for c in proc.stdin.buffer.write.call_args_list)
+
+
+class TestExecuteWithPayload:
+    """Tests for _execute_with_payload stdin handling."""
+
+    def test_execute_writes_json_to_stdin(self):
+        """One-shot executors get the payload as bytes and stdin is closed."""
+        executor = _make_executor()
+
+        popen, proc = _spawn(executor, _make_run())
+
+        data = json.loads(_written_bytes(proc))
+        assert data["session_id"] == "ses_abc"
+        assert data["mode"] == "start"
+        proc.stdin.close.assert_called_once()
+        assert popen.call_args.kwargs["env"]["AGENT_SESSION_ID"] == "ses_abc"
+
+    def test_executor_config_spliced_into_payload(self):
+        """The profile's pre-serialized executor_config ends up in the payload."""
+        profile = ExecutorProfile(
+            name="coding",
+            type="autonomous",
+            command="executors/claude-code/ao-claude-code-exec",
+            config={"model": "sonnet", "permission_mode": "bypassPermissions"},
+        )
+        executor = _make_executor(profile=profile)
+
+        _, proc = _spawn(executor, _make_run(agent_name="worker"))
+
+        data = json.loads(_written_bytes(proc))
+        assert data["executor_config"] == profile.config
+        assert data["agent_name"] == "worker"
+        assert data["session_id"] == "ses_abc"
+
+    def test_blueprint_spliced_with_placeholders_resolved(self):
+        """The blueprint is spliced into the payload with runner placeholders resolved."""
+        profile = ExecutorProfile(
+            name="coding",
+            type="autonomous",
+            command="executors/claude-code/ao-claude-code-exec",
+            config={"model": "sonnet"},
+        )
+        executor = _make_executor(profile=profile)
+        blueprint = {"name": "worker", "mcp_servers": {"o": {"url": "${runner.orchestrator_mcp_url}"}}}
+
+        _, proc = _spawn(executor, _make_run(resolved_agent_blueprint=blueprint))
+
+        data = json.loads(_written_bytes(proc))
+        assert data["agent_blueprint"] == {"name": "worker", "mcp_servers": {"o": {"url": MCP_URL}}}
+        assert data["executor_config"] == {"model": "sonnet"}
+        assert data["session_id"] == "ses_abc"
+
+    def test_oversized_payload_written_from_thread(self):
+        """Payloads that do not fit the pipe are written by a background thread."""
+        executor = _make_executor()
+        run = _make_run(parameters={"prompt": "x" * 2048})
+
+        with patch("executor._widen_pipe", return_value=False), \
+                patch("executor.threading.Thread") as thread_cls:
+            _, proc = _spawn(executor, run)
+
+        proc.stdin.buffer.write.assert_not_called()
+        thread_cls.return_value.start.assert_called_once()
+
+        # Run the writer body inline and check it writes and closes stdin
+        target = thread_cls.call_args.kwargs["target"]
+        target(*thread_cls.call_args.kwargs["args"])
+        assert json.loads(_written_bytes(proc))["parameters"]["prompt"] == "x" * 2048
+        proc.stdin.close.assert_called_once()
+
+    def test_stdin_writer_tolerates_broken_pipe(self):
+        """An executor that exits early does not crash the writer thread."""
+        proc = MagicMock()
+        proc.stdin.buffer.write.side_effect = BrokenPipeError()
+
+        _write_stdin_and_close(proc, b"{}")
+
+        proc.stdin.close.assert_called_once()
+
+    def test_env_uses_snapshot_until_refreshed(self):
+        """Executors get the env captured at init, updated by refresh_env()."""
+        with patch.dict(os.environ, {"AGENT_ORCHESTRATOR_API_URL": "http://old"}):
+            executor = _make_executor()
+            os.environ["AGENT_ORCHESTRATOR_API_URL"] = "http://gateway"
+
+            popen, _ = _spawn(executor, _make_run())
+            assert popen.call_args.kwargs["env"]["AGENT_ORCHESTRATOR_API_URL"] == "http://old"
+
+            executor.refresh_env()
+            popen, _ = _spawn(executor, _make_run())
+            assert popen.call_args.kwargs["env"]["AGENT_ORCHESTRATOR_API_URL"] == "http://gateway"
+
+    def test_spawns_executor_with_resolved_uv_path(self):
+        """The uv binary resolved at init is used as argv[0]."""
+        with patch("executor.shutil.which", return_value="/opt/bin/uv"):
+            executor = _make_executor()
+
+        popen, _ = _spawn(executor, _make_run())
+
+        cmd = popen.call_args.args[0]
+        assert cmd[:3] == ["/opt/bin/uv", "run", "--script"]
+        assert cmd[3] == str(executor.executor_path)
+
+    def test_payload_is_valid_json(self):
+        """Unicode prompts survive serialization as UTF-8 JSON."""
+        executor = _make_executor()
+        prompt = "Grüße 👋 — 日本語"
+
+        _, proc = _spawn(executor, _make_run(parameters={"prompt": prompt}))
+
+        data = json.loads(_written_bytes(proc).decode("utf-8"))
+        assert data["parameters"]["prompt"] == prompt
+
+    def test_persistent_writes_ndjson_line_and_keeps_stdin_open(self):
+        """Persistent executors get a newline-terminated payload; stdin stays open."""
+        executor = _make_executor(profile=_make_persistent_profile())
+
+        _, proc = _spawn(executor, _make_run())
+
+        written = _written_bytes(proc)
+        assert written.endswith(b"\n")
+        assert json.loads(written)["session_id"] == "ses_abc"
+        proc.stdin.buffer.flush.assert_called_once()
+        proc.stdin.close.assert_not_called()
+
+
+    def test_send_turn_writes_ndjson_bytes(self):
+        """Later turns use the same binary stdin path as the initial payload."""
+        executor = _make_executor(profile=_make_persistent_profile())
+        proc = MagicMock()
+        prompt = "Grüße 👋"
+
+        executor.send_turn(proc, _make_run(parameters={"prompt": prompt}))
+        executor.send_shutdown(proc)
+
+        lines = _written_bytes(proc).split(b"\n")
+        assert json.loads(lines[0]) == {"type": "turn", "parameters": {"prompt": prompt}}
+        assert json.loads(lines[1]) == {"type": "shutdown"}
+        assert lines[2] == b""
+        assert proc.stdin.buffer.flush.call_count == 2
+
+
+# ===========================================================================
+# TestWidenPipe
+# ===========================================================================
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="F_SETPIPE_SZ is Linux-only")
+class TestWidenPipe:
+    """Tests for _widen_pipe."""
+
+    def _pipe_size(self, fd):
+        import fcntl
+        return fcntl.fcntl(fd, fcntl.F_GETPIPE_SZ)
+
+    def test_small_payload_keeps_default_size(self):
+        """Payloads that fit the default pipe leave it untouched."""
+        r, w = os.pipe()
+        try:
+            before = self._pipe_size(w)
+            assert _widen_pipe(w, 1024) is True
+            assert self._pipe_size(w) == before
+        finally:
+            os.close(r)
+            os.close(w)
+
+    def test_large_payload_widens_pipe(self):
+        """Payloads above 64KB grow the pipe to fit them."""
+        r, w = os.pipe()
+        try:
+            assert _widen_pipe(w, 200 * 1024) is True
+            assert self._pipe_size(w) >= 200 * 1024
+        finally:
+            os.close(r)
+            os.close(w)
+
+
+# ===========================================================================
+# TestProfileDiscovery
+# ===========================================================================
+
+class TestProfileDiscovery:
+    """Tests for list_profiles and load_agents_from_profile."""
+
+    def test_list_profiles_returns_sorted_json_stems(self, tmp_path):
+        """Only *.json files are listed, without extension, sorted."""
+        (tmp_path / "coding.json").write_text("{}")
+        (tmp_path / "echo.json").write_text("{}")
+        (tmp_path / "README.md").write_text("")
+        (tmp_path / "dir.json").mkdir()
+
+        with patch("executor.get_profiles_dir", return_value=tmp_path):
+            assert list_profiles() == ["coding", "echo"]
+
+    def test_list_profiles_missing_dir(self, tmp_path):
+        """A missing profiles directory yields no profiles."""
+        with patch("executor.get_profiles_dir", return_value=tmp_path / "missing"):
+            assert list_profiles() == []
+
+    def test_load_agents_from_profile(self, tmp_path):
+        """Agent JSON files in agents_dir are loaded."""
+        (tmp_path / "a.json").write_text(json.dumps({"name": "a"}))
+        (tmp_path / "notes.txt").write_text("ignored")
+        profile = ExecutorProfile(
+            name="p", type="procedural", command="x", config={}, agents_dir=str(tmp_path)
+        )
+
+        agents = load_agents_from_profile(profile)
+
+        assert agents == [{"name": "a"}]
+
+    def test_load_agents_missing_dir(self, tmp_path):
+        """A missing agents_dir yields no agents."""
+        profile = ExecutorProfile(
+            name="p", type="procedural", command="x", config={},
+            agents_dir=str(tmp_path / "missing"),
+        )
+
+        assert load_agents_from_profile(profile) == []
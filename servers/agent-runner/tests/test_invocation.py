@@ -17,7 +17,7 @@ Tests cover:
 import json
 import pytest
 import sys
-from io import StringIO
+from io import BytesIO, TextIOWrapper
 from pathlib import Path
 from unittest.mock import patch
 
@@ -151,6 +151,19 @@ class TestFromJson:
 
         assert inv.prompt == "Hello 世界! 😀 ❤️"
 
+    def test_parse_lone_surrogate_escape(self):
+        """A lone surrogate escape (valid for the stdlib parser) is accepted."""
+        payload = json.dumps({
+            "schema_version": "2.2",
+            "mode": "start",
+            "session_id": "ses_abc123",
+            "parameters": {"prompt": "broken \ud800 text"},
+        })
+
+        inv = ExecutorInvocation.from_json(payload.encode())
+
+        assert inv.prompt == "broken \ud800 text"
+
     def test_parse_long_prompt(self):
         """Long prompts in parameters are handled correctly."""
         long_prompt = "x" * 100000  # 100KB prompt
@@ -210,6 +223,11 @@ class TestFromJson:
         with pytest.raises(ValueError, match="Missing required field: parameters"):
             ExecutorInvocation.from_json(payload)
 
+    def test_parse_non_object_rejected(self):
+        """A JSON value that is not an object raises ValueError."""
+        with pytest.raises(ValueError, match="expected an object"):
+            ExecutorInvocation.from_json('["schema_version", "mode", "session_id", "parameters"]')
+
     def test_parse_unsupported_version(self):
         """Unsupported schema version raises ValueError."""
         payload = json.dumps({
@@ -296,12 +314,35 @@ class TestFromStdin:
             "parameters": {"prompt": "From stdin"},
         })
 
-        with patch("sys.stdin", StringIO(payload)):
+        stdin = TextIOWrapper(BytesIO(payload.encode("utf-8")), encoding="utf-8")
+        with patch("sys.stdin", stdin):
             inv = ExecutorInvocation.from_stdin()
 
         assert inv.session_id == "ses_stdin_test"
         assert inv.prompt == "From stdin"
 
+    def test_from_stdin_decodes_utf8_bytes(self):
+        """Non-ASCII prompts read as raw bytes are decoded correctly."""
+        payload = json.dumps({
+            "schema_version": "2.2",
+            "mode": "start",
+            "session_id": "ses_stdin_utf8",
+            "parameters": {"prompt": "Grüße 👋"},
+        }, ensure_ascii=False)
+
+        stdin = TextIOWrapper(BytesIO(payload.encode("utf-8")), encoding="utf-8")
+        with patch("sys.stdin", stdin):
+            inv = ExecutorInvocation.from_stdin()
+
+        assert inv.prompt == "Grüße 👋"
+
+    def test_from_stdin_empty_raises(self):
+        """Empty stdin raises ValueError."""
+        stdin = TextIOWrapper(BytesIO(b"  \n"), encoding="utf-8")
+        with patch("sys.stdin", stdin):
+            with pytest.raises(ValueError, match="No input received on stdin"):
+                ExecutorInvocation.from_stdin()
+
 
 class TestSerialization:
     """Tests for serialization methods."""
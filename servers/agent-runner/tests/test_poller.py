@@ -3,15 +3,25 @@ Tests for RunPoller - background thread that polls coordinator for runs and comm
 
 Tests cover:
 - _handle_run: start session, resume routing, busy guard, broken pipe, one-shot resume
-- _handle_stop: graceful shutdown, SIGTERM, SIGKILL escalation, idle sessions
-- _poll_loop: deregistration signal, connection failure retries
+- _handle_stop: graceful shutdown, SIGTERM, SIGKILL escalation, idle sessions, non-blocking reap
+- _poll_loop: deregistration signal, connection failure retries, batched commands
+- _handle_script_sync: streamed extraction, executable bit, failed download, ETag skip, coalescing
 """
 
+import io
+import json
+import os
 import subprocess
+import sys
+import tarfile
+import threading
 import time
+from contextlib import contextmanager
 from unittest.mock import MagicMock, patch, call
 
-from api_client import Run, PollResult
+import pytest
+
+from api_client import Run, PollResult, ScriptDownload
 from registry import ProcessRegistry
 from poller import RunPoller
 
@@ -82,7 +92,7 @@ class TestHandleRun:
     """Tests for _handle_run method."""
 
     def test_start_session_spawns_process(self):
-        """start_session: executor.execute_run called, session registered, report_started called."""
+        """start_session: executor.execute_run called, session registered, start queued for next poll."""
         mock_api = MagicMock()
         mock_executor = MagicMock()
         mock_executor.is_persistent = False
@@ -109,8 +119,9 @@ class TestHandleRun:
         assert entry.current_run_id == "run_001"
         assert entry.persistent is False
 
-        # Verify report_started
-        mock_api.report_started.assert_called_once_with("lnch_test", "run_001")
+        # Verify start queued for the next poll (not a separate report_started)
+        assert poller._started_runs == ["run_001"]
+        mock_api.report_started.assert_not_called()
 
     def test_start_session_persistent_starts_stdout_reader(self):
         """Persistent executor triggers _start_stdout_reader callback."""
@@ -176,8 +187,9 @@ class TestHandleRun:
         entry = registry.get_session("ses_001")
         assert entry.current_run_id == "run_002"
 
-        # Verify report_started
-        mock_api.report_started.assert_called_once_with("lnch_test", "run_002")
+        # Verify start queued for the next poll (not a separate report_started)
+        assert poller._started_runs == ["run_002"]
+        mock_api.report_started.assert_not_called()
 
         # Verify execute_run was NOT called (no new process)
         mock_executor.execute_run.assert_not_called()
@@ -284,8 +296,9 @@ class TestHandleRun:
         assert entry.process is new_process
         assert entry.current_run_id == "run_002"
 
-        # Verify report_started
-        mock_api.report_started.assert_called_once_with("lnch_test", "run_002")
+        # Verify start queued for the next poll (not a separate report_started)
+        assert poller._started_runs == ["run_002"]
+        mock_api.report_started.assert_not_called()
 
     def test_resume_broken_pipe_reports_failed(self):
         """send_turn raising BrokenPipeError removes session and reports failure."""
@@ -518,6 +531,42 @@ class TestHandleStop:
 
         assert "ses_001" in mark_stopping_calls
 
+    @pytest.mark.skipif(not hasattr(os, "pidfd_open"), reason="pidfd is Linux-only")
+    def test_stop_returns_before_process_exits(self):
+        """The exit wait and report happen on the reaper, not the poll thread."""
+        mock_api = MagicMock()
+
+        # Ignores SIGTERM until it is told to exit via stdin
+        proc = subprocess.Popen(
+            [sys.executable, "-c",
+             "import signal, sys; signal.signal(signal.SIGTERM, signal.SIG_IGN); "
+             "print('ready', flush=True); sys.stdin.read()"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True,
+        )
+        try:
+            assert proc.stdout.readline().strip() == "ready"
+
+            registry = ProcessRegistry()
+            registry.register_session("ses_001", proc, "run_001", persistent=False)
+            poller = _make_poller(api_client=mock_api, registry=registry)
+
+            poller._handle_stop("ses_001")
+
+            # Still running and unreported: _handle_stop did not block on it
+            assert proc.poll() is None
+            assert poller.wait_for_stops(timeout=0.1) is False
+            mock_api.report_stopped.assert_not_called()
+
+            proc.stdin.close()
+            assert poller.wait_for_stops(timeout=10) is True
+            mock_api.report_stopped.assert_called_once_with(
+                "lnch_test", "run_001", signal="SIGTERM"
+            )
+            assert registry.get_session("ses_001") is None
+        finally:
+            proc.kill()
+            proc.wait()
+
 
 # ===========================================================================
 # TestPollLoop
@@ -526,8 +575,7 @@ class TestHandleStop:
 class TestPollLoop:
     """Tests for _poll_loop method."""
 
-    @patch("poller.time.sleep")
-    def test_deregistration_exits_loop(self, mock_sleep):
+    def test_deregistration_exits_loop(self):
         """poll_run returns deregistered=True: on_deregistered called, loop exits."""
         mock_api = MagicMock()
         mock_api.poll_run.return_value = PollResult(deregistered=True)
@@ -542,13 +590,12 @@ class TestPollLoop:
         poller._poll_loop()
 
         # Verify poll was called
-        mock_api.poll_run.assert_called_once_with("lnch_test")
+        mock_api.poll_run.assert_called_once_with("lnch_test", started_runs=[])
 
         # Verify on_deregistered callback was called
         on_dereg.assert_called_once()
 
-    @patch("poller.time.sleep")
-    def test_connection_failures_exit_after_retries(self, mock_sleep):
+    def test_connection_failures_exit_after_retries(self):
         """poll_run raises exception 3 times: on_deregistered called after MAX_CONNECTION_RETRIES."""
         mock_api = MagicMock()
         mock_api.poll_run.side_effect = ConnectionError("refused")
@@ -559,7 +606,8 @@ class TestPollLoop:
             on_deregistered=on_dereg,
         )
 
-        poller._poll_loop()
+        with patch.object(poller._stop_event, "wait", return_value=False) as mock_wait:
+            poller._poll_loop()
 
         # Verify poll was called exactly 3 times (MAX_CONNECTION_RETRIES)
         assert mock_api.poll_run.call_count == 3
@@ -567,5 +615,295 @@ class TestPollLoop:
         # Verify on_deregistered callback was called
         on_dereg.assert_called_once()
 
-        # Verify sleep was called for backoff (between failures, not after last)
-        assert mock_sleep.call_count == 2  # sleep after failure 1 and 2, not after 3
+        # Verify backoff wait happened between failures, not after last
+        assert mock_wait.call_count == 2  # wait after failure 1 and 2, not after 3
+
+    def test_stop_interrupts_backoff(self):
+        """stop() wakes the retry backoff instead of waiting it out."""
+        mock_api = MagicMock()
+        mock_api.poll_run.side_effect = ConnectionError("refused")
+
+        on_dereg = MagicMock()
+        poller = _make_poller(api_client=mock_api, on_deregistered=on_dereg)
+        poller._backoff_seconds = 30.0
+
+        poller.start()
+        time.sleep(0.1)  # first poll fails, loop enters backoff
+        started = time.monotonic()
+        poller.stop()
+
+        assert time.monotonic() - started < 5.0
+        assert mock_api.poll_run.call_count == 1
+        on_dereg.assert_not_called()
+
+    def test_started_runs_piggyback_on_next_poll(self):
+        """A run started from one poll is reported on the following poll request."""
+        run = _make_run(run_id="run_001")
+        mock_api = MagicMock()
+        polls = []
+
+        def poll_run(runner_id, started_runs):
+            polls.append(list(started_runs))
+            return PollResult(run=run) if len(polls) == 1 else PollResult(deregistered=True)
+
+        mock_api.poll_run.side_effect = poll_run
+        mock_executor = MagicMock()
+        mock_executor.is_persistent = False
+
+        poller = _make_poller(
+            api_client=mock_api, executor=mock_executor, on_deregistered=MagicMock()
+        )
+        poller._poll_loop()
+
+        assert polls == [[], ["run_001"]]
+        assert poller._started_runs == []
+        mock_api.report_started.assert_not_called()
+
+    def test_started_runs_kept_when_poll_not_delivered(self):
+        """Starts stay queued when the poll times out before reaching the coordinator."""
+        mock_api = MagicMock()
+        polls = []
+
+        def poll_run(runner_id, started_runs):
+            polls.append(list(started_runs))
+            if len(polls) == 1:
+                return PollResult(started_reported=False)
+            return PollResult(deregistered=True)
+
+        mock_api.poll_run.side_effect = poll_run
+        poller = _make_poller(api_client=mock_api, on_deregistered=MagicMock())
+        poller._started_runs = ["run_001"]
+
+        poller._poll_loop()
+
+        assert polls == [["run_001"], ["run_001"]]
+        assert poller._started_runs == []
+
+    def test_started_runs_reported_when_stopped(self):
+        """Starts still queued when the loop stops are reported directly."""
+        run = _make_run(run_id="run_001")
+        mock_api = MagicMock()
+        mock_executor = MagicMock()
+        mock_executor.is_persistent = False
+        poller = _make_poller(api_client=mock_api, executor=mock_executor)
+
+        def poll_run(runner_id, started_runs):
+            poller._stop_event.set()
+            return PollResult(run=run)
+
+        mock_api.poll_run.side_effect = poll_run
+
+        poller._poll_loop()
+
+        mock_api.report_started.assert_called_once_with("lnch_test", "run_001")
+        assert poller._started_runs == []
+
+    def test_batched_commands_handled_in_one_pass(self):
+        """Stops, script sync/remove and a run from one poll are handled in order."""
+        run = _make_run()
+        mock_api = MagicMock()
+        mock_api.poll_run.side_effect = [
+            PollResult(
+                run=run,
+                stop_sessions=["ses_old"],
+                sync_scripts=["script-a"],
+                remove_scripts=["script-b"],
+            ),
+            PollResult(deregistered=True),
+        ]
+
+        poller = _make_poller(api_client=mock_api, on_deregistered=MagicMock())
+        order = MagicMock()
+        poller._handle_stop = order.stop
+        poller._handle_script_sync = order.sync
+        poller._handle_script_remove = order.remove
+        poller._handle_run = order.run
+
+        poller._poll_loop()
+
+        assert order.mock_calls == [
+            call.stop("ses_old"),
+            call.sync("script-a"),
+            call.remove("script-b"),
+            call.run(run),
+        ]
+        assert mock_api.poll_run.call_count == 2
+
+    def test_script_syncs_complete_before_removes_and_run(self):
+        """Syncs run in the pool but all finish before removes and the run."""
+        run = _make_run()
+        mock_api = MagicMock()
+        mock_api.poll_run.side_effect = [
+            PollResult(run=run, sync_scripts=["a", "b", "c"], remove_scripts=["old"]),
+            PollResult(deregistered=True),
+        ]
+
+        poller = _make_poller(api_client=mock_api, on_deregistered=MagicMock())
+        events = []
+        lock = threading.Lock()
+
+        def record_sync(name):
+            with lock:
+                events.append(("sync", name))
+
+        poller._handle_script_sync = record_sync
+        poller._handle_script_remove = lambda name: events.append(("remove", name))
+        poller._handle_run = lambda r: events.append(("run", r.run_id))
+
+        poller._poll_loop()
+
+        assert sorted(events[:3]) == [("sync", "a"), ("sync", "b"), ("sync", "c")]
+        assert events[3:] == [("remove", "old"), ("run", "run_001")]
+
+
+# ===========================================================================
+# TestHandleScriptSync
+# ===========================================================================
+
+def _script_tarball(script_name, script_file="run.sh", content=b"echo hi", with_meta=True):
+    """Build a tar.gz like the coordinator's download endpoint (name/ prefix)."""
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:gz") as tar:
+        files = {f"{script_name}/{script_file}": content}
+        if with_meta:
+            files[f"{script_name}/script.json"] = json.dumps({"script_file": script_file}).encode()
+        for name, data in files.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mode = 0o644
+            tar.addfile(info, io.BytesIO(data))
+    return buf.getvalue()
+
+
+def _api_serving(tarball, etag=None):
+    """Mock api client whose download_script_stream serves the given bytes.
+
+    Mirrors the coordinator: answers not_modified when the caller's etag matches.
+    """
+    api = MagicMock()
+
+    @contextmanager
+    def download_script_stream(script_name, etag=None):
+        if tarball is None:
+            yield None
+        elif etag is not None and etag == served_etag:
+            yield ScriptDownload(etag=etag, not_modified=True)
+        else:
+            yield ScriptDownload(stream=io.BytesIO(tarball), etag=served_etag)
+
+    served_etag = etag
+    api.download_script_stream.side_effect = download_script_stream
+    return api
+
+
+class TestHandleScriptSync:
+    """Tests for _handle_script_sync method."""
+
+    def test_sync_extracts_script_and_marks_executable(self, tmp_path):
+        """Tarball is extracted to scripts/<name>/ and script_file is executable."""
+        poller = _make_poller(api_client=_api_serving(_script_tarball("my-script")))
+        poller._scripts_dir = tmp_path
+
+        poller._handle_script_sync("my-script")
+
+        script_file = tmp_path / "my-script" / "run.sh"
+        assert script_file.read_bytes() == b"echo hi"
+        assert os.access(script_file, os.X_OK)
+        # No staging directories are left behind
+        assert [p.name for p in tmp_path.iterdir()] == ["my-script"]
+
+    def test_sync_replaces_existing_version(self, tmp_path):
+        """An existing script directory is replaced by the new version."""
+        old_dir = tmp_path / "my-script"
+        old_dir.mkdir()
+        (old_dir / "stale.txt").write_text("old")
+        poller = _make_poller(
+            api_client=_api_serving(_script_tarball("my-script", content=b"v2"))
+        )
+        poller._scripts_dir = tmp_path
+
+        poller._handle_script_sync("my-script")
+
+        assert not (old_dir / "stale.txt").exists()
+        assert (old_dir / "run.sh").read_bytes() == b"v2"
+
+    def test_failed_download_keeps_existing_version(self, tmp_path):
+        """A corrupt tarball leaves the current version in place."""
+        old_dir = tmp_path / "my-script"
+        old_dir.mkdir()
+        (old_dir / "run.sh").write_text("v1")
+        poller = _make_poller(api_client=_api_serving(b"not a tarball"))
+        poller._scripts_dir = tmp_path
+
+        poller._handle_script_sync("my-script")
+
+        assert (old_dir / "run.sh").read_text() == "v1"
+        assert [p.name for p in tmp_path.iterdir()] == ["my-script"]
+
+    def test_missing_script_json_is_reported(self, tmp_path, caplog):
+        """Without script.json the files are installed but nothing is made executable."""
+        poller = _make_poller(
+            api_client=_api_serving(_script_tarball("my-script", with_meta=False))
+        )
+        poller._scripts_dir = tmp_path
+
+        poller._handle_script_sync("my-script")
+
+        assert "script.json not found after extraction" in caplog.text
+        assert not os.access(tmp_path / "my-script" / "run.sh", os.X_OK)
+
+    def test_missing_script_is_skipped(self, tmp_path):
+        """A 404 from the coordinator does not create anything."""
+        poller = _make_poller(api_client=_api_serving(None))
+        poller._scripts_dir = tmp_path
+
+        poller._handle_script_sync("missing")
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_sync_stores_etag_and_skips_when_unchanged(self, tmp_path):
+        """The ETag is stored with the script and sent back on the next sync."""
+        api = _api_serving(_script_tarball("my-script"), etag='"abc"')
+        poller = _make_poller(api_client=api)
+        poller._scripts_dir = tmp_path
+
+        poller._handle_script_sync("my-script")
+        assert (tmp_path / "my-script" / ".etag").read_text() == '"abc"'
+
+        # Local edit survives a redundant sync: nothing is re-extracted
+        (tmp_path / "my-script" / "run.sh").write_bytes(b"local")
+        poller._handle_script_sync("my-script")
+
+        assert api.download_script_stream.call_args.kwargs["etag"] == '"abc"'
+        assert (tmp_path / "my-script" / "run.sh").read_bytes() == b"local"
+
+    def test_duplicate_syncs_are_coalesced(self, tmp_path):
+        """Concurrent syncs of one script share a single download."""
+        api = _api_serving(_script_tarball("my-script"))
+        real_download = api.download_script_stream.side_effect
+        release = threading.Event()
+
+        @contextmanager
+        def slow_download(script_name, etag=None):
+            release.wait(timeout=5)
+            with real_download(script_name, etag=etag) as download:
+                yield download
+
+        api.download_script_stream.side_effect = slow_download
+        poller = _make_poller(api_client=api)
+        poller._scripts_dir = tmp_path
+
+        threads = [
+            threading.Thread(target=poller._handle_script_sync, args=("my-script",))
+            for _ in range(3)
+        ]
+        for t in threads:
+            t.start()
+        time.sleep(0.1)  # all three requests arrive while the first is downloading
+        release.set()
+        for t in threads:
+            t.join(timeout=5)
+
+        assert api.download_script_stream.call_count == 1
+        assert (tmp_path / "my-script" / "run.sh").read_bytes() == b"echo hi"
+        assert poller._inflight_syncs == {}
@@ -7,13 +7,19 @@ Tests cover:
 - Swap and clear run operations
 - Stopping dedup guard
 - Concurrent access safety
+- ProcessReaper exit notification
 """
 
+import os
 import subprocess
+import sys
 import threading
+import time
 from unittest.mock import MagicMock
 
-from registry import ProcessRegistry
+import pytest
+
+from registry import ProcessRegistry, ProcessReaper
 
 
 def _mock_process(pid=1234, poll_return=None):
@@ -47,6 +53,22 @@ class TestRegisterAndGet:
         entry = reg.get_session("ses_001")
         assert entry.persistent is True
 
+    def test_on_register_called_after_insert(self):
+        reg = ProcessRegistry()
+        seen = []
+        reg.on_register = lambda sid: seen.append(reg.get_session(sid) is not None)
+
+        reg.register_session("ses_001", _mock_process(), "run_001")
+
+        assert seen == [True]
+
+    def test_started_at_is_monotonic(self):
+        reg = ProcessRegistry()
+        before = time.monotonic_ns()
+        reg.register_session("ses_001", _mock_process(), "run_001")
+
+        assert before <= reg.get_session("ses_001").started_at_ns <= time.monotonic_ns()
+
     def test_get_nonexistent_session(self):
         reg = ProcessRegistry()
         assert reg.get_session("ses_nonexistent") is None
@@ -265,3 +287,107 @@ class TestConcurrency:
         assert len(errors) == 0
         # Session should still exist
         assert reg.get_session("ses_001") is not None
+
+
+def _wait_until(predicate, timeout=10.0):
+    """Poll predicate until it is true or timeout passes."""
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+@pytest.mark.skipif(not hasattr(os, "pidfd_open"), reason="pidfd is Linux-only")
+class TestProcessReaper:
+    """Test ProcessReaper exit notification on real child processes."""
+
+    def test_reports_exit_and_reaps(self):
+        reaper = ProcessReaper()
+        results = []
+        proc = subprocess.Popen([sys.executable, "-c", "raise SystemExit(3)"])
+
+        reaper.watch(proc, results.append, timeout=10)
+
+        assert _wait_until(lambda: results)
+        assert results == [True]
+        assert proc.returncode == 3
+
+    def test_watch_returns_before_exit(self):
+        reaper = ProcessReaper()
+        results = []
+        proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+        try:
+            reaper.watch(proc, results.append, timeout=10)
+            assert results == []
+
+            proc.terminate()
+            assert _wait_until(lambda: results)
+            assert results == [True]
+        finally:
+            proc.kill()
+            proc.wait()
+
+    def test_timeout_leaves_process_running(self):
+        reaper = ProcessReaper()
+        results = []
+        proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+        try:
+            reaper.watch(proc, results.append, timeout=0.1)
+
+            assert _wait_until(lambda: results)
+            assert results == [False]
+            assert proc.poll() is None
+        finally:
+            proc.kill()
+            proc.wait()
+
+    def test_many_watches_share_one_thread(self):
+        def reaper_threads():
+            return sum(1 for t in threading.enumerate() if t.name == "process-reaper")
+
+        before = reaper_threads()
+        reaper = ProcessReaper()
+        results = []
+        procs = [
+            subprocess.Popen([sys.executable, "-c", f"raise SystemExit({i})"])
+            for i in range(5)
+        ]
+
+        for proc in procs:
+            reaper.watch(proc, results.append, timeout=10)
+
+        assert _wait_until(lambda: len(results) == 5)
+        assert [p.returncode for p in procs] == [0, 1, 2, 3, 4]
+        assert reaper_threads() == before + 1
+
+
+class TestProcessReaperFallback:
+    """Test the blocking fallback used when no pidfd can be opened."""
+
+    def test_already_reaped_process(self):
+        reaper = ProcessReaper()
+        results = []
+        proc = subprocess.Popen([sys.executable, "-c", "pass"])
+        proc.wait()
+
+        reaper.watch(proc, results.append, timeout=1)
+
+        assert results == [True]
+
+    def test_not_our_child_waits_inline(self):
+        proc = _mock_process(pid=os.getpid())
+        results = []
+
+        ProcessReaper().watch(proc, results.append, timeout=5)
+
+        proc.wait.assert_called_once_with(timeout=5)
+        assert results == [True]
+
+    def test_inline_timeout(self):
+        proc = _mock_process(pid=os.getpid())
+        proc.wait.side_effect = subprocess.TimeoutExpired("cmd", 5)
+        results = []
+
+        ProcessReaper().watch(proc, results.append, timeout=5)
+
+        assert results == [False]
@@ -3,16 +3,28 @@ Tests for RunnerGateway — local HTTP proxy between executors and coordinator.
 
 Verifies:
 - POST /bind enriches requests with hostname and executor_profile
-- POST /events forwards to coordinator at correct path
+- POST /events and /events/batch forward to coordinator at correct path
 - PATCH /metadata strips session_id from body and forwards
 - Other routes (GET, POST) are forwarded as-is
 - Missing required fields return 400
+- Requests are served by a bounded worker pool
 """
 
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+from unittest.mock import MagicMock
+
 import httpx
 import pytest
 
-from runner_gateway import RunnerGateway
+from runner_gateway import (
+    RunnerGateway, RunnerGatewayHandler, PooledHTTPServer, _gateway_workers, DEFAULT_GATEWAY_WORKERS,
+)
 from fakes.fake_coordinator import FakeCoordinator
 
 
@@ -96,6 +108,28 @@ class TestBindRoute:
         assert len(bind_calls) == 1
         assert bind_calls[0]["project_dir"] == "/home/user/project"
 
+    def test_bind_body_is_valid_json_with_escaped_values(self, client, coordinator):
+        """Spliced runner fields must still yield a well-formed JSON object."""
+        response = client.post("/bind", json={
+            "session_id": "ses_006",
+            "executor_session_id": 'exec "quoted"',
+            "project_dir": "/tmp/prøject",
+        })
+
+        assert response.status_code == 200
+        call = coordinator.get_bind_calls()[0]
+        assert call["executor_session_id"] == 'exec "quoted"'
+        assert call["project_dir"] == "/tmp/prøject"
+        assert call["hostname"] == "test-host"
+        assert call["executor_profile"] == "test-profile"
+
+    def test_bind_zero_content_length_returns_400(self, client, coordinator):
+        """An explicit Content-Length: 0 is treated as a missing body."""
+        response = client.post("/bind", content=b"", headers={"Content-Length": "0"})
+
+        assert response.status_code == 400
+        assert len(coordinator.get_bind_calls()) == 0
+
     def test_bind_missing_session_id_returns_400(self, client, coordinator):
         """400 when session_id is missing from the request body."""
         response = client.post("/bind", json={
@@ -159,6 +193,20 @@ class TestEventsRoute:
         # Nothing should be forwarded
         assert len(coordinator.get_event_calls()) == 0
 
+    def test_events_batch_forwarded_to_coordinator(self, client, coordinator):
+        """A batch is forwarded in one call to POST /sessions/{session_id}/events/batch."""
+        response = client.post("/events/batch", json={
+            "session_id": "ses_011",
+            "events": [
+                {"session_id": "ses_011", "event_type": "post_tool", "tool_name": "Read"},
+                {"session_id": "ses_011", "event_type": "post_tool", "tool_name": "Edit"},
+            ],
+        })
+
+        assert response.status_code == 201
+        assert [c["tool_name"] for c in coordinator.get_event_calls()] == ["Read", "Edit"]
+        assert len(coordinator.get_calls_by_path("/sessions/ses_011/events/batch")) == 1
+
 
 # =========================================================================
 # TestMetadataRoute
@@ -245,3 +293,167 @@ class TestForwarding:
         heartbeats = coordinator.get_heartbeats()
         assert len(heartbeats) == 1
         assert heartbeats[0]["runner_id"] == "lnch_test12345"
+
+    def test_large_request_body_streamed_intact(self, client, coordinator):
+        """Request bodies larger than one chunk are streamed through unchanged."""
+        sessions = [f"ses_{i:06d}" for i in range(10000)]
+        response = client.post("/runner/heartbeat", json={
+            "runner_id": "lnch_big",
+            "active_sessions": sessions,
+        })
+
+        assert response.status_code == 200
+        heartbeats = coordinator.get_heartbeats()
+        assert heartbeats[0]["active_sessions"] == sessions
+
+    def test_large_response_streamed_intact(self, client, coordinator):
+        """Bodies spanning several stream chunks arrive complete with their length."""
+        payload = os.urandom(300 * 1024)
+        coordinator.set_script_tarball("big", payload)
+
+        response = client.get("/scripts/big/download")
+
+        assert response.status_code == 200
+        assert response.headers["Content-Length"] == str(len(payload))
+        assert response.content == payload
+
+    def test_error_response_forwarded(self, client, coordinator):
+        """Coordinator errors keep their status and JSON body."""
+        response = client.get("/scripts/missing/download")
+
+        assert response.status_code == 404
+        assert response.json() == {"detail": "Script not found"}
+
+
+# =========================================================================
+# TestAuthHeader
+# =========================================================================
+
+
+class TestAuthHeader:
+    """Authorization is resolved from the Auth0 client once per request."""
+
+    def test_auth_resolved_once_per_request(self, coordinator):
+        auth0 = MagicMock()
+        auth0.is_configured = True
+        auth0.get_authorization_header.return_value = "Bearer tok"
+        gw = RunnerGateway(coordinator_url=coordinator.url, auth0_client=auth0)
+        gw.start()
+        try:
+            with httpx.Client(base_url=gw.url, timeout=5.0) as c:
+                c.post("/bind", json={"session_id": "ses_001", "executor_session_id": "exec_001"})
+                c.get("/sessions/ses_001")
+        finally:
+            gw.stop()
+
+        assert auth0.get_authorization_header.call_count == 2
+
+# =========================================================================
+# TestCoordinatorUnavailable
+# =========================================================================
+
+
+class TestCoordinatorUnavailable:
+    """Runner-handled routes report 502 when the coordinator is unreachable."""
+
+    def test_bind_returns_502_json(self):
+        gw = RunnerGateway(coordinator_url="http://127.0.0.1:1")
+        gw.start()
+        try:
+            with httpx.Client(base_url=gw.url, timeout=5.0) as c:
+                response = c.post("/bind", json={
+                    "session_id": "ses_001",
+                    "executor_session_id": "exec_001",
+                })
+        finally:
+            gw.stop()
+
+        assert response.status_code == 502
+        assert response.headers["Content-Type"] == "application/json"
+        assert "Failed to connect" in response.json()["detail"]
+
+# =========================================================================
+# TestWorkerPool
+# =========================================================================
+
+
+class TestWorkerPool:
+    """Requests are handled on a fixed pool of reused worker threads."""
+
+    def test_concurrent_requests_served_by_bounded_pool(self, coordinator):
+        gw = RunnerGateway(coordinator_url=coordinator.url, max_workers=2)
+        gw.start()
+        try:
+            def get(i):
+                with httpx.Client(base_url=gw.url, timeout=5.0) as c:
+                    results.append(c.get(f"/sessions/ses_{i:03d}").status_code)
+
+            results = []
+            threads = [threading.Thread(target=get, args=(i,)) for i in range(10)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+            assert results == [200] * 10
+            assert 1 <= len(gw._server._workers) <= 2
+        finally:
+            gw.stop()
+
+    def test_stop_does_not_wait_for_stalled_request(self, coordinator):
+        """A request stuck mid-read does not hold up stop()."""
+        gw = RunnerGateway(coordinator_url=coordinator.url, max_workers=1)
+        gw.start()
+        # Headers never finished: the worker blocks reading this socket
+        stalled = socket.create_connection(("127.0.0.1", gw._port))
+        try:
+            stalled.sendall(b"GET /sessions/ses_001 HTTP/1.1\r\n")
+            time.sleep(0.1)
+            worker = gw._server._workers[0]
+
+            started = time.monotonic()
+            gw.stop()
+
+            assert time.monotonic() - started < 2.0
+            assert worker.daemon
+        finally:
+            stalled.close()
+
+    def test_process_exits_with_request_in_flight(self, coordinator):
+        """Runner exit is not blocked by a gateway worker busy with a request."""
+        lib_dir = os.path.join(os.path.dirname(__file__), "..", "lib")
+        code = (
+            "import socket, sys, time\n"
+            "from runner_gateway import RunnerGateway\n"
+            "gw = RunnerGateway(coordinator_url=sys.argv[1], max_workers=1)\n"
+            "gw.start()\n"
+            "s = socket.create_connection(('127.0.0.1', gw._port))\n"
+            "s.sendall(b'GET /x HTTP/1.1\\r\\n')\n"
+            "time.sleep(0.1)\n"
+            "gw.stop()\n"
+        )
+        env = dict(os.environ, PYTHONPATH=lib_dir)
+        result = subprocess.run(
+            [sys.executable, "-c", code, coordinator.url], env=env, timeout=10
+        )
+        assert result.returncode == 0
+
+    def test_accepted_sockets_disable_nagle(self):
+        server = PooledHTTPServer(("127.0.0.1", 0), RunnerGatewayHandler, max_workers=1)
+        try:
+            with socket.create_connection(server.server_address):
+                request, _ = server.get_request()
+                try:
+                    assert request.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+                finally:
+                    request.close()
+        finally:
+            server.server_close()
+
+    def test_workers_from_env(self, monkeypatch):
+        monkeypatch.setenv("AGENT_GATEWAY_WORKERS", "7")
+        assert _gateway_workers() == 7
+
+    def test_invalid_workers_env_uses_default(self, monkeypatch):
+        monkeypatch.setenv("AGENT_GATEWAY_WORKERS", "many")
+        assert _gateway_workers() == DEFAULT_GATEWAY_WORKERS
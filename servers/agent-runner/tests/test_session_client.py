@@ -0,0 +1,179 @@
+"""
+Tests for SessionClient — executor-side client for the Runner Gateway.
+
+Tests cover:
+- Events are batched and delivered in order through the gateway
+- flush() sends queued events synchronously
+- close() drains the queue
+- Background delivery failures are logged and raised by the next flush()
+"""
+
+import time
+
+import pytest
+
+import session_client
+from runner_gateway import RunnerGateway
+from session_client import SessionClient, SessionClientError
+from fakes.fake_coordinator import FakeCoordinator
+
+
+@pytest.fixture
+def coordinator():
+    """Start a FakeCoordinator for the gateway to forward to."""
+    fc = FakeCoordinator(poll_timeout=0.3)
+    fc.start()
+    yield fc
+    fc.stop()
+
+
+@pytest.fixture
+def gateway(coordinator):
+    """Start a RunnerGateway pointing at the FakeCoordinator."""
+    gw = RunnerGateway(coordinator_url=coordinator.url)
+    gw.start()
+    yield gw
+    gw.stop()
+
+
+def _event(i):
+    return {"event_type": "post_tool", "timestamp": f"2026-01-01T00:00:{i:02d}Z", "tool_name": f"tool_{i}"}
+
+
+# =========================================================================
+# TestEventBatching
+# =========================================================================
+
+
+class TestEventBatching:
+    """add_event queues events; they reach the coordinator in batches, in order."""
+
+    def test_flush_sends_queued_events_in_one_batch(self, gateway, coordinator, monkeypatch):
+        monkeypatch.setattr(session_client, "EVENT_BATCH_DELAY", 10.0)
+        client = SessionClient(gateway.url)
+        try:
+            for i in range(5):
+                client.add_event("ses_001", _event(i))
+            client.flush()
+
+            events = coordinator.get_event_calls()
+            assert [e["tool_name"] for e in events] == [f"tool_{i}" for i in range(5)]
+            assert all(e["session_id"] == "ses_001" for e in events)
+            assert len(coordinator.get_calls_by_path("/sessions/ses_001/events/batch")) == 1
+        finally:
+            client.close()
+
+    def test_background_flush_preserves_order(self, gateway, coordinator):
+        client = SessionClient(gateway.url)
+        try:
+            for i in range(150):
+                client.add_event("ses_001", _event(i % 60))
+        finally:
+            client.close()
+
+        events = coordinator.get_event_calls()
+        assert [e["tool_name"] for e in events] == [f"tool_{i % 60}" for i in range(150)]
+        # 150 events in far fewer requests
+        assert len(coordinator.get_calls_by_path("/sessions/ses_001/events/batch")) < 150
+
+    def test_lone_surrogate_in_event_is_delivered(self, gateway, coordinator, monkeypatch):
+        """Text json.loads produced from a lone surrogate escape still serializes."""
+        monkeypatch.setattr(session_client, "EVENT_BATCH_DELAY", 10.0)
+        client = SessionClient(gateway.url)
+        try:
+            client.add_event("ses_001", {**_event(0), "tool_output": "bad \ud800"})
+            client.flush()
+
+            events = coordinator.get_event_calls()
+            assert events[0]["tool_output"] == "bad \ud800"
+        finally:
+            client.close()
+
+    def test_sessions_are_not_mixed_in_a_batch(self, gateway, coordinator, monkeypatch):
+        monkeypatch.setattr(session_client, "EVENT_BATCH_DELAY", 10.0)
+        client = SessionClient(gateway.url)
+        try:
+            client.add_event("ses_a", _event(1))
+            client.add_event("ses_b", _event(2))
+            client.add_event("ses_a", _event(3))
+            client.flush()
+        finally:
+            client.close()
+
+        events = coordinator.get_event_calls()
+        assert [(e["session_id"], e["tool_name"]) for e in events] == [
+            ("ses_a", "tool_1"), ("ses_b", "tool_2"), ("ses_a", "tool_3"),
+        ]
+
+    def test_context_manager_sends_queued_events_and_closes(self, gateway, coordinator, monkeypatch):
+        monkeypatch.setattr(session_client, "EVENT_BATCH_DELAY", 10.0)
+        with SessionClient(gateway.url) as client:
+            client.add_event("ses_001", _event(0))
+
+        assert [e["tool_name"] for e in coordinator.get_event_calls()] == ["tool_0"]
+        with pytest.raises(SessionClientError):
+            client.add_event("ses_001", _event(1))
+
+    def test_add_event_after_close_raises(self, gateway):
+        client = SessionClient(gateway.url)
+        client.close()
+
+        with pytest.raises(SessionClientError):
+            client.add_event("ses_001", _event(0))
+
+    def test_flush_reports_delivery_failure(self):
+        client = SessionClient("http://127.0.0.1:1", timeout=1.0)
+        try:
+            client._events.append(("ses_001", _event(0)))
+            with pytest.raises(SessionClientError):
+                client.flush()
+        finally:
+            client.close()
+
+    def test_background_failure_is_logged_and_raised_by_flush(self, monkeypatch, caplog):
+        monkeypatch.setattr(session_client, "EVENT_BATCH_DELAY", 0.0)
+        client = SessionClient("http://127.0.0.1:1", timeout=1.0)
+        try:
+            with caplog.at_level("WARNING", logger="session_client"):
+                client.add_event("ses_001", _event(0))
+                client.add_event("ses_001", _event(1))
+                deadline = time.monotonic() + 5.0
+                while not client._delivery_error and time.monotonic() < deadline:
+                    time.sleep(0.01)
+
+            assert "ses_001" in caplog.text
+            with pytest.raises(SessionClientError, match="not delivered"):
+                client.flush()
+            # Reported once
+            client.flush()
+        finally:
+            client.close()
+
+    def test_unexpected_error_does_not_kill_flush_thread(self, gateway, coordinator, monkeypatch, caplog):
+        monkeypatch.setattr(session_client, "EVENT_BATCH_DELAY", 0.0)
+        client = SessionClient(gateway.url)
+        send_events = client._send_events
+        calls = []
+
+        def fail_once(pending):
+            calls.append(len(pending))
+            if len(calls) == 1:
+                raise RuntimeError("unexpected")
+            send_events(pending)
+
+        client._send_events = fail_once
+        try:
+            client.add_event("ses_001", _event(0))
+            deadline = time.monotonic() + 5.0
+            while not client._delivery_error and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert "unexpected" in caplog.text
+            assert client._flush_thread.is_alive()
+
+            with pytest.raises(SessionClientError, match="unexpected"):
+                client.flush()
+            client.add_event("ses_001", _event(1))
+            client.flush()
+            assert [e["tool_name"] for e in coordinator.get_event_calls()] == ["tool_1"]
+        finally:
+            client.close()
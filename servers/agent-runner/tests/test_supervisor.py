@@ -2,12 +2,15 @@
 Unit tests for RunSupervisor - background thread monitoring executor subprocesses.
 
 Tests cover:
-- One-shot process exit (success/failure)
+- One-shot process exit (success/failure, stopping dedup)
 - Persistent process exit (crash with active run, idle exit, stopping dedup)
 - Stdout reader (turn_complete NDJSON, non-JSON tolerance, dedup)
+- Reporter pool (reports off the supervision thread, drained on stop)
+- Supervision loop (pidfd exit wakeups, pipe draining, stopping dedup, prompt stop)
 """
 
 import os
+import sys
 import subprocess
 import threading
 import time
@@ -24,20 +27,21 @@ from supervisor import RunSupervisor
 # Helpers
 # ---------------------------------------------------------------------------
 
+def _make_output_pipe(text):
+    """Create a text pipe holding text, like the output of an exited process."""
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, text.encode())
+    os.close(write_fd)
+    return os.fdopen(read_fd, "r")
+
+
 def _make_mock_process(poll_return=None, stdout_text="", stderr_text=""):
     """Create a MagicMock that behaves like subprocess.Popen."""
     proc = MagicMock(spec=subprocess.Popen)
     proc.pid = 1234
     proc.poll.return_value = poll_return
-
-    proc.stdout = MagicMock()
-    proc.stdout.closed = False
-    proc.stdout.read.return_value = stdout_text
-
-    proc.stderr = MagicMock()
-    proc.stderr.closed = False
-    proc.stderr.read.return_value = stderr_text
-
+    proc.stdout = _make_output_pipe(stdout_text)
+    proc.stderr = _make_output_pipe(stderr_text)
     return proc
 
 
@@ -50,6 +54,11 @@ def _make_api_client():
     return mock_api
 
 
+def _drain_reports(supervisor):
+    """Wait for reports queued on the supervisor's reporter pool."""
+    supervisor._reporter.shutdown(wait=True)
+
+
 RUNNER_ID = "test-runner-001"
 
 
@@ -71,6 +80,8 @@ class TestOneshotExit:
 
         supervisor._check_runs()
 
+        _drain_reports(supervisor)
+
         api.report_completed.assert_called_once_with(
             RUNNER_ID, "run-1", session_status="finished"
         )
@@ -86,6 +97,8 @@ class TestOneshotExit:
 
         supervisor._check_runs()
 
+        _drain_reports(supervisor)
+
         api.report_failed.assert_called_once_with(
             RUNNER_ID, "run-2", "segfault in module X"
         )
@@ -101,6 +114,8 @@ class TestOneshotExit:
 
         supervisor._check_runs()
 
+        _drain_reports(supervisor)
+
         api.report_failed.assert_called_once_with(
             RUNNER_ID, "run-3", "(stdout) stdout error info"
         )
@@ -116,6 +131,8 @@ class TestOneshotExit:
 
         supervisor._check_runs()
 
+        _drain_reports(supervisor)
+
         api.report_failed.assert_called_once_with(
             RUNNER_ID, "run-4", "Process exited with code 137"
         )
@@ -131,9 +148,28 @@ class TestOneshotExit:
 
         assert registry.count() == 1
         supervisor._check_runs()
+        _drain_reports(supervisor)
         assert registry.count() == 0
         assert registry.get_session("sess-5") is None
 
+    def test_oneshot_stopping_skips_reporting(self):
+        """A one-shot being stopped by the poller is left for the poller to report."""
+        registry = ProcessRegistry()
+        api = _make_api_client()
+        supervisor = RunSupervisor(api, registry, RUNNER_ID, check_interval=0.1)
+
+        proc = _make_mock_process(poll_return=-15)
+        registry.register_session("sess-6", proc, "run-6", persistent=False)
+        registry.mark_stopping("sess-6")
+
+        supervisor._check_runs()
+
+        _drain_reports(supervisor)
+
+        api.report_failed.assert_not_called()
+        api.report_completed.assert_not_called()
+        assert registry.get_session("sess-6") is not None
+
 
 # ===========================================================================
 # TestPersistentExit
@@ -153,6 +189,8 @@ class TestPersistentExit:
 
         supervisor._check_runs()
 
+        _drain_reports(supervisor)
+
         api.report_failed.assert_called_once_with(
             RUNNER_ID, "run-p1", "crash: out of memory"
         )
@@ -170,6 +208,8 @@ class TestPersistentExit:
 
         supervisor._check_runs()
 
+        _drain_reports(supervisor)
+
         api.report_failed.assert_called_once_with(
             RUNNER_ID, "run-p1b", "Persistent process exited with code 9"
         )
@@ -187,6 +227,8 @@ class TestPersistentExit:
 
         supervisor._check_runs()
 
+        _drain_reports(supervisor)
+
         api.report_session_status.assert_called_once_with(
             RUNNER_ID, "sess-p2", "finished"
         )
@@ -204,6 +246,8 @@ class TestPersistentExit:
 
         supervisor._check_runs()
 
+        _drain_reports(supervisor)
+
         api.report_session_status.assert_called_once_with(
             RUNNER_ID, "sess-p3", "failed"
         )
@@ -220,6 +264,8 @@ class TestPersistentExit:
 
         supervisor._check_runs()
 
+        _drain_reports(supervisor)
+
         api.report_completed.assert_not_called()
         api.report_failed.assert_not_called()
         api.report_session_status.assert_not_called()
@@ -371,6 +417,8 @@ class TestStdoutReader:
 
         supervisor._check_runs()
 
+        _drain_reports(supervisor)
+
         # Should NOT report because run-s5 was already in _reported_runs
         api.report_failed.assert_not_called()
 
@@ -465,11 +513,13 @@ class TestProcessWithClosedPipes:
         supervisor = RunSupervisor(api, registry, RUNNER_ID, check_interval=0.1)
 
         proc = _make_mock_process(poll_return=0)
-        proc.stdout.closed = True
+        proc.stdout.close()
         registry.register_session("sess-c1", proc, "run-c1", persistent=False)
 
         supervisor._check_runs()
 
+        _drain_reports(supervisor)
+
         api.report_completed.assert_called_once_with(
             RUNNER_ID, "run-c1", session_status="finished"
         )
@@ -486,6 +536,8 @@ class TestProcessWithClosedPipes:
 
         supervisor._check_runs()
 
+        _drain_reports(supervisor)
+
         api.report_failed.assert_called_once_with(
             RUNNER_ID, "run-c2", "error detail"
         )
@@ -497,12 +549,273 @@ class TestProcessWithClosedPipes:
         supervisor = RunSupervisor(api, registry, RUNNER_ID, check_interval=0.1)
 
         proc = _make_mock_process(poll_return=1)
-        proc.stderr.closed = True
+        proc.stderr.close()
         registry.register_session("sess-c3", proc, "run-c3", persistent=True)
 
         supervisor._check_runs()
 
+        _drain_reports(supervisor)
+
         # Should use generic message since stderr is closed
         api.report_failed.assert_called_once_with(
             RUNNER_ID, "run-c3", "Persistent process exited with code 1"
         )
+
+    def test_pipe_held_open_does_not_block(self):
+        """Output is read without waiting for EOF (e.g. a grandchild holds the pipe)."""
+        registry = ProcessRegistry()
+        api = _make_api_client()
+        supervisor = RunSupervisor(api, registry, RUNNER_ID, check_interval=0.1)
+
+        read_fd, write_fd = os.pipe()
+        os.write(write_fd, b"partial error")
+        proc = _make_mock_process(poll_return=1)
+        proc.stderr = os.fdopen(read_fd, "r")
+        registry.register_session("sess-c4", proc, "run-c4", persistent=False)
+
+        try:
+            supervisor._check_runs()
+            _drain_reports(supervisor)
+        finally:
+            os.close(write_fd)
+
+        api.report_failed.assert_called_once_with(RUNNER_ID, "run-c4", "partial error")
+
+
+# ===========================================================================
+# TestReporterPool
+# ===========================================================================
+
+class TestReporterPool:
+    """Exit reports are sent off the supervision thread."""
+
+    def test_slow_report_does_not_block_check(self):
+        registry = ProcessRegistry()
+        api = _make_api_client()
+        release = threading.Event()
+        api.report_completed.side_effect = lambda *a, **k: release.wait(5)
+        supervisor = RunSupervisor(api, registry, RUNNER_ID)
+
+        registry.register_session("sess-p1", _make_mock_process(poll_return=0), "run-p1")
+        registry.register_session("sess-p2", _make_mock_process(poll_return=1, stderr_text="err"), "run-p2")
+
+        started = time.monotonic()
+        supervisor._check_runs()
+        assert time.monotonic() - started < 1.0
+        assert registry.count() == 0
+
+        release.set()
+        _drain_reports(supervisor)
+        api.report_completed.assert_called_once_with(RUNNER_ID, "run-p1", session_status="finished")
+        api.report_failed.assert_called_once_with(RUNNER_ID, "run-p2", "err")
+
+    def test_stop_waits_for_in_flight_reports(self):
+        registry = ProcessRegistry()
+        api = _make_api_client()
+        api.report_completed.side_effect = lambda *a, **k: time.sleep(0.2)
+        supervisor = RunSupervisor(api, registry, RUNNER_ID)
+
+        registry.register_session("sess-p3", _make_mock_process(poll_return=0), "run-p3")
+        supervisor._check_runs()
+        supervisor.stop()
+
+        api.report_completed.assert_called_once()
+
+    def test_restart_after_stop_can_report(self):
+        registry = ProcessRegistry()
+        api = _make_api_client()
+        supervisor = RunSupervisor(api, registry, RUNNER_ID)
+        supervisor.start()
+        supervisor.stop()
+        supervisor.start()
+        try:
+            registry.register_session("sess-p5", _make_mock_process(poll_return=0), "run-p5")
+            supervisor._check_runs()
+        finally:
+            supervisor.stop()
+
+        api.report_completed.assert_called_once_with(RUNNER_ID, "run-p5", session_status="finished")
+
+    def test_report_failure_is_logged(self, caplog):
+        registry = ProcessRegistry()
+        api = _make_api_client()
+        api.report_failed.side_effect = RuntimeError("coordinator down")
+        supervisor = RunSupervisor(api, registry, RUNNER_ID)
+
+        registry.register_session("sess-p4", _make_mock_process(poll_return=3), "run-p4")
+        supervisor._check_runs()
+        _drain_reports(supervisor)
+
+        assert "Failed to report failure for run-p4: coordinator down" in caplog.text
+
+
+# ===========================================================================
+# TestPollingLoop
+# ===========================================================================
+
+class TestPollingLoop:
+    """Tests for the fallback loop used where epoll is unavailable."""
+
+    def test_stop_does_not_wait_for_interval(self, monkeypatch):
+        import supervisor as supervisor_module
+        monkeypatch.delattr(supervisor_module.select, "epoll", raising=False)
+
+        supervisor = RunSupervisor(_make_api_client(), ProcessRegistry(), RUNNER_ID, check_interval=30)
+        supervisor.start()
+        time.sleep(0.05)
+
+        started = time.monotonic()
+        supervisor.stop()
+
+        assert time.monotonic() - started < 1.0
+
+
+# ===========================================================================
+# TestSupervisionLoop
+# ===========================================================================
+
+def _wait_until(predicate, timeout=10.0):
+    """Poll predicate until it is true or timeout passes."""
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+def _spawn(code):
+    """Start a Python child with piped text output."""
+    return subprocess.Popen(
+        [sys.executable, "-c", code],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+
+
+@pytest.mark.skipif(not hasattr(os, "pidfd_open"), reason="pidfd is Linux-only")
+class TestSupervisionLoop:
+    """Tests for the pidfd/epoll loop on real child processes."""
+
+    def test_exit_reported_without_waiting_for_interval(self):
+        """An exit wakes the loop immediately, not after check_interval."""
+        registry = ProcessRegistry()
+        api = _make_api_client()
+        supervisor = RunSupervisor(api, registry, RUNNER_ID, check_interval=60)
+        supervisor.start()
+        try:
+            proc = _spawn("import time; time.sleep(0.2)")
+            registry.register_session("sess-l1", proc, "run-l1")
+
+            assert _wait_until(lambda: api.report_completed.called, timeout=5)
+            api.report_completed.assert_called_once_with(
+                RUNNER_ID, "run-l1", session_status="finished"
+            )
+            assert registry.get_session("sess-l1") is None
+            assert supervisor._fds == {}
+        finally:
+            supervisor.stop()
+
+    def test_failure_reports_stderr(self):
+        registry = ProcessRegistry()
+        api = _make_api_client()
+        supervisor = RunSupervisor(api, registry, RUNNER_ID, check_interval=60)
+        supervisor.start()
+        try:
+            proc = _spawn("import sys; sys.stderr.write('boom'); sys.exit(2)")
+            registry.register_session("sess-l2", proc, "run-l2")
+
+            assert _wait_until(lambda: api.report_failed.called, timeout=5)
+            api.report_failed.assert_called_once_with(RUNNER_ID, "run-l2", "boom")
+        finally:
+            supervisor.stop()
+
+    def test_output_drained_while_running(self):
+        """Output larger than a pipe buffer does not block the executor."""
+        registry = ProcessRegistry()
+        api = _make_api_client()
+        supervisor = RunSupervisor(api, registry, RUNNER_ID, check_interval=60)
+        supervisor.start()
+        try:
+            proc = _spawn(
+                "import sys; sys.stdout.write('o' * 300000); sys.stderr.write('e' * 300000); sys.exit(1)"
+            )
+            registry.register_session("sess-l4", proc, "run-l4")
+
+            assert _wait_until(lambda: api.report_failed.called, timeout=5)
+            api.report_failed.assert_called_once_with(RUNNER_ID, "run-l4", "e" * 300000)
+        finally:
+            supervisor.stop()
+
+    def test_output_over_limit_is_marked_truncated(self, monkeypatch, caplog):
+        """Dropping the start of long output is logged and marked in the report."""
+        import supervisor as supervisor_module
+        monkeypatch.setattr(supervisor_module, "OUTPUT_CAPTURE_LIMIT", 1000)
+
+        registry = ProcessRegistry()
+        api = _make_api_client()
+        supervisor = RunSupervisor(api, registry, RUNNER_ID, check_interval=60)
+        supervisor.start()
+        try:
+            proc = _spawn("import sys; sys.stderr.write('a' * 500 + 'e' * 1000); sys.exit(1)")
+            registry.register_session("sess-l6", proc, "run-l6")
+
+            assert _wait_until(lambda: api.report_failed.called, timeout=5)
+            api.report_failed.assert_called_once_with(
+                RUNNER_ID, "run-l6", "[... 500 bytes of earlier stderr truncated ...]\n" + "e" * 1000
+            )
+            assert caplog.text.count("Output of session sess-l6 exceeded 1000 bytes") == 1
+        finally:
+            supervisor.stop()
+
+    def test_persistent_stdout_left_to_reader(self):
+        """Only stderr of a persistent process is drained by the loop."""
+        registry = ProcessRegistry()
+        api = _make_api_client()
+        supervisor = RunSupervisor(api, registry, RUNNER_ID, check_interval=60)
+        supervisor.start()
+        try:
+            proc = _spawn("import time; print('hello', flush=True); time.sleep(30)")
+            registry.register_session("sess-l5", proc, "run-l5", persistent=True)
+            assert _wait_until(lambda: "sess-l5" in supervisor._watched, timeout=5)
+
+            assert set(supervisor._watched["sess-l5"].output) == {"stderr"}
+            assert proc.stdout.readline() == "hello\n"
+        finally:
+            proc.kill()
+            proc.wait()
+            supervisor.stop()
+
+    def test_stopping_session_not_reported(self):
+        """Exits of sessions the poller is stopping are left to the poller."""
+        registry = ProcessRegistry()
+        api = _make_api_client()
+        supervisor = RunSupervisor(api, registry, RUNNER_ID, check_interval=60)
+        supervisor.start()
+        try:
+            proc = _spawn("import time; time.sleep(30)")
+            registry.register_session("sess-l3", proc, "run-l3")
+            assert _wait_until(lambda: "sess-l3" in supervisor._watched, timeout=5)
+
+            registry.mark_stopping("sess-l3")
+            proc.terminate()
+            proc.wait()
+            assert _wait_until(lambda: "sess-l3" not in supervisor._watched, timeout=5)
+
+            api.report_completed.assert_not_called()
+            api.report_failed.assert_not_called()
+            assert registry.get_session("sess-l3") is not None
+        finally:
+            supervisor.stop()
+
+    def test_stop_is_prompt(self):
+        """stop() wakes a loop blocked with no timeout."""
+        registry = ProcessRegistry()
+        supervisor = RunSupervisor(_make_api_client(), registry, RUNNER_ID, check_interval=60)
+        supervisor.start()
+        time.sleep(0.05)
+
+        started = time.monotonic()
+        supervisor.stop()
+
+        assert time.monotonic() - started < 1.0
+        assert registry.on_register is None